@@ -18,6 +18,8 @@ from .models import (
     LiveUpdate,
     TagMerge,
     SponsorMessage,
+    ReindexStats,
+    Job,
 )
 
 
@@ -315,6 +317,35 @@ class TagMergeAdmin(admin.ModelAdmin):
         return False
 
 
+@admin.register(ReindexStats)
+class ReindexStatsAdmin(admin.ModelAdmin):
+    list_display = ("day", "content_type", "written", "skipped", "skipped_percent")
+    list_filter = ("content_type",)
+    date_hierarchy = "day"
+
+    def skipped_percent(self, obj):
+        total = obj.written + obj.skipped
+        return "{:.0f}%".format(100 * obj.skipped / total) if total else "-"
+
+    skipped_percent.short_description = "Writes avoided"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "status", "attempts", "created", "run_after", "finished")
+    list_filter = ("status", "name")
+    readonly_fields = ("created", "started", "finished", "last_error")
+
+    def has_add_permission(self, request):
+        return False
+
+
 @admin.register(SponsorMessage)
 class SponsorMessageAdmin(admin.ModelAdmin):
     list_display = (
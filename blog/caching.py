@@ -0,0 +1,172 @@
+import hashlib
+import json
+import time
+
+from django.core.cache import cache, caches
+from django.utils.functional import cached_property
+
+from blog.pagination import EstimatedCountPaginator
+
+CONTENT_VERSION_KEY = "content-version"
+CONTENT_CACHE_TIMEOUT = 60 * 60
+
+
+def content_version():
+    """
+    Global version number for published content, bumped by blog/signals.py
+    whenever anything that could change a listing or facet count is saved.
+    Kept in the "shared" cache so a bump in one process reaches them all.
+    """
+    shared = caches["shared"]
+    version = shared.get(CONTENT_VERSION_KEY)
+    if version is None:
+        # From the clock, like bump_content_version(), so an evicted version
+        # can't be reused
+        shared.add(CONTENT_VERSION_KEY, time.time_ns(), None)
+        version = shared.get(CONTENT_VERSION_KEY)
+    return version
+
+
+def bump_content_version():
+    # Not incr(): that re-sets the key with the default five minute timeout
+    caches["shared"].set(CONTENT_VERSION_KEY, time.time_ns(), None)
+
+
+def content_cache_key(prefix, key):
+    digest = hashlib.md5(
+        json.dumps(key, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return "{}:{}:{}".format(prefix, content_version(), digest)
+
+
+def cached_for_content(prefix, key, fn):
+    """
+    Return fn(), cached until the content version changes. key is any
+    JSON-serializable description of the inputs, e.g. a filters dict.
+    """
+    cache_key = content_cache_key(prefix, key)
+    value = cache.get(cache_key)
+    if value is None:
+        value = fn()
+        cache.set(cache_key, value, CONTENT_CACHE_TIMEOUT)
+    return value
+
+
+def cached_snapshot(name, fn):
+    """
+    Return fn(), kept in the "shared" cache until the content version
+    changes - for precomputed pages such as the homepage's
+    """
+    shared = caches["shared"]
+    cache_key = "snapshot:{}:{}".format(name, content_version())
+    value = shared.get(cache_key)
+    if value is None:
+        value = fn()
+        shared.set(cache_key, value, CONTENT_CACHE_TIMEOUT)
+    return value
+
+
+FRAGMENT_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+FRAGMENT_STATS_KEY = "fragment-stats:{}:{}"
+
+
+def cached_fragment(name, version, source, fn):
+    """
+    Return fn(), cached under a hash of source - the key changes whenever
+    the input does, so nothing needs invalidating. Bump version when fn's
+    output for the same source changes. Counts hits and misses per name
+    for fragment_cache_stats().
+    """
+    digest = hashlib.md5(source.encode("utf-8")).hexdigest()
+    cache_key = "fragment:{}:{}:{}".format(name, version, digest)
+    value = cache.get(cache_key)
+    if value is None:
+        _count_fragment(name, "misses")
+        value = fn()
+        cache.set(cache_key, value, FRAGMENT_CACHE_TIMEOUT)
+    else:
+        _count_fragment(name, "hits")
+    return value
+
+
+def _count_fragment(name, outcome, n=1):
+    key = FRAGMENT_STATS_KEY.format(name, outcome)
+    if not cache.add(key, n, None):
+        try:
+            cache.incr(key, n)
+        except ValueError:
+            pass
+
+
+class ItemFragments:
+    """
+    Cached markup for each {type, obj} item of a blog_mixed_list, fetched
+    from the "fragments" cache with a single get_many(). Keys include the
+    content version, which blog/signals.py bumps on every save, delete and
+    tag change, so edited items are re-rendered and nothing else is.
+    flags is anything else the markup depends on, e.g. showdate.
+    """
+
+    name = "mixed-item"
+
+    def __init__(self, items, flags):
+        self.cache = caches["fragments"]
+        version = content_version()
+        self.keys = {}
+        for item in items:
+            pk = getattr(item["obj"], "pk", None)
+            if pk is not None:
+                self.keys[item["type"], pk] = "item:{}:{}:{}:{}".format(
+                    version, item["type"], pk, flags
+                )
+        self.fragments = self.cache.get_many(self.keys.values()) if self.keys else {}
+        if self.fragments:
+            _count_fragment(self.name, "hits", len(self.fragments))
+
+    def get(self, item, render):
+        "The cached markup for item, or render() - cached for next time"
+        key = self.keys.get((item["type"], getattr(item["obj"], "pk", None)))
+        if key is None:
+            return render()
+        value = self.fragments.get(key)
+        if value is None:
+            _count_fragment(self.name, "misses")
+            value = self.fragments[key] = render()
+            self.cache.set(key, value, CONTENT_CACHE_TIMEOUT)
+        return value
+
+
+def fragment_cache_stats(names):
+    "{name: {'hits': n, 'misses': n, 'hit_rate': percent or None}} for names"
+    keys = {
+        (name, outcome): FRAGMENT_STATS_KEY.format(name, outcome)
+        for name in names
+        for outcome in ("hits", "misses")
+    }
+    counts = cache.get_many(keys.values())
+    stats = {}
+    for name in names:
+        hits = counts.get(keys[name, "hits"], 0)
+        misses = counts.get(keys[name, "misses"], 0)
+        stats[name] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(100 * hits / (hits + misses)) if hits + misses else None,
+        }
+    return stats
+
+
+class CachedCountPaginator(EstimatedCountPaginator):
+    "Paginator that caches its (possibly estimated) count against the content version"
+
+    def __init__(self, object_list, per_page, cache_key, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.cache_key = cache_key
+
+    @cached_property
+    def counted(self):
+        return cached_for_content(
+            "paginator-count",
+            self.cache_key,
+            lambda: EstimatedCountPaginator.counted.func(self),
+        )
@@ -0,0 +1,60 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connection, connections
+from django.db.models.query import QuerySet
+
+_executor = None
+_executor_key = None
+
+
+def _get_executor():
+    global _executor, _executor_key
+    # Threads don't survive a fork, so each gunicorn worker gets its own pool
+    key = (os.getpid(), settings.PARALLEL_QUERY_THREADS)
+    if _executor is None or _executor_key != key:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.PARALLEL_QUERY_THREADS,
+            thread_name_prefix="parallel-queries",
+        )
+        _executor_key = key
+    return _executor
+
+
+def _evaluate(task):
+    if isinstance(task, QuerySet):
+        return list(task)
+    return task()
+
+
+def _run_in_thread(task):
+    try:
+        return _evaluate(task)
+    finally:
+        # Treat each task like a request: connections are kept between tasks
+        # only if CONN_MAX_AGE allows it, and never left in a transaction
+        for conn in connections.all(initialized_only=True):
+            if conn.connection is not None and not conn.get_autocommit():
+                conn.rollback()
+        close_old_connections()
+
+
+def run_in_parallel(*tasks):
+    """
+    Evaluate independent querysets (or zero-argument callables that run
+    queries) concurrently on a bounded thread pool, returning their results
+    in the order given. QuerySets are returned as lists.
+
+    Runs everything serially if PARALLEL_QUERY_THREADS is 0, or inside an
+    atomic block - other connections can't see uncommitted rows.
+    """
+    if (
+        len(tasks) < 2
+        or not settings.PARALLEL_QUERY_THREADS
+        or connection.in_atomic_block
+    ):
+        return [_evaluate(task) for task in tasks]
+    executor = _get_executor()
+    futures = [executor.submit(_run_in_thread, task) for task in tasks]
+    return [future.result() for future in futures]
@@ -0,0 +1,168 @@
+"""
+A small job queue kept in the blog_job table, for work that shouldn't hold
+up a web request: Cloudflare purges, search reindexing and the like.
+
+    @job("purge_cloudflare_cache")
+    def purge_cloudflare_cache():
+        ...
+
+    enqueue("purge_cloudflare_cache")
+
+Workers ("manage.py run_jobs") claim jobs with SELECT ... FOR UPDATE SKIP
+LOCKED, so any number can run against the same database. Failed jobs are
+retried with exponential backoff. If settings.BACKGROUND_JOBS is off,
+enqueue() runs the job as soon as the current transaction commits.
+"""
+
+import datetime
+import logging
+import traceback
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from blog.models import Job
+
+logger = logging.getLogger(__name__)
+
+# Jobs marked running for longer than this are assumed to have lost their
+# worker and are claimed again
+STALE_AFTER = datetime.timedelta(minutes=15)
+MAX_BACKOFF = datetime.timedelta(hours=1)
+
+registry = {}
+
+# Returned by enqueue() when a job with the same key is already queued
+ALREADY_QUEUED = object()
+
+
+def job(name):
+    "Register a function that enqueue(name, **kwargs) can run later"
+
+    def register(fn):
+        registry[name] = fn
+        return fn
+
+    return register
+
+
+def enqueue(name, key="", delay=None, **kwargs):
+    """
+    Queue registered job name to be called with kwargs, which must be JSON
+    serializable. Returns the Job, ALREADY_QUEUED if a job with the same
+    non-empty key is already queued, or None if it was run inline.
+    """
+    if name not in registry:
+        raise KeyError("No job registered as {!r}".format(name))
+    if not settings.BACKGROUND_JOBS:
+        transaction.on_commit(lambda: registry[name](**kwargs))
+        return None
+    job = Job(name=name, key=key, kwargs=kwargs)
+    if delay:
+        job.run_after = timezone.now() + delay
+    try:
+        with transaction.atomic():
+            job.save()
+    except IntegrityError:
+        if not key:
+            raise
+        return ALREADY_QUEUED
+    return job
+
+
+def claim():
+    "Mark the next runnable job as running and return it, or None"
+    now = timezone.now()
+    with transaction.atomic():
+        job = (
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=Job.Status.QUEUED, run_after__lte=now)
+                | Q(status=Job.Status.RUNNING, started__lt=now - STALE_AFTER)
+            )
+            .order_by("run_after", "id")
+            .first()
+        )
+        if job is None:
+            return None
+        job.status = Job.Status.RUNNING
+        job.started = now
+        job.attempts += 1
+        job.save(update_fields=["status", "started", "attempts"])
+    return job
+
+
+def backoff(attempts):
+    return min(datetime.timedelta(seconds=10 * 2 ** (attempts - 1)), MAX_BACKOFF)
+
+
+def run(job):
+    try:
+        registry[job.name](**job.kwargs)
+    except Exception:
+        job.last_error = traceback.format_exc()
+        if job.attempts < job.max_attempts:
+            job.status = Job.Status.QUEUED
+            job.run_after = timezone.now() + backoff(job.attempts)
+        else:
+            job.status = Job.Status.FAILED
+            job.finished = timezone.now()
+        logger.exception("Job %s failed", job)
+    else:
+        job.status = Job.Status.DONE
+        job.finished = timezone.now()
+        job.last_error = ""
+    fields = ["status", "run_after", "finished", "last_error"]
+    try:
+        with transaction.atomic():
+            job.save(update_fields=fields)
+    except IntegrityError:
+        # Requeueing a retry clashed with a job of the same key queued while
+        # this one ran - that one will do the work instead
+        job.status = Job.Status.FAILED
+        job.finished = timezone.now()
+        job.last_error += "\nNot retried: a job with the same key is queued\n"
+        job.save(update_fields=fields)
+    return job
+
+
+def run_pending(limit=None):
+    "Run runnable jobs until there are none left (or limit), returning the count"
+    count = 0
+    while limit is None or count < limit:
+        job = claim()
+        if job is None:
+            break
+        run(job)
+        count += 1
+    return count
+
+
+def delete_finished(older_than=datetime.timedelta(days=7)):
+    return Job.objects.filter(
+        status=Job.Status.DONE, finished__lt=timezone.now() - older_than
+    ).delete()[0]
+
+
+@job("purge_cloudflare_cache")
+def purge_cloudflare_cache():
+    from blog.views import _purge_cloudflare_cache
+
+    _purge_cloudflare_cache()
+
+
+@job("update_search_documents")
+def update_search_documents(label, pks):
+    from django.apps import apps
+
+    from blog.caching import bump_content_version
+    from blog.reindex import refresh_content_items
+    from blog.signals import update_search_documents
+
+    model = apps.get_model(label)
+    written = update_search_documents(model, list(model.objects.filter(pk__in=pks)))
+    if written:
+        refresh_content_items(model, written)
+        bump_content_version()
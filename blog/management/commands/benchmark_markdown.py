@@ -0,0 +1,69 @@
+import time
+
+from django.core.management.base import BaseCommand
+from markdown import markdown
+
+from blog.models import Note
+from blog.rendering import PROFILES, render_markdown
+from guides.models import Chapter
+
+
+class Command(BaseCommand):
+    help = "Compare markdown.markdown() with render_markdown() on notes and chapters"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=3)
+        parser.add_argument(
+            "--limit", type=int, default=200, help="Bodies of each type to render"
+        )
+
+    def handle(self, *args, **options):
+        samples = (
+            (
+                "notes",
+                "default",
+                Note.objects.exclude(body="").values_list("body", flat=True)[
+                    : options["limit"]
+                ],
+            ),
+            (
+                "chapters",
+                "chapter",
+                Chapter.objects.exclude(body="").values_list("body", flat=True)[
+                    : options["limit"]
+                ],
+            ),
+            # Per-call overhead alone, without much document to convert
+            ("one-liners", "default", ["Hello *world*"] * options["limit"]),
+            ("chapter one-liners", "chapter", ["Hello *world*"] * options["limit"]),
+        )
+        for label, profile, bodies in samples:
+            bodies = list(bodies)
+            if not bodies:
+                self.stdout.write("{}: nothing to render".format(label))
+                continue
+            render_markdown(bodies[0], profile)  # Build this thread's renderer
+            timings = {}
+            for name, fn in (
+                ("markdown()", lambda body: markdown(body, **PROFILES[profile])),
+                ("render_markdown()", lambda body: render_markdown(body, profile)),
+            ):
+                start = time.perf_counter()
+                for _ in range(options["iterations"]):
+                    for body in bodies:
+                        fn(body)
+                timings[name] = (
+                    (time.perf_counter() - start)
+                    / (options["iterations"] * len(bodies))
+                    * 1000000
+                )
+            self.stdout.write(
+                "{}: {} bodies, markdown() {:.0f}us per call, "
+                "render_markdown() {:.0f}us per call ({:.2f}x)".format(
+                    label,
+                    len(bodies),
+                    timings["markdown()"],
+                    timings["render_markdown()"],
+                    timings["markdown()"] / timings["render_markdown()"],
+                )
+            )
@@ -0,0 +1,58 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory, override_settings
+
+from blog.models import ContentItem
+from blog.templatetags.blog_calendar import calendar_context
+from blog.views import MONTHS_3_REV_REV, archive_day
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare serial and run_in_parallel() timings for the day archive and calendar"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=6,
+            help="PARALLEL_QUERY_THREADS to use for the parallel run",
+        )
+
+    def handle(self, *args, **options):
+        latest = ContentItem.objects.listed().order_by("-created").first()
+        if latest is None:
+            self.stderr.write("No published content to benchmark against")
+            return
+        date = latest.created.date()
+        request = RequestFactory().get("/")
+        month = MONTHS_3_REV_REV[date.month].title()
+
+        def day():
+            archive_day(request, str(date.year), month, str(date.day))
+
+        def calendar():
+            calendar_context(date.replace(day=1))
+
+        for label, fn in (("archive_day", day), ("calendar_context", calendar)):
+            timings = {}
+            for threads in (0, options["threads"]):
+                with override_settings(PARALLEL_QUERY_THREADS=threads):
+                    fn()  # Warm up connections and caches
+                    start = time.perf_counter()
+                    for _ in range(options["iterations"]):
+                        fn()
+                    timings[threads] = (
+                        (time.perf_counter() - start) / options["iterations"] * 1000
+                    )
+            self.stdout.write(
+                "{}: serial {:.1f}ms, {} threads {:.1f}ms".format(
+                    label,
+                    timings[0],
+                    options["threads"],
+                    timings[options["threads"]],
+                )
+            )
@@ -0,0 +1,85 @@
+import os
+import time
+from xml.etree import ElementTree
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from blog.management.commands.import_blog_xml import iter_rows
+from blog.templatetags.entry_tags import (
+    XHTML_PIPELINES,
+    first_paragraph,
+    remove_context_paragraph,
+    resize_images_to_fit_width,
+    split_cutoff,
+    typography,
+    xhtml,
+    xhtml2html,
+)
+
+# The template filter chains each entry of XHTML_PIPELINES replaces
+FILTER_CHAINS = {
+    "summary": lambda body: xhtml2html(
+        typography(first_paragraph(remove_context_paragraph(xhtml(split_cutoff(body)))))
+    ),
+    "body": lambda body: xhtml2html(
+        typography(resize_images_to_fit_width(xhtml(body), "450"))
+    ),
+    "card": lambda body: xhtml2html(typography(remove_context_paragraph(xhtml(body)))),
+}
+
+
+class Command(BaseCommand):
+    help = "Compare XhtmlPipeline with the equivalent filter chains on real entries"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--xmldir",
+            default=os.path.join(settings.BASE_DIR, "old-import-xml"),
+            help="Directory containing blog_entry.xml",
+        )
+        parser.add_argument("--iterations", type=int, default=3)
+        parser.add_argument("--limit", type=int, help="Only the first N entries")
+
+    def handle(self, *args, **options):
+        bodies = [
+            row["body"]
+            for row in iter_rows(os.path.join(options["xmldir"], "blog_entry.xml"))
+            if row["body"]
+        ][: options["limit"]]
+        for name, pipeline in XHTML_PIPELINES.items():
+            chain = FILTER_CHAINS[name]
+            usable = []
+            mismatches = 0
+            for body in bodies:
+                try:
+                    expected = str(chain(body))
+                except ElementTree.ParseError:
+                    continue
+                usable.append(body)
+                if pipeline(body) != expected:
+                    mismatches += 1
+            timings = {}
+            for label, fn in (("chain", chain), ("pipeline", pipeline)):
+                start = time.perf_counter()
+                for _ in range(options["iterations"]):
+                    for body in usable:
+                        str(fn(body))
+                timings[label] = (
+                    (time.perf_counter() - start) / options["iterations"] * 1000
+                )
+            self.stdout.write(
+                "{}: {} bodies, filter chain {:.1f}ms, pipeline {:.1f}ms "
+                "({:.2f}x), {} mismatches".format(
+                    name,
+                    len(usable),
+                    timings["chain"],
+                    timings["pipeline"],
+                    (
+                        timings["chain"] / timings["pipeline"]
+                        if timings["pipeline"]
+                        else 0
+                    ),
+                    mismatches,
+                )
+            )
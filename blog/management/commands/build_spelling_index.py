@@ -0,0 +1,73 @@
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.html import strip_tags
+
+from blog.models import (
+    Beat,
+    Blogmark,
+    Entry,
+    Note,
+    Quotation,
+    StoredSpellingIndex,
+    Tag,
+)
+from blog.spelling import build_index, words_in
+from guides.models import Chapter
+
+# The same text each model feeds into its search_document
+TEXT_FIELDS = (
+    (Entry, ("title", "body")),
+    (Blogmark, ("link_title", "commentary", "via_title")),
+    (Quotation, ("quotation", "source")),
+    (Note, ("body",)),
+    (Beat, ("title", "commentary", "note")),
+    (Chapter, ("title", "body")),
+)
+
+
+class Command(BaseCommand):
+    help = "Build the memory-mapped spelling suggestion index used by search"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            default=settings.SPELLING_INDEX_PATH,
+            help="Where to write the index",
+        )
+        parser.add_argument(
+            "--min-count",
+            type=int,
+            default=2,
+            help="Ignore words used fewer times than this (tag words are always kept)",
+        )
+
+    def handle(self, *args, **options):
+        counts = Counter()
+        for model, fields in TEXT_FIELDS:
+            for row in (
+                model.objects.filter(is_draft=False).values_list(*fields).iterator()
+            ):
+                for text in row:
+                    if text:
+                        counts.update(words_in(strip_tags(text)))
+        vocabulary = {
+            word: count
+            for word, count in counts.items()
+            if count >= options["min_count"]
+        }
+        for tag in Tag.objects.values_list("tag", flat=True):
+            for word in words_in(tag.replace("-", " ")):
+                vocabulary[word] = max(vocabulary.get(word, 0), counts[word], 1)
+        num_records = build_index(vocabulary, options["path"])
+        # For fetch_spelling_index on the web dynos
+        with open(options["path"], "rb") as fp:
+            StoredSpellingIndex.objects.update_or_create(
+                pk=1, defaults={"data": fp.read()}
+            )
+        self.stdout.write(
+            "Indexed {} words as {} records in {}".format(
+                len(vocabulary), num_records, options["path"]
+            )
+        )
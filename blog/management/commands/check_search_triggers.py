@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.reindex import content_models
+from blog.triggers import search_triggers_enabled, trigger_mismatches
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the search_document built by the database triggers with "
+        "the one built in Python from index_components()"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=0,
+            help="Only check this many of the most recent rows of each type",
+        )
+
+    def handle(self, *args, **options):
+        enabled = search_triggers_enabled()
+        if not enabled:
+            raise CommandError("Search triggers are not installed - run migrate")
+        state = "enabled" if all(enabled.values()) else "disabled"
+        if any(enabled.values()) and not all(enabled.values()):
+            state = "partially enabled"
+        self.stdout.write(
+            "Triggers are {} (SEARCH_DOCUMENT_TRIGGERS={})".format(
+                state, settings.SEARCH_DOCUMENT_TRIGGERS
+            )
+        )
+        total = 0
+        for model in content_models():
+            mismatches = list(trigger_mismatches(model, limit=options["limit"]))
+            total += len(mismatches)
+            self.stdout.write(
+                "{}: {} mismatch{}".format(
+                    model._meta.label,
+                    len(mismatches),
+                    "" if len(mismatches) == 1 else "es",
+                )
+            )
+            for pk, python_document, trigger_document in mismatches[:5]:
+                self.stdout.write("  {} python:  {}".format(pk, python_document))
+                self.stdout.write("  {} trigger: {}".format(pk, trigger_document))
+        if total:
+            raise CommandError("{} documents differ".format(total))
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.models import StoredSpellingIndex
+from blog.spelling import install_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the spelling index stored by build_spelling_index to disk, "
+        "run before the web process starts"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            default=settings.SPELLING_INDEX_PATH,
+            help="Where to write the index",
+        )
+
+    def handle(self, *args, **options):
+        stored = StoredSpellingIndex.objects.first()
+        if stored is None:
+            raise CommandError(
+                "No spelling index stored yet - run manage.py build_spelling_index"
+            )
+        install_index(bytes(stored.data), options["path"])
+        self.stdout.write(
+            "Wrote the spelling index built {} to {}".format(
+                stored.built, options["path"]
+            )
+        )
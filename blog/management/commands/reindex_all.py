@@ -1,15 +1,92 @@
-from django.core.management.base import BaseCommand
-from blog.models import Entry, Blogmark, Quotation
+import datetime
+import os
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from blog import reindex
 
 
 class Command(BaseCommand):
-    help = "Re-indexes all entries, blogmarks, quotations"
-
-    def handle(self, *args, **kwargs):
-        for klass in (Entry, Blogmark, Quotation):
-            i = 0
-            for obj in klass.objects.prefetch_related("tags").all():
-                obj.save()
-                i += 1
-                if i % 100 == 0:
-                    print(klass, i)
+    help = "Re-indexes the search documents of every content type"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            help="Only these models, e.g. blog.Entry guides.Chapter",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=min(4, os.cpu_count() or 1),
+            help="Number of processes to spread the partitions across",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Primary key range reindexed by each UPDATE",
+        )
+        parser.add_argument(
+            "--since",
+            type=datetime.date.fromisoformat,
+            help="Only items created on or after this YYYY-MM-DD date",
+        )
+        parser.add_argument(
+            "--progress-file",
+            default="reindex-progress.json",
+            help="Where completed partitions are recorded",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rewrite rows even if their search_document_hash is current",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip partitions recorded in --progress-file by an earlier run",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            models = [apps.get_model(label) for label in options["models"]]
+        except (LookupError, ValueError) as e:
+            raise CommandError(e)
+        content_models = reindex.content_models()
+        for model in models:
+            if model not in content_models:
+                raise CommandError("{} is not a content model".format(model))
+        since = None
+        if options["since"]:
+            since = timezone.make_aware(
+                datetime.datetime.combine(options["since"], datetime.time.min)
+            )
+        progress = reindex.Progress(options["progress_file"], since)
+        if options["resume"]:
+            try:
+                progress.load()
+            except ValueError as e:
+                raise CommandError(e)
+
+        def report(label, start, end, count, done, total):
+            self.stdout.write(
+                "[{}/{}] {} {}-{}: {} rows written".format(
+                    done, total, label, start, end - 1, count
+                )
+            )
+
+        total = reindex.reindex(
+            models=models,
+            workers=options["workers"],
+            batch_size=options["batch_size"],
+            since=since,
+            progress=progress,
+            report=report,
+            force=options["force"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS("Rewrote {} search documents".format(total))
+        )
@@ -0,0 +1,67 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.caching import bump_content_version
+from blog.models import BaseModel
+from blog.reindex import content_models, refresh_content_items
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-renders the stored HTML and computed columns of rows rendered by an "
+        "older RENDER_VERSION"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            help="Only these models, e.g. blog.Entry blog.Note",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows loaded and written per bulk_update()",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-render every row, even those at the current RENDER_VERSION",
+        )
+
+    def handle(self, *args, **options):
+        rendered_models = [
+            model for model in content_models() if model.render is not BaseModel.render
+        ]
+        try:
+            models = [apps.get_model(label) for label in options["models"]]
+        except (LookupError, ValueError) as e:
+            raise CommandError(e)
+        for model in models:
+            if model not in rendered_models:
+                raise CommandError("{} does not store rendered HTML".format(model))
+        batch_size = options["batch_size"]
+        total = 0
+        for model in models or rendered_models:
+            qs = model.objects.all()
+            if not options["force"]:
+                # Including rows whose XHTML failed to render at this version
+                qs = qs.exclude(
+                    render_version__in=[model.RENDER_VERSION, -model.RENDER_VERSION]
+                )
+            pks = list(qs.order_by("pk").values_list("pk", flat=True))
+            for i in range(0, len(pks), batch_size):
+                objs = list(model.objects.filter(pk__in=pks[i : i + batch_size]))
+                for obj in objs:
+                    obj.update_rendered()
+                model.objects.bulk_update(objs, model.RENDERED_FIELDS)
+                # ContentItem copies word_count and domain for search
+                refresh_content_items(model, [obj.pk for obj in objs])
+            self.stdout.write(
+                "{}: {} rows re-rendered".format(model._meta.label, len(pks))
+            )
+            total += len(pks)
+        if total:
+            bump_content_version()
+        self.stdout.write(self.style.SUCCESS("Re-rendered {} rows".format(total)))
@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from blog import jobs
+
+
+class Command(BaseCommand):
+    help = "Runs queued background jobs from blog_job, polling for new ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run whatever is runnable now, then exit",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait between polls when the queue is empty",
+        )
+
+    def handle(self, *args, **options):
+        if options["once"]:
+            count = jobs.run_pending()
+            self.stdout.write("Ran {} job{}".format(count, "" if count == 1 else "s"))
+            return
+        last_cleanup = 0
+        while True:
+            close_old_connections()
+            if not jobs.run_pending(limit=100):
+                if time.monotonic() - last_cleanup > 3600:
+                    jobs.delete_finished()
+                    last_cleanup = time.monotonic()
+                time.sleep(options["interval"])
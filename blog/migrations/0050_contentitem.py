@@ -0,0 +1,108 @@
+# Generated by Django 6.1 on 2026-10-17 01:17
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+TAG_IDS_SQL = """coalesce(
+    (select array_agg(tag_id order by tag_id) from {through} where {column} = t.id),
+    '{{}}'
+)"""
+
+BACKFILL_SQL = """
+insert into blog_contentitem (
+    content_type, object_id, created, is_draft, is_unlisted, beat_type,
+    search_document, tag_ids
+)
+select 'entry', t.id, t.created, t.is_draft, false, '', t.search_document, {entry}
+from blog_entry t
+union all
+select 'blogmark', t.id, t.created, t.is_draft, false, '', t.search_document, {blogmark}
+from blog_blogmark t
+union all
+select 'quotation', t.id, t.created, t.is_draft, false, '', t.search_document, {quotation}
+from blog_quotation t
+union all
+select 'note', t.id, t.created, t.is_draft, false, '', t.search_document, {note}
+from blog_note t
+union all
+select 'beat', t.id, t.created, t.is_draft, false, t.beat_type, t.search_document, {beat}
+from blog_beat t
+union all
+select
+    'chapter', t.id, t.created, t.is_draft or g.is_draft, t.is_unlisted, '',
+    t.search_document, {chapter}
+from guides_chapter t join guides_guide g on g.id = t.guide_id
+""".format(
+    entry=TAG_IDS_SQL.format(through="blog_entry_tags", column="entry_id"),
+    blogmark=TAG_IDS_SQL.format(through="blog_blogmark_tags", column="blogmark_id"),
+    quotation=TAG_IDS_SQL.format(through="blog_quotation_tags", column="quotation_id"),
+    note=TAG_IDS_SQL.format(through="blog_note_tags", column="note_id"),
+    beat=TAG_IDS_SQL.format(through="blog_beat_tags", column="beat_id"),
+    chapter=TAG_IDS_SQL.format(through="guides_chapter_tags", column="chapter_id"),
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0049_add_comment_beat_type"),
+        ("guides", "0003_chapter_is_unlisted"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContentItem",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("content_type", models.CharField(max_length=16)),
+                ("object_id", models.IntegerField()),
+                ("created", models.DateTimeField()),
+                ("is_draft", models.BooleanField(default=False)),
+                ("is_unlisted", models.BooleanField(default=False)),
+                ("beat_type", models.CharField(blank=True, default="", max_length=20)),
+                (
+                    "search_document",
+                    django.contrib.postgres.search.SearchVectorField(null=True),
+                ),
+                (
+                    "tag_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.IntegerField(), blank=True, default=list
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["search_document"],
+                        name="blog_conten_search__7f2552_gin",
+                    ),
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["tag_ids"], name="blog_conten_tag_ids_620280_gin"
+                    ),
+                    models.Index(
+                        condition=models.Q(("is_draft", False), ("is_unlisted", False)),
+                        fields=["-created"],
+                        name="blog_contentitem_listed_idx",
+                    ),
+                    models.Index(
+                        condition=models.Q(("is_draft", False)),
+                        fields=["content_type", "-created"],
+                        name="blog_contentitem_type_idx",
+                    ),
+                ],
+                "unique_together": {("content_type", "object_id")},
+            },
+        ),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
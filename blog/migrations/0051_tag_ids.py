@@ -0,0 +1,116 @@
+# Generated by Django 6.1 on 2026-10-17 02:12
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+BACKFILL_SQL_TEMPLATE = """
+update {table} set tag_ids = t.tag_ids
+from (
+    select {fk}_id, array_agg(tag_id order by tag_id) as tag_ids
+    from {table}_tags group by {fk}_id
+) t
+where t.{fk}_id = {table}.id
+"""
+
+TABLES = (
+    ("blog_entry", "entry"),
+    ("blog_blogmark", "blogmark"),
+    ("blog_quotation", "quotation"),
+    ("blog_note", "note"),
+    ("blog_beat", "beat"),
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0050_contentitem"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="beat",
+            name="tag_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.IntegerField(),
+                blank=True,
+                default=list,
+                editable=False,
+            ),
+        ),
+        migrations.AddField(
+            model_name="blogmark",
+            name="tag_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.IntegerField(),
+                blank=True,
+                default=list,
+                editable=False,
+            ),
+        ),
+        migrations.AddField(
+            model_name="entry",
+            name="tag_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.IntegerField(),
+                blank=True,
+                default=list,
+                editable=False,
+            ),
+        ),
+        migrations.AddField(
+            model_name="note",
+            name="tag_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.IntegerField(),
+                blank=True,
+                default=list,
+                editable=False,
+            ),
+        ),
+        migrations.AddField(
+            model_name="quotation",
+            name="tag_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.IntegerField(),
+                blank=True,
+                default=list,
+                editable=False,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="beat",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["tag_ids"], name="blog_beat_tag_ids_391064_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="blogmark",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["tag_ids"], name="blog_blogma_tag_ids_b248e0_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["tag_ids"], name="blog_entry_tag_ids_653c19_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="note",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["tag_ids"], name="blog_note_tag_ids_a59e88_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="quotation",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["tag_ids"], name="blog_quotat_tag_ids_f79175_gin"
+            ),
+        ),
+        migrations.RunSQL(
+            [BACKFILL_SQL_TEMPLATE.format(table=table, fk=fk) for table, fk in TABLES],
+            migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,180 @@
+from django.db import migrations
+
+# Mirrors each model's index_components(). The triggers are created
+# disabled - blog.triggers.set_search_triggers() switches them on when
+# settings.SEARCH_DOCUMENT_TRIGGERS is set.
+TAGS_SQL = """
+coalesce((
+    select string_agg(blog_tag.tag, ' ' order by through.id)
+    from {table}_tags through join blog_tag on blog_tag.id = through.tag_id
+    where through.{fk}_id = r.id
+), '')
+"""
+
+TABLES = (
+    (
+        "blog_entry",
+        "entry",
+        [
+            ("A", "r.title"),
+            ("C", "regexp_replace(r.body, '<[^>]*>', '', 'g')"),
+            ("B", None),
+        ],
+    ),
+    (
+        "blog_blogmark",
+        "blogmark",
+        [
+            ("A", "r.link_title"),
+            ("B", None),
+            (
+                "C",
+                "r.commentary || ' ' || split_part(r.link_url, '/', 3) || ' ' "
+                "|| coalesce(r.via_title, '')",
+            ),
+        ],
+    ),
+    (
+        "blog_quotation",
+        "quotation",
+        [("A", "r.quotation"), ("B", None), ("C", "r.source")],
+    ),
+    ("blog_note", "note", [("C", "r.body"), ("B", None)]),
+    (
+        "blog_beat",
+        "beat",
+        [
+            ("A", "r.title"),
+            ("B", None),
+            ("C", "concat_ws(' ', nullif(r.commentary, ''), nullif(r.note, ''))"),
+        ],
+    ),
+    (
+        "guides_chapter",
+        "chapter",
+        [("A", "r.title"), ("C", "r.body"), ("B", None)],
+    ),
+)
+
+CREATE_SQL_TEMPLATE = """
+create function {table}_search_document(r {table}) returns tsvector
+language sql stable as $$
+    select {document}
+$$;
+
+create function {table}_search_document_trigger() returns trigger
+language plpgsql as $$
+begin
+    NEW.search_document := {table}_search_document(NEW);
+    return NEW;
+end
+$$;
+
+create trigger {table}_search_document
+before insert or update on {table}
+for each row execute function {table}_search_document_trigger();
+
+create function {table}_contentitem_trigger() returns trigger
+language plpgsql as $$
+begin
+    update blog_contentitem set search_document = NEW.search_document
+    where content_type = '{fk}' and object_id = NEW.id;
+    return null;
+end
+$$;
+
+create trigger {table}_contentitem
+after update on {table}
+for each row when (OLD.search_document is distinct from NEW.search_document)
+execute function {table}_contentitem_trigger();
+
+create function {table}_tags_trigger() returns trigger
+language plpgsql as $$
+begin
+    -- The before update trigger on {table} then rebuilds search_document
+    update {table} set tag_ids = coalesce((
+        select array_agg(tag_id order by tag_id) from {table}_tags
+        where {fk}_id = {table}.id
+    ), '{{}}')
+    where id = coalesce(NEW.{fk}_id, OLD.{fk}_id);
+    return null;
+end
+$$;
+
+create trigger {table}_tags_search_document
+after insert or update or delete on {table}_tags
+for each row execute function {table}_tags_trigger();
+
+alter table {table} disable trigger {table}_search_document;
+alter table {table} disable trigger {table}_contentitem;
+alter table {table}_tags disable trigger {table}_tags_search_document;
+"""
+
+DROP_SQL_TEMPLATE = """
+drop trigger {table}_tags_search_document on {table}_tags;
+drop function {table}_tags_trigger();
+drop trigger {table}_contentitem on {table};
+drop function {table}_contentitem_trigger();
+drop trigger {table}_search_document on {table};
+drop function {table}_search_document_trigger();
+drop function {table}_search_document({table});
+"""
+
+TAG_RENAME_SQL = """
+create function blog_tag_search_document_trigger() returns trigger
+language plpgsql as $$
+begin
+{updates}
+    return null;
+end
+$$;
+
+create trigger blog_tag_search_document
+after update of tag on blog_tag
+for each row when (OLD.tag is distinct from NEW.tag)
+execute function blog_tag_search_document_trigger();
+
+alter table blog_tag disable trigger blog_tag_search_document;
+"""
+
+TAG_RENAME_UPDATE_TEMPLATE = """
+    update {table} set tag_ids = tag_ids where tag_ids @> array[NEW.id];"""
+
+
+def document_sql(table, fk, components):
+    return " || ".join(
+        "setweight(to_tsvector(coalesce({}, '')), '{}')".format(
+            expression or TAGS_SQL.format(table=table, fk=fk).strip(), weight
+        )
+        for weight, expression in components
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0051_tag_ids"),
+        ("guides", "0004_chapter_tag_ids"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            [
+                CREATE_SQL_TEMPLATE.format(
+                    table=table, fk=fk, document=document_sql(table, fk, components)
+                )
+                for table, fk, components in TABLES
+            ],
+            [DROP_SQL_TEMPLATE.format(table=table) for table, _, _ in reversed(TABLES)],
+        ),
+        migrations.RunSQL(
+            TAG_RENAME_SQL.format(
+                updates="".join(
+                    TAG_RENAME_UPDATE_TEMPLATE.format(table=table)
+                    for table, _, _ in TABLES
+                )
+            ),
+            "drop trigger blog_tag_search_document on blog_tag;\n"
+            "drop function blog_tag_search_document_trigger();",
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 6.1 on 2026-10-17 02:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0052_search_document_triggers"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="beat",
+            name="search_document_hash",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=32
+            ),
+        ),
+        migrations.AddField(
+            model_name="blogmark",
+            name="search_document_hash",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=32
+            ),
+        ),
+        migrations.AddField(
+            model_name="entry",
+            name="search_document_hash",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=32
+            ),
+        ),
+        migrations.AddField(
+            model_name="note",
+            name="search_document_hash",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=32
+            ),
+        ),
+        migrations.AddField(
+            model_name="quotation",
+            name="search_document_hash",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=32
+            ),
+        ),
+        migrations.CreateModel(
+            name="ReindexStats",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("content_type", models.CharField(max_length=16)),
+                ("written", models.PositiveIntegerField(default=0)),
+                ("skipped", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name_plural": "reindex stats",
+                "ordering": ("-day", "content_type"),
+                "unique_together": {("day", "content_type")},
+            },
+        ),
+    ]
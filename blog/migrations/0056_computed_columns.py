@@ -0,0 +1,151 @@
+# Generated by Django 6.1 on 2026-10-17 04:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0055_rendered_html"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="beat",
+            name="domain",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=255
+            ),
+        ),
+        migrations.AddField(
+            model_name="beat",
+            name="image_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="beat",
+            name="paragraph_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="beat",
+            name="word_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="blogmark",
+            name="domain",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=255
+            ),
+        ),
+        migrations.AddField(
+            model_name="blogmark",
+            name="image_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="blogmark",
+            name="paragraph_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="blogmark",
+            name="word_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="contentitem",
+            name="domain",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+        migrations.AddField(
+            model_name="contentitem",
+            name="word_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="entry",
+            name="domain",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=255
+            ),
+        ),
+        migrations.AddField(
+            model_name="entry",
+            name="image_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="entry",
+            name="paragraph_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="entry",
+            name="word_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="note",
+            name="domain",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=255
+            ),
+        ),
+        migrations.AddField(
+            model_name="note",
+            name="image_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="note",
+            name="paragraph_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="note",
+            name="word_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="quotation",
+            name="domain",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=255
+            ),
+        ),
+        migrations.AddField(
+            model_name="quotation",
+            name="image_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="quotation",
+            name="paragraph_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="quotation",
+            name="word_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="contentitem",
+            index=models.Index(
+                condition=models.Q(("is_draft", False)),
+                fields=["-word_count"],
+                name="blog_contentitem_words_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contentitem",
+            index=models.Index(
+                condition=models.Q(
+                    ("is_draft", False), models.Q(("domain", ""), _negated=True)
+                ),
+                fields=["domain", "-created"],
+                name="blog_contentitem_domain_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.1 on 2026-10-17 06:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0057_search_document_trigger_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StoredSpellingIndex",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("data", models.BinaryField()),
+                ("built", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -1,25 +1,48 @@
-from django.db import models
-from django.db.models import Sum, Subquery, OuterRef, IntegerField
+from django.db import connection, models
 from django.utils.dates import MONTHS_3
-from django.db.models.functions import Coalesce
 from django.utils.safestring import mark_safe
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
-from django.db.models import JSONField, Count
-from django.contrib.postgres.search import SearchVectorField
+from django.db.models import (
+    F,
+    Func,
+    JSONField,
+    OuterRef,
+    StringAgg,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import MD5, Coalesce, Concat, NullIf
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import GinIndex
 from django.utils.html import escape, strip_tags
-from collections import Counter
+import hashlib
+import operator
 import re
 import arrow
 import datetime
+from functools import reduce
 from urllib.parse import quote, urlparse
 
 from django.utils import timezone
-from markdown import markdown
+from blog.rendering import render_markdown
 from xml.etree import ElementTree
 
 tag_re = re.compile("^[a-z0-9]+$")
+# Strips markup for the search index, exactly as regexp_replace() does in
+# index_expressions() and the search_document triggers. Not strip_tags(),
+# which treats entities, comments and stray "<" differently
+index_markup_re = re.compile("<[^>]*>")
+# Counts <pre> (and any other tag starting "p") too, as multi_paragraph always has
+paragraph_re = re.compile("<p")
+img_re = re.compile(r"<img[\s/>]")
+
+
+def domain_for_url(url):
+    """Lowercased domain of url with any leading 'www.' stripped, or ''."""
+    netloc = (urlparse(url or "").netloc or "").lower()
+    return netloc[4:] if netloc.startswith("www.") else netloc
 
 
 class Tag(models.Model):
@@ -31,7 +54,7 @@ class Tag(models.Model):
 
     def description_rendered(self):
         if self.description:
-            return mark_safe(markdown(self.description))
+            return mark_safe(render_markdown(self.description))
         else:
             return ""
 
@@ -48,158 +71,60 @@ class Tag(models.Model):
         return self.get_link(reltag=True)
 
     def entry_count(self):
-        return self.entry_set.filter(is_draft=False).count()
+        return Entry.objects.filter(is_draft=False, tag_ids__contains=[self.pk]).count()
 
     def link_count(self):
-        return self.blogmark_set.filter(is_draft=False).count()
+        return Blogmark.objects.filter(
+            is_draft=False, tag_ids__contains=[self.pk]
+        ).count()
 
     def quote_count(self):
-        return self.quotation_set.filter(is_draft=False).count()
+        return Quotation.objects.filter(
+            is_draft=False, tag_ids__contains=[self.pk]
+        ).count()
 
     def note_count(self):
-        return self.note_set.filter(is_draft=False).count()
+        return Note.objects.filter(is_draft=False, tag_ids__contains=[self.pk]).count()
 
     def beat_count(self):
-        return self.beat_set.filter(is_draft=False).count()
+        return Beat.objects.filter(is_draft=False, tag_ids__contains=[self.pk]).count()
 
     def chapter_count(self):
         from guides.models import Chapter
 
         return Chapter.objects.filter(
-            tags=self, is_draft=False, guide__is_draft=False, is_unlisted=False
+            tag_ids__contains=[self.pk],
+            is_draft=False,
+            guide__is_draft=False,
+            is_unlisted=False,
         ).count()
 
     def total_count(self):
-        entry_count = Subquery(
-            Entry.objects.filter(is_draft=False, tags=OuterRef("pk"))
-            .values("tags")
-            .annotate(count=Count("id"))
-            .values("count"),
-            output_field=IntegerField(),
-        )
-
-        blogmark_count = Subquery(
-            Blogmark.objects.filter(is_draft=False, tags=OuterRef("pk"))
-            .values("tags")
-            .annotate(count=Count("id"))
-            .values("count"),
-            output_field=IntegerField(),
-        )
-
-        quotation_count = Subquery(
-            Quotation.objects.filter(is_draft=False, tags=OuterRef("pk"))
-            .values("tags")
-            .annotate(count=Count("id"))
-            .values("count"),
-            output_field=IntegerField(),
-        )
-
-        note_count = Subquery(
-            Note.objects.filter(is_draft=False, tags=OuterRef("pk"))
-            .values("tags")
-            .annotate(count=Count("id"))
-            .values("count"),
-            output_field=IntegerField(),
-        )
-
-        beat_count = Subquery(
-            Beat.objects.filter(is_draft=False, tags=OuterRef("pk"))
-            .values("tags")
-            .annotate(count=Count("id"))
-            .values("count"),
-            output_field=IntegerField(),
-        )
-
-        from guides.models import Chapter as GuidesChapter
-
-        chapter_count = Subquery(
-            GuidesChapter.objects.filter(
-                is_draft=False,
-                guide__is_draft=False,
-                is_unlisted=False,
-                tags=OuterRef("pk"),
-            )
-            .values("tags")
-            .annotate(count=Count("id"))
-            .values("count"),
-            output_field=IntegerField(),
-        )
-
-        result = (
-            Tag.objects.filter(pk=self.pk)
-            .annotate(
-                total_count=Sum(
-                    Coalesce(entry_count, 0)
-                    + Coalesce(blogmark_count, 0)
-                    + Coalesce(quotation_count, 0)
-                    + Coalesce(note_count, 0)
-                    + Coalesce(beat_count, 0)
-                    + Coalesce(chapter_count, 0)
-                )
-            )
-            .values("total_count")
-            .first()
-        )
-
-        return result["total_count"] if result else 0
+        if not hasattr(self, "_total_count"):
+            self._total_count = ContentItem.objects.listed().tagged([self.pk]).count()
+        return self._total_count
 
     def all_types_queryset(self):
-        entries = (
-            self.entry_set.all()
-            .annotate(type=models.Value("entry", output_field=models.CharField()))
-            .values("pk", "created", "type")
-        )
-        blogmarks = (
-            self.blogmark_set.all()
-            .annotate(type=models.Value("blogmark", output_field=models.CharField()))
-            .values("pk", "created", "type")
-        )
-        quotations = (
-            self.quotation_set.all()
-            .annotate(type=models.Value("quotation", output_field=models.CharField()))
-            .values("pk", "created", "type")
-        )
-        notes = (
-            self.note_set.all()
-            .annotate(type=models.Value("note", output_field=models.CharField()))
-            .values("pk", "created", "type")
-        )
-        beats = (
-            self.beat_set.all()
-            .annotate(type=models.Value("beat", output_field=models.CharField()))
-            .values("pk", "created", "type")
-        )
-        chapters = (
-            self.guides_chapter_set.all()
-            .annotate(type=models.Value("chapter", output_field=models.CharField()))
-            .values("pk", "created", "type")
-        )
-        return entries.union(blogmarks, quotations, notes, beats, chapters).order_by(
-            "-created"
+        return (
+            ContentItem.objects.tagged([self.pk]).as_mixed_dicts().order_by("-created")
         )
 
     def get_related_tags(self, limit=10):
         """Get all items tagged with this, look at /their/ tags, order by count"""
-        from guides.models import Chapter as GuidesChapter
-
         if not hasattr(self, "_related_tags"):
-            counts = Counter()
-            for klass, collection in (
-                (Entry, "entry_set"),
-                (Blogmark, "blogmark_set"),
-                (Quotation, "quotation_set"),
-                (Note, "note_set"),
-                (Beat, "beat_set"),
-                (GuidesChapter, "guides_chapter_set"),
-            ):
-                qs = klass.objects.filter(
-                    pk__in=getattr(self, collection).all()
-                ).values_list("tags__tag", flat=True)
-                counts.update(t for t in qs if t != self.tag)
-            tag_names = [p[0] for p in counts.most_common(limit)]
-            tags_by_name = {t.tag: t for t in Tag.objects.filter(tag__in=tag_names)}
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    select tag_id from blog_contentitem, unnest(tag_ids) as tag_id
+                    where tag_ids @> array[%s] and tag_id != %s
+                    group by tag_id order by count(*) desc, tag_id limit %s
+                    """,
+                    [self.pk, self.pk, limit],
+                )
+                tag_ids = [row[0] for row in cursor.fetchall()]
+            tags_by_id = Tag.objects.in_bulk(tag_ids)
             # Need a list in the correct order
-            self._related_tags = [tags_by_name[name] for name in tag_names]
+            self._related_tags = [tags_by_id[pk] for pk in tag_ids]
         return self._related_tags
 
     def rename_tag(self, new_name):
@@ -254,7 +179,7 @@ class Series(models.Model):
 
     def summary_rendered(self):
         if self.summary:
-            return mark_safe(markdown(self.summary))
+            return mark_safe(render_markdown(self.summary))
         else:
             return ""
 
@@ -310,10 +235,122 @@ class BaseModel(models.Model):
     slug = models.SlugField(max_length=64)
     metadata = JSONField(blank=True, default=dict)
     search_document = SearchVectorField(null=True)
+    # md5 of index_components(), so unchanged saves can skip the rewrite
+    search_document_hash = models.CharField(
+        max_length=32, blank=True, default="", editable=False
+    )
     import_ref = models.TextField(max_length=64, null=True, unique=True)
     card_image = models.CharField(max_length=128, null=True, blank=True)
     series = models.ForeignKey(Series, blank=True, null=True, on_delete=models.PROTECT)
     is_draft = models.BooleanField(default=False)  # P9163
+    # Denormalized copy of the tags M2M, maintained by blog/signals.py
+    tag_ids = ArrayField(
+        models.IntegerField(), default=list, blank=True, editable=False
+    )
+
+    # HTML from render(), stored on save so views don't re-render it
+    rendered_html = models.TextField(blank=True, default="", editable=False)
+    # Shorter version for listings, if the model has one
+    rendered_excerpt = models.TextField(blank=True, default="", editable=False)
+    # The RENDER_VERSION rendered_html was built by, negated if render()
+    # failed on invalid XHTML - views then render (and fail) at request time
+    render_version = models.IntegerField(default=0, editable=False)
+    # Derived from the content alongside rendered_html - see computed_values()
+    word_count = models.IntegerField(default=0, editable=False)
+    paragraph_count = models.IntegerField(default=0, editable=False)
+    image_count = models.IntegerField(default=0, editable=False)
+    domain = models.CharField(max_length=255, blank=True, default="", editable=False)
+
+    # Bump to have "manage.py rerender_all" re-render every stored row, e.g.
+    # after changing a render() or computed_values() method or the filters
+    # and extensions they use
+    RENDER_VERSION = 3
+    COMPUTED_FIELDS = ("word_count", "paragraph_count", "image_count", "domain")
+    RENDERED_FIELDS = (
+        "rendered_html",
+        "rendered_excerpt",
+        "render_version",
+    ) + COMPUTED_FIELDS
+
+    # Maintained by blog/signals.py, so save() leaves them alone rather than
+    # writing back whatever (possibly stale) copy the instance was loaded with
+    DERIVED_FIELDS = ("search_document", "search_document_hash", "tag_ids")
+
+    def save(self, **kwargs):
+        self.update_rendered()
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = set(kwargs["update_fields"]) | set(
+                self.RENDERED_FIELDS
+            )
+        elif not self._state.adding and not kwargs.get("force_insert"):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.DERIVED_FIELDS
+            ]
+        super().save(**kwargs)
+
+    def render(self):
+        """
+        (html, excerpt_html) to store in rendered_html and rendered_excerpt,
+        excerpt_html None if there isn't a separate one. None if the model
+        has nothing to store.
+        """
+        return None
+
+    def update_rendered(self):
+        version = self.RENDER_VERSION
+        try:
+            rendered = self.render()
+        except ElementTree.ParseError:
+            # Leave invalid XHTML to be rendered (and fail) at view time,
+            # noting that this RENDER_VERSION has tried
+            rendered, version = None, -version
+        if rendered is None:
+            self.rendered_html, self.rendered_excerpt = "", ""
+            # 0 for models with nothing to store
+            self.render_version = min(version, 0)
+        else:
+            html, excerpt = rendered
+            self.rendered_html = html
+            self.rendered_excerpt = excerpt or ""
+            self.render_version = version
+        for name, value in self.computed_values().items():
+            setattr(self, name, value)
+
+    def computed_values(self):
+        """
+        {name: value} for COMPUTED_FIELDS. By default counted from the
+        rendered HTML - models override what they know better.
+        """
+        html = str(self.stored_html()) if self.render_version > 0 else ""
+        return {
+            "word_count": len(strip_tags(html).split()),
+            "paragraph_count": len(paragraph_re.findall(html)),
+            "image_count": len(img_re.findall(html)),
+            "domain": "",
+        }
+
+    def computed(self, name):
+        "A COMPUTED_FIELDS value, worked out afresh if the row predates RENDER_VERSION"
+        if self.render_version == self.RENDER_VERSION:
+            return getattr(self, name)
+        return self.computed_values()[name]
+
+    def words(self):
+        return self.computed("word_count")
+
+    def stored_html(self, excerpt=False):
+        """
+        The stored rendered_html (or rendered_excerpt, falling back to
+        rendered_html), or a fresh render() if the row predates the current
+        RENDER_VERSION
+        """
+        if self.render_version == self.RENDER_VERSION:
+            html, excerpt_html = self.rendered_html, self.rendered_excerpt
+        else:
+            html, excerpt_html = self.render()
+        return mark_safe((excerpt and excerpt_html) or html)
 
     def created_unixtimestamp(self):
         return int(arrow.get(self.created).timestamp())
@@ -332,10 +369,71 @@ class BaseModel(models.Model):
     def edit_url(self):
         return "/admin/blog/%s/%d/" % (self.__class__.__name__.lower(), self.id)
 
+    @classmethod
+    def search_document_expression(cls):
+        """
+        index_components() as a single SQL expression over the model's
+        table, for set-based reindexing with QuerySet.update()
+        """
+        return reduce(
+            operator.add,
+            [
+                SearchVector(expression, weight=weight)
+                for weight, expression in cls.index_expressions().items()
+            ],
+        )
+
+    @staticmethod
+    def components_hash(components):
+        "Checksum of index_components(), as search_document_hash_expression()"
+        text = "\x1f".join(
+            weight + "\x1f" + (value or "") for weight, value in components.items()
+        )
+        return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def search_document_hash_expression(cls):
+        "components_hash() of index_expressions(), in SQL"
+        parts = []
+        for weight, expression in cls.index_expressions().items():
+            parts += [Value(weight), Coalesce(expression, Value(""))]
+        return MD5(
+            Func(
+                Value("\x1f"),
+                *parts,
+                function="concat_ws",
+                output_field=models.TextField(),
+            )
+        )
+
+    def tag_names(self):
+        "Space-separated tag names, in the order they were added"
+        through = self.tags.through
+        return " ".join(
+            through.objects.filter(**{self.tags.source_field_name: self.pk})
+            .order_by("id")
+            .values_list("tag__tag", flat=True)
+        )
+
+    @classmethod
+    def tag_names_expression(cls):
+        "tag_names() for each row, as an SQL expression"
+        through = cls.tags.through
+        source = cls.tags.field.m2m_field_name()
+        return Subquery(
+            through.objects.filter(**{source: OuterRef("pk")})
+            .values(source)
+            .annotate(names=StringAgg("tag__tag", Value(" "), order_by="id"))
+            .values("names")
+        )
+
     class Meta:
         abstract = True
         ordering = ("-created",)
-        indexes = [GinIndex(fields=["search_document"])]
+        indexes = [
+            GinIndex(fields=["search_document"]),
+            GinIndex(fields=["tag_ids"]),
+        ]
 
 
 class Entry(BaseModel):
@@ -366,6 +464,30 @@ class Entry(BaseModel):
     def previous_by_created(self):
         return super().get_previous_by_created(is_draft=False)
 
+    def render(self):
+        from blog.templatetags.entry_tags import XHTML_PIPELINES
+
+        return (
+            XHTML_PIPELINES["body"](self.body),
+            XHTML_PIPELINES["summary"](self.body),
+        )
+
+    def body_html(self):
+        return self.stored_html()
+
+    def computed_values(self):
+        return {
+            # As counted by the |wordcount filter
+            "word_count": len(self.body.split()),
+            "paragraph_count": len(paragraph_re.findall(self.body)),
+            "image_count": len(img_re.findall(self.body)),
+            "domain": "",
+        }
+
+    def summary_html(self):
+        "First paragraph, for listings"
+        return self.stored_html(excerpt=True)
+
     def images(self):
         """Extracts images from entry.body"""
         et = ElementTree.fromstring("<entry>%s</entry>" % self.body)
@@ -374,8 +496,23 @@ class Entry(BaseModel):
     def index_components(self):
         return {
             "A": self.title,
-            "C": strip_tags(self.body),
-            "B": " ".join(self.tags.values_list("tag", flat=True)),
+            "C": index_markup_re.sub("", self.body),
+            "B": self.tag_names(),
+        }
+
+    @classmethod
+    def index_expressions(cls):
+        return {
+            "A": F("title"),
+            "C": Func(
+                F("body"),
+                Value(index_markup_re.pattern),
+                Value(""),
+                Value("g"),
+                function="regexp_replace",
+                output_field=models.TextField(),
+            ),
+            "B": cls.tag_names_expression(),
         }
 
     def series_info(self):
@@ -403,7 +540,7 @@ class Entry(BaseModel):
         }
 
     def multi_paragraph(self):
-        return self.body.count("<p") > 1
+        return self.computed("paragraph_count") > 1
 
     def __str__(self):
         return self.title
@@ -432,15 +569,21 @@ class Quotation(BaseModel):
 
     is_quotation = True
 
+    def render(self):
+        return render_markdown(self.quotation), None
+
     def body(self):
-        return mark_safe(markdown(self.quotation))
+        return self.stored_html()
+
+    def computed_values(self):
+        return dict(super().computed_values(), domain=domain_for_url(self.source_url))
 
     def body_strip_tags(self):
-        return strip_tags(markdown(self.quotation))
+        return strip_tags(self.body())
 
     def context_rendered(self):
         if self.context:
-            rendered = markdown(self.context)
+            rendered = render_markdown(self.context)
             # Remove leading/trailing <p> tag
             if rendered.startswith("<p>") and rendered.endswith("</p>"):
                 return mark_safe(rendered[3:-4])
@@ -455,10 +598,18 @@ class Quotation(BaseModel):
     def index_components(self):
         return {
             "A": self.quotation,
-            "B": " ".join(self.tags.values_list("tag", flat=True)),
+            "B": self.tag_names(),
             "C": self.source,
         }
 
+    @classmethod
+    def index_expressions(cls):
+        return {
+            "A": F("quotation"),
+            "B": cls.tag_names_expression(),
+            "C": F("source"),
+        }
+
     def __str__(self):
         return self.body_strip_tags()
 
@@ -482,7 +633,7 @@ class Blogmark(BaseModel):
     def index_components(self):
         return {
             "A": self.link_title,
-            "B": " ".join(self.tags.values_list("tag", flat=True)),
+            "B": self.tag_names(),
             "C": self.commentary
             + " "
             + self.link_domain()
@@ -490,19 +641,51 @@ class Blogmark(BaseModel):
             + (self.via_title or ""),
         }
 
+    @classmethod
+    def index_expressions(cls):
+        return {
+            "A": F("link_title"),
+            "B": cls.tag_names_expression(),
+            "C": Concat(
+                F("commentary"),
+                Value(" "),
+                Func(
+                    F("link_url"),
+                    Value("/"),
+                    Value(3),
+                    function="split_part",
+                    output_field=models.TextField(),
+                ),
+                Value(" "),
+                Coalesce(F("via_title"), Value("")),
+                output_field=models.TextField(),
+            ),
+        }
+
     def __str__(self):
         return self.link_title
 
     def link_domain(self):
         return self.link_url.split("/")[2]
 
+    def render(self):
+        return (render_markdown(self.commentary) if self.use_markdown else ""), None
+
     def body(self):
         if self.use_markdown:
-            return mark_safe(markdown(self.commentary))
+            return self.stored_html()
         return self.commentary
 
-    def word_count(self):
-        count = len(self.commentary.split())
+    def computed_values(self):
+        return {
+            "word_count": len(self.commentary.split()),
+            "paragraph_count": len(paragraph_re.findall(str(self.body()))),
+            "image_count": len(img_re.findall(str(self.body()))),
+            "domain": domain_for_url(self.link_url),
+        }
+
+    def word_count_text(self):
+        count = self.computed("word_count")
         if count == 1:
             return "1 word"
         else:
@@ -516,16 +699,23 @@ class Note(BaseModel):
     )
     is_note = True
 
+    def render(self):
+        return render_markdown(self.body), None
+
     def body_rendered(self):
-        return mark_safe(markdown(self.body))
+        return self.stored_html()
 
     def index_components(self):
         # Note: 'A' is typically title/headline, 'C' is main body, 'B' is tags
         return {
             "C": self.body,
-            "B": " ".join(self.tags.values_list("tag", flat=True)),
+            "B": self.tag_names(),
         }
 
+    @classmethod
+    def index_expressions(cls):
+        return {"C": F("body"), "B": cls.tag_names_expression()}
+
     def __str__(self):
         # Return first 50 chars as string representation
         if len(self.body) > 50:
@@ -584,10 +774,23 @@ class Beat(BaseModel):
 
     is_beat = True
 
+    def render(self):
+        return (render_markdown(self.note) if self.note else ""), None
+
     def note_rendered(self):
-        if self.note:
-            return mark_safe(markdown(self.note))
-        return ""
+        return self.stored_html()
+
+    def computed_values(self):
+        html = str(self.stored_html()) if self.render_version > 0 else ""
+        return {
+            "word_count": len(self.commentary.split()) + len(strip_tags(html).split()),
+            "paragraph_count": len(paragraph_re.findall(html)),
+            "image_count": sum(
+                len(obs.get("photos") or [])
+                for obs in (self.metadata or {}).get("observations") or []
+            ),
+            "domain": domain_for_url(self.url),
+        }
 
     def sighting_location_display(self):
         """Return location.display_name from metadata, or empty string."""
@@ -658,16 +861,12 @@ class Beat(BaseModel):
 
     def sighting_photo_count(self):
         """Total number of photos across all observations in this sighting."""
-        count = 0
-        for obs in (self.metadata or {}).get("observations") or []:
-            count += len(obs.get("photos") or [])
-        return count
+        return self.computed("image_count")
 
     @staticmethod
     def comment_domain_for_url(url):
         """Lowercased domain of url with any leading 'www.' stripped, or ''."""
-        netloc = (urlparse(url or "").netloc or "").lower()
-        return netloc[4:] if netloc.startswith("www.") else netloc
+        return domain_for_url(url)
 
     def comment_site(self):
         """Site name from metadata, falling back to the domain of url."""
@@ -710,10 +909,24 @@ class Beat(BaseModel):
     def index_components(self):
         return {
             "A": self.title,
-            "B": " ".join(self.tags.values_list("tag", flat=True)),
+            "B": self.tag_names(),
             "C": " ".join(filter(None, [self.commentary, self.note])),
         }
 
+    @classmethod
+    def index_expressions(cls):
+        return {
+            "A": F("title"),
+            "B": cls.tag_names_expression(),
+            "C": Func(
+                Value(" "),
+                NullIf(F("commentary"), Value("")),
+                NullIf(F("note"), Value("")),
+                function="concat_ws",
+                output_field=models.TextField(),
+            ),
+        }
+
     def __str__(self):
         return f"{self.get_beat_type_display()}: {self.title}"
 
@@ -889,6 +1102,234 @@ class Comment(models.Model):
         get_latest_by = "created"
 
 
+class ContentItemQuerySet(models.QuerySet):
+    def published(self):
+        "Non-draft items - what /search/ shows"
+        return self.filter(is_draft=False)
+
+    def listed(self):
+        "Published items that are not unlisted - homepage, archives, tag pages"
+        return self.filter(is_draft=False, is_unlisted=False)
+
+    def tagged(self, tag_ids):
+        "Items carrying every one of these tag IDs"
+        return self.filter(tag_ids__contains=list(tag_ids))
+
+    def as_mixed_dicts(self, *extra):
+        "{type, pk, created} dicts suitable for passing to load_mixed_objects()"
+        return self.values(
+            "created", *extra, type=models.F("content_type"), pk=models.F("object_id")
+        )
+
+
+class ContentItem(models.Model):
+    """
+    One row per Entry, Blogmark, Quotation, Note, Beat and guides Chapter,
+    maintained by blog/signals.py. Lets listing and search queries run
+    against a single indexed table instead of a six-way UNION.
+    """
+
+    content_type = models.CharField(max_length=16)
+    object_id = models.IntegerField()
+    created = models.DateTimeField()
+    # For chapters this is also true if the guide is a draft
+    is_draft = models.BooleanField(default=False)
+    is_unlisted = models.BooleanField(default=False)
+    beat_type = models.CharField(max_length=20, blank=True, default="")
+    search_document = SearchVectorField(null=True)
+    tag_ids = ArrayField(models.IntegerField(), default=list, blank=True)
+    # Copies of the content model's computed columns, for filtering and sorting
+    word_count = models.IntegerField(default=0)
+    domain = models.CharField(max_length=255, blank=True, default="")
+
+    objects = ContentItemQuerySet.as_manager()
+
+    def __str__(self):
+        return "{}:{}".format(self.content_type, self.object_id)
+
+    @classmethod
+    def content_type_for(cls, obj):
+        # The model names of the six content models double as type keys
+        return obj._meta.model_name
+
+    @classmethod
+    def sync(cls, obj, search_document=True):
+        """
+        Insert or refresh the row for obj, reading current values from the
+        DB. With search_document=False an existing row keeps its
+        search_document, for when a job is about to rewrite it.
+        """
+        model = obj.__class__
+        content_type = cls.content_type_for(obj)
+        values = [
+            "created",
+            "is_draft",
+            "search_document",
+            "tag_ids",
+            "word_count",
+            "domain",
+        ]
+        if content_type == "chapter":
+            values += ["is_unlisted", "guide__is_draft"]
+        if content_type == "beat":
+            values.append("beat_type")
+        row = model.objects.filter(pk=obj.pk).values(*values).first()
+        if row is None:
+            cls.objects.filter(content_type=content_type, object_id=obj.pk).delete()
+            return
+        values = {
+            "created": row["created"],
+            "is_draft": row["is_draft"] or bool(row.get("guide__is_draft")),
+            "is_unlisted": bool(row.get("is_unlisted")),
+            "beat_type": row.get("beat_type") or "",
+            "search_document": row["search_document"],
+            "tag_ids": row["tag_ids"],
+            "word_count": row["word_count"],
+            "domain": row["domain"],
+        }
+        create_defaults = dict(values)
+        if not search_document:
+            del values["search_document"]
+        existing = (
+            cls.objects.filter(content_type=content_type, object_id=obj.pk)
+            .values(*values)
+            .first()
+        )
+        if existing == values:
+            # Rewriting an identical row would still churn the GIN indexes
+            return
+        cls.objects.update_or_create(
+            content_type=content_type,
+            object_id=obj.pk,
+            defaults=values,
+            create_defaults=create_defaults,
+        )
+
+    class Meta:
+        unique_together = (("content_type", "object_id"),)
+        indexes = [
+            GinIndex(fields=["search_document"]),
+            GinIndex(fields=["tag_ids"]),
+            models.Index(
+                fields=["-created"],
+                name="blog_contentitem_listed_idx",
+                condition=models.Q(is_draft=False, is_unlisted=False),
+            ),
+            models.Index(
+                fields=["content_type", "-created"],
+                name="blog_contentitem_type_idx",
+                condition=models.Q(is_draft=False),
+            ),
+            models.Index(
+                fields=["-word_count"],
+                name="blog_contentitem_words_idx",
+                condition=models.Q(is_draft=False),
+            ),
+            models.Index(
+                fields=["domain", "-created"],
+                name="blog_contentitem_domain_idx",
+                condition=models.Q(is_draft=False) & ~models.Q(domain=""),
+            ),
+        ]
+
+
+class ReindexStats(models.Model):
+    """
+    Daily counts of search_document writes made and skipped because
+    search_document_hash showed the indexed content was unchanged.
+    """
+
+    day = models.DateField()
+    content_type = models.CharField(max_length=16)
+    written = models.PositiveIntegerField(default=0)
+    skipped = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return "{} {}".format(self.day, self.content_type)
+
+    @classmethod
+    def record(cls, content_type, written=0, skipped=0):
+        if not (written or skipped):
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                insert into blog_reindexstats (day, content_type, written, skipped)
+                values (%s, %s, %s, %s)
+                on conflict (day, content_type) do update set
+                    written = blog_reindexstats.written + excluded.written,
+                    skipped = blog_reindexstats.skipped + excluded.skipped
+                """,
+                [timezone.localdate(), content_type, written, skipped],
+            )
+
+    class Meta:
+        unique_together = (("day", "content_type"),)
+        ordering = ("-day", "content_type")
+        verbose_name_plural = "reindex stats"
+
+
+class StoredSpellingIndex(models.Model):
+    """
+    The latest index written by the build_spelling_index command, for
+    fetch_spelling_index to copy to each web dyno's disk. A single row.
+    """
+
+    data = models.BinaryField()
+    built = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return "Spelling index built {}".format(self.built)
+
+
+class Job(models.Model):
+    """
+    A unit of slow work queued by blog/jobs.py and run by the run_jobs
+    management command, so web requests don't wait for it.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued"
+        RUNNING = "running"
+        DONE = "done"
+        FAILED = "failed"
+
+    name = models.CharField(max_length=64)
+    kwargs = JSONField(default=dict, blank=True)
+    # Jobs with the same name and non-empty key are only queued once
+    key = models.CharField(max_length=128, blank=True, default="")
+    status = models.CharField(
+        max_length=16, choices=Status.choices, default=Status.QUEUED
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    created = models.DateTimeField(default=timezone.now)
+    run_after = models.DateTimeField(default=timezone.now)
+    started = models.DateTimeField(null=True, blank=True)
+    finished = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    def __str__(self):
+        return "{} #{} ({})".format(self.name, self.pk, self.status)
+
+    class Meta:
+        ordering = ("-created",)
+        indexes = [
+            models.Index(
+                fields=["run_after", "id"],
+                name="blog_job_queued_idx",
+                condition=models.Q(status="queued"),
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["name", "key"],
+                name="blog_job_unique_queued_key",
+                condition=models.Q(status="queued") & ~models.Q(key=""),
+            ),
+        ]
+
+
 def load_mixed_objects(dicts):
     """
     Takes a list of dictionaries, each of which must at least have a 'type'
@@ -0,0 +1,230 @@
+import base64
+import json
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connection, models
+from django.utils.functional import cached_property
+
+# Unique newest-first ordering for ContentItem.as_mixed_dicts() rows
+CONTENT_ITEM_ORDERING = [
+    ("created", "created"),
+    ("content_type", "type"),
+    ("object_id", "pk"),
+]
+
+
+def estimated_count(qs, exact_limit):
+    """
+    Returns (count, is_estimate). Counts exactly up to exact_limit rows, then
+    falls back to the Postgres planner's row estimate for the query.
+    """
+    qs = qs.order_by()
+    count = qs[: exact_limit + 1].count()
+    if count <= exact_limit:
+        return count, False
+    sql, params = qs.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute("explain (format json) " + sql, params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    # We know there are at least exact_limit + 1 rows
+    return max(int(plan[0]["Plan"]["Plan Rows"]), count), True
+
+
+class EstimatedCountPaginator(Paginator):
+    "Paginator with an estimated count for very large result sets"
+
+    @cached_property
+    def counted(self):
+        return estimated_count(self.object_list, settings.EXACT_COUNT_LIMIT)
+
+    @property
+    def count(self):
+        return self.counted[0]
+
+    @property
+    def count_is_estimate(self):
+        return self.counted[1]
+
+    def validate_number(self, number):
+        if not self.count_is_estimate:
+            return super().validate_number(number)
+        # The estimate may be short, so only an empty page() is out of range
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        if not self.count_is_estimate:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        # One row more than the page, to tell whether there is a next one
+        queryset = self.object_list[bottom : bottom + self.per_page + 1]
+        rows = list(queryset)
+        # An estimate can promise pages that don't exist
+        if number > 1 and not rows:
+            raise EmptyPage(self.error_messages["no_results"])
+        return EstimatedPage(
+            rows[: self.per_page], number, self, len(rows) > self.per_page, queryset
+        )
+
+
+class EstimatedPage(Page):
+    """
+    A page of an estimated count, which knows whether another page follows.
+    queryset is the query that fetched it.
+    """
+
+    def __init__(self, object_list, number, paginator, has_next, queryset):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+        self.queryset = queryset
+
+    def has_next(self):
+        return self._has_next
+
+    def end_index(self):
+        return self.start_index() + len(self.object_list) - 1
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorPage:
+    """
+    One page of keyset (seek) pagination. Quacks enough like a Django Page
+    for the templates: object_list, has_next and has_previous. queryset is
+    the keyset-filtered query that fetched it.
+    """
+
+    is_cursor_page = True
+
+    def __init__(
+        self, object_list, next_cursor=None, previous_cursor=None, queryset=None
+    ):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.queryset = queryset
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+
+def encode_cursor(values, direction):
+    # Not DjangoJSONEncoder: that truncates datetimes to milliseconds
+    payload = json.dumps({"d": direction, "v": values}, default=_isoformat)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _isoformat(value):
+    return value.isoformat()
+
+
+def decode_cursor(token):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        direction, values = payload["d"], payload["v"]
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursor(token)
+    if direction not in ("next", "prev") or not isinstance(values, list):
+        raise InvalidCursor(token)
+    return direction, values
+
+
+def _keyset_filter(fields, values, op):
+    """
+    (f1, f2, ...) < (v1, v2, ...) as nested ORs, plus a plain f1 <= v1 so
+    Postgres can use an index range scan on the leading column.
+    """
+    condition = None
+    for field, value in reversed(list(zip(fields, values))):
+        strict = models.Q(**{"{}__{}".format(field, op): value})
+        if condition is None:
+            condition = strict
+        else:
+            condition = strict | (models.Q(**{field: value}) & condition)
+    return models.Q(**{"{}__{}e".format(fields[0], op): values[0]}) & condition
+
+
+def cursor_paginate(qs, ordering, per_page, cursor=""):
+    """
+    Paginate a values() queryset by keyset rather than OFFSET.
+
+    ordering is a list of (field, key) pairs, sorted descending: field is
+    the model field or annotation to order and filter on, key is where its
+    value lives in each row dict. The fields must form a unique ordering.
+    """
+    fields = [field for field, _ in ordering]
+    direction, values = "next", None
+    if cursor:
+        direction, values = decode_cursor(cursor)
+        if len(values) != len(fields):
+            raise InvalidCursor(cursor)
+        values = [
+            _to_python(qs.model, field, value) for field, value in zip(fields, values)
+        ]
+    if direction == "next":
+        qs = qs.order_by(*["-" + field for field in fields])
+        if values is not None:
+            qs = qs.filter(_keyset_filter(fields, values, "lt"))
+    else:
+        qs = qs.order_by(*fields)
+        qs = qs.filter(_keyset_filter(fields, values, "gt"))
+    qs = qs[: per_page + 1]
+    rows = list(qs)
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if direction == "prev":
+        rows.reverse()
+
+    def cursor_for(row, direction):
+        return encode_cursor([row[key] for _, key in ordering], direction)
+
+    next_cursor = previous_cursor = None
+    if rows:
+        if has_more or direction == "prev":
+            next_cursor = cursor_for(rows[-1], "next")
+        if values is not None and (has_more or direction == "next"):
+            previous_cursor = cursor_for(rows[0], "prev")
+    return CursorPage(
+        rows,
+        next_cursor=next_cursor,
+        previous_cursor=previous_cursor,
+        queryset=qs,
+    )
+
+
+def _to_python(model, field, value):
+    try:
+        model_field = model._meta.get_field(field)
+    except FieldDoesNotExist:
+        # Annotations such as rank
+        if not isinstance(value, (int, float)):
+            raise InvalidCursor(value)
+        return value
+    try:
+        return model_field.to_python(value)
+    except ValidationError:
+        raise InvalidCursor(value)
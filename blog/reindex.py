@@ -0,0 +1,215 @@
+"""
+Set-based search reindexing for every content model.
+
+Each model's rows are split into primary key ranges and every range is
+rebuilt with one UPDATE ... SET search_document = ... statement, using the
+models' index_expressions(), followed by one UPDATE of the matching
+ContentItem rows. Ranges can be spread across a pool of processes.
+"""
+
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.apps import apps
+from django.db import connection, connections, transaction
+from django.db.models import Max, Min, OuterRef, Subquery
+
+from blog.caching import bump_content_version
+from blog.models import BaseModel, ContentItem, ReindexStats
+
+
+def content_models():
+    return [model for model in apps.get_models() if issubclass(model, BaseModel)]
+
+
+def partitions(model, batch_size, since=None):
+    "(start, end) primary key ranges, end exclusive, covering model's rows"
+    qs = model.objects.all()
+    if since is not None:
+        qs = qs.filter(created__gte=since)
+    bounds = qs.aggregate(low=Min("pk"), high=Max("pk"))
+    if bounds["low"] is None:
+        return []
+    return [
+        (start, start + batch_size)
+        for start in range(bounds["low"], bounds["high"] + 1, batch_size)
+    ]
+
+
+def reindex_partition(label, start, end, since=None, force=False):
+    "Rebuild search_document for one range of one model, returning the row count"
+    model = apps.get_model(label)
+    qs = model.objects.filter(pk__gte=start, pk__lt=end)
+    if since is not None:
+        qs = qs.filter(created__gte=since)
+    with transaction.atomic():
+        return len(reindex_queryset(qs, force=force))
+
+
+def reindex_queryset(qs, force=False):
+    """
+    Rewrite search_document for every row of qs whose search_document_hash
+    is out of date (or every row, with force) in one UPDATE, then copy the
+    results to ContentItem. Returns the primary keys written.
+    """
+    model = qs.model
+    if force:
+        pks = list(qs.values_list("pk", flat=True))
+    else:
+        pks = list(
+            qs.exclude(
+                search_document_hash=model.search_document_hash_expression()
+            ).values_list("pk", flat=True)
+        )
+        ReindexStats.record(
+            model._meta.model_name, written=len(pks), skipped=qs.count() - len(pks)
+        )
+    if pks:
+        model.objects.filter(pk__in=pks).update(
+            search_document=model.search_document_expression(),
+            search_document_hash=model.search_document_hash_expression(),
+        )
+        refresh_content_items(model, pks)
+    return pks
+
+
+def refresh_content_items(model, pks):
+    """
+    Copy search_document, tag_ids, word_count and domain to the ContentItem
+    rows for pks
+    """
+    row = model.objects.filter(pk=OuterRef("object_id"))
+    ContentItem.objects.filter(
+        content_type=model._meta.model_name, object_id__in=pks
+    ).update(
+        search_document=Subquery(row.values("search_document")[:1]),
+        tag_ids=Subquery(row.values("tag_ids")[:1]),
+        word_count=Subquery(row.values("word_count")[:1]),
+        domain=Subquery(row.values("domain")[:1]),
+    )
+
+
+def reindex_tagged(tag_ids):
+    """
+    Rewrite the search documents of everything carrying any of tag_ids -
+    for when a tag's name changes. Two UPDATEs per content model.
+    """
+    written = 0
+    for model in content_models():
+        written += len(
+            reindex_queryset(model.objects.filter(tag_ids__overlap=list(tag_ids)))
+        )
+    return written
+
+
+def sync_tag_ids(model, pks):
+    """
+    Copy the tags M2M into model.tag_ids for the given primary keys,
+    returning {pk: tag_ids}
+    """
+    through = model.tags.through
+    sql = """
+        update {table} set tag_ids = coalesce((
+            select array_agg({through}.tag_id order by {through}.tag_id)
+            from {through} where {through}.{column} = {table}.id
+        ), array[]::integer[])
+        where {table}.id = any(%s)
+        returning {table}.id, {table}.tag_ids
+    """.format(
+        table=model._meta.db_table,
+        through=through._meta.db_table,
+        column=model.tags.field.m2m_column_name(),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [list(pks)])
+        return dict(cursor.fetchall())
+
+
+class Progress:
+    """
+    The partitions completed so far, saved to a JSON file after each one
+    so an interrupted run can pick up where it left off.
+    """
+
+    def __init__(self, path, since=None):
+        self.path = path
+        self.since = since.isoformat() if since is not None else None
+        self.done = set()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        with open(self.path) as fp:
+            data = json.load(fp)
+        if data.get("since") != self.since:
+            raise ValueError("{} was written for a different --since".format(self.path))
+        self.done = {tuple(partition) for partition in data["done"]}
+
+    def is_done(self, label, start):
+        return (label, start) in self.done
+
+    def mark_done(self, label, start):
+        self.done.add((label, start))
+        if not self.path:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as fp:
+            json.dump({"since": self.since, "done": sorted(self.done)}, fp)
+        os.replace(tmp_path, self.path)
+
+    def finish(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def reindex(
+    models=None,
+    workers=1,
+    batch_size=1000,
+    since=None,
+    progress=None,
+    report=None,
+    force=False,
+):
+    """
+    Reindex models (default: all content models), returning the number of
+    rows written. report(label, start, end, count, done, total) is called
+    as each partition finishes.
+    """
+    progress = progress or Progress(None, since)
+    jobs = [
+        (model._meta.label, start, end)
+        for model in (models or content_models())
+        for start, end in partitions(model, batch_size, since)
+        if not progress.is_done(model._meta.label, start)
+    ]
+    total = 0
+
+    def finished(job, count, done):
+        nonlocal total
+        total += count
+        progress.mark_done(job[0], job[1])
+        if report:
+            report(*job, count, done, len(jobs))
+
+    if workers <= 1 or len(jobs) < 2:
+        for done, job in enumerate(jobs, 1):
+            finished(job, reindex_partition(*job, since=since, force=force), done)
+    else:
+        # Forked children must not share the parent's database connections
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            futures = {
+                executor.submit(reindex_partition, *job, since=since, force=force): job
+                for job in jobs
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                finished(futures[future], future.result(), done)
+    progress.finish()
+    if jobs:
+        bump_content_version()
+    return total
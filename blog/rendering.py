@@ -0,0 +1,40 @@
+"""
+Reusable Markdown renderers.
+
+markdown.markdown() builds a new Markdown instance, re-initializing every
+extension, on each call. render_markdown() instead keeps one instance per
+profile per thread, configured once and reset() between documents:
+
+    render_markdown(note.body)
+    render_markdown(chapter.body, "chapter")
+
+Profiles are the keyword arguments for markdown.Markdown(), registered
+with register_profile() - see guides/models.py.
+"""
+
+import threading
+
+from markdown import Markdown
+
+PROFILES = {"default": {}}
+
+_local = threading.local()
+
+
+def register_profile(name, **kwargs):
+    "Call at import time, before any thread has built a renderer for name"
+    PROFILES[name] = kwargs
+
+
+def get_renderer(profile="default"):
+    "This thread's Markdown instance for profile, created on first use"
+    renderers = _local.__dict__.setdefault("renderers", {})
+    md = renderers.get(profile)
+    if md is None:
+        md = renderers[profile] = Markdown(**PROFILES[profile])
+    return md
+
+
+def render_markdown(text, profile="default"):
+    "The same HTML as markdown.markdown(text, **PROFILES[profile])"
+    return get_renderer(profile).reset().convert(text)
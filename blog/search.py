@@ -1,49 +1,45 @@
-import time
 import json
 import re
 import calendar
-from django.db import models
+from django.conf import settings
+from django.db import connection, models
 from django.db.models.functions import TruncYear, TruncMonth
 from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.core.paginator import EmptyPage, PageNotAnInteger
 from django.http import HttpResponse, Http404
-from django.shortcuts import render
-from blog.models import Beat, Entry, Blogmark, Quotation, Note, Tag, load_mixed_objects
-from guides.models import Chapter
-from spellchecker import SpellChecker
+from django.utils import timezone
+from blog.caching import CachedCountPaginator, cached_for_content
+from blog.pagination import CONTENT_ITEM_ORDERING, InvalidCursor, cursor_paginate
+from blog.spelling import get_index, words_in
+from blog.timing import PhaseTimer, render_timed
+from blog.models import (
+    Beat,
+    ContentItem,
+    Tag,
+    domain_for_url,
+    load_mixed_objects,
+)
 import datetime
-
-_spell = None
-
-
-def get_spellchecker():
-    global _spell
-    if _spell is None:
-        _spell = SpellChecker()
-        # Load all tags into the spellchecker
-        tag_words = set()
-        for tag in Tag.objects.values_list("tag", flat=True):
-            tag_words.update(tag.split("-"))
-        _spell.word_frequency.load_words(tag_words)
-    return _spell
+import operator
+from functools import reduce
 
 
 def get_suggestion(phrase):
-    words = phrase.split()
-    spell = get_spellchecker()
-    unknown = spell.unknown(words)
-    if not unknown:
-        return phrase
+    """
+    Spell-correct each word of phrase against the index built by the
+    build_spelling_index command. Returns None if there is no index yet.
+    """
+    index = get_index(settings.SPELLING_INDEX_PATH)
+    if index is None:
+        return None
     new_words = []
-    for word in words:
-        if word in unknown:
-            suggestion = spell.correction(word)
-            if suggestion:
-                new_words.append(suggestion)
-            else:
-                new_words.append(word)
-        else:
+    for word in phrase.split():
+        lowered = word.lower()
+        # Leave numbers, punctuation and known words alone
+        if words_in(lowered) != [lowered] or index.is_known(lowered):
             new_words.append(word)
+        else:
+            new_words.append(index.correction(lowered) or word)
     return " ".join(new_words)
 
 
@@ -61,17 +57,165 @@ def parse_date_clauses(query):
     return query.strip(), from_date, to_date
 
 
+def filtered_content_items(filters):
+    """
+    ContentItem queryset matching a dictionary of search filters, as built by
+    search(). Rows are annotated with rank if there is a search term.
+    """
+    qs = ContentItem.objects.published()
+    selected_type = filters["type"]
+    if selected_type.startswith("beat:"):
+        qs = qs.filter(content_type="beat", beat_type=selected_type[5:])
+    elif selected_type:
+        qs = qs.filter(content_type=selected_type)
+    if filters["id_filters"]:
+        qs = qs.filter(
+            reduce(
+                operator.or_,
+                (
+                    models.Q(content_type=type_name, object_id__in=ids)
+                    for type_name, ids in filters["id_filters"].items()
+                ),
+            )
+        )
+    year, month = filters["year"], filters["month"]
+    if year and year.isdigit() and 2000 <= int(year):
+        qs = qs.filter(created__year=int(year))
+    if month and month.isdigit() and 1 <= int(month) <= 12:
+        qs = qs.filter(created__month=int(month))
+    if filters["from_date"]:
+        qs = qs.filter(created__gte=filters["from_date"])
+    if filters["to_date"]:
+        qs = qs.filter(created__lt=filters["to_date"])
+    if filters["domain"]:
+        qs = qs.filter(domain=filters["domain"])
+    if filters["min_words"]:
+        qs = qs.filter(word_count__gte=filters["min_words"])
+    if filters["beat"]:
+        # Only narrows beats - other types are unaffected by ?beat=
+        qs = qs.filter(
+            ~models.Q(content_type="beat") | models.Q(beat_type=filters["beat"])
+        )
+    selected_tags, excluded_tags = filters["tags"], filters["exclude_tags"]
+    if selected_tags or excluded_tags:
+        tag_ids = dict(
+            Tag.objects.filter(tag__in=selected_tags + excluded_tags).values_list(
+                "tag", "pk"
+            )
+        )
+        if any(tag not in tag_ids for tag in selected_tags):
+            qs = qs.none()
+        elif selected_tags:
+            qs = qs.tagged(tag_ids[tag] for tag in selected_tags)
+        excluded_ids = [tag_ids[tag] for tag in excluded_tags if tag in tag_ids]
+        if excluded_ids:
+            qs = qs.exclude(tag_ids__overlap=excluded_ids)
+    if filters["q"]:
+        query = SearchQuery(filters["q"], search_type="websearch")
+        qs = qs.filter(search_document=query).annotate(
+            rank=SearchRank(models.F("search_document"), query)
+        )
+    return qs
+
+
+FACET_SQL = """
+with matches as ({matches})
+select content_type, beat_type, year, month, null::varchar as tag, count(*) as n
+from matches
+group by grouping sets ((content_type, beat_type), (year), (month))
+union all
+select null, null, null, null, blog_tag.tag, top_tags.n
+from (
+    select unnest(tag_ids) as tag_id, count(*) as n
+    from matches group by tag_id order by n desc, tag_id limit 40
+) top_tags join blog_tag on blog_tag.id = top_tags.tag_id
+"""
+
+
+def normalized_filters(filters):
+    "filters with list and set values sorted, for use as a cache key"
+    return {
+        "q": filters["q"],
+        "tags": sorted(filters["tags"]),
+        "exclude_tags": sorted(filters["exclude_tags"]),
+        "type": filters["type"],
+        "year": filters["year"],
+        "month": filters["month"],
+        "beat": filters["beat"],
+        "from_date": filters["from_date"],
+        "to_date": filters["to_date"],
+        "domain": filters["domain"],
+        "min_words": filters["min_words"],
+        "id_filters": {
+            type_name: sorted(ids) for type_name, ids in filters["id_filters"].items()
+        },
+    }
+
+
+def search_count(filters):
+    "Number of items matching filters, as a single cached COUNT query"
+    return cached_for_content(
+        "search-count",
+        normalized_filters(filters),
+        lambda: filtered_content_items(filters).count(),
+    )
+
+
+def search_facets(qs):
+    """
+    Type, beat type, tag (top 40), year and month histograms for a
+    filtered_content_items() queryset, computed in a single SQL statement.
+    """
+    facets = {"types": {}, "beat_types": {}, "tags": {}, "years": {}, "months": {}}
+    if qs.query.is_empty():
+        return facets
+    matches = (
+        qs.order_by()
+        .annotate(year=TruncYear("created"), month=TruncMonth("created"))
+        .values("content_type", "beat_type", "year", "month", "tag_ids")
+    )
+    matches_sql, params = matches.query.sql_with_params()
+    sql = FACET_SQL.format(matches=matches_sql)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    for content_type, beat_type, year, month, tag, n in rows:
+        if tag is not None:
+            facets["tags"][tag] = n
+        elif content_type is not None:
+            if content_type == "beat":
+                # Beats are broken down by beat_type in the type facet
+                facets["types"]["beat:%s" % beat_type] = n
+                facets["beat_types"][beat_type] = n
+            else:
+                facets["types"][content_type] = n
+        elif year is not None:
+            facets["years"][_make_aware(year)] = n
+        elif month is not None:
+            facets["months"][_make_aware(month)] = n
+    return facets
+
+
+def _make_aware(value):
+    # Raw cursor results skip the converter TruncYear/TruncMonth would apply
+    if timezone.is_naive(value):
+        return timezone.make_aware(value)
+    return value
+
+
 def search(request, q=None, return_context=False, per_page=30):
+    timer = PhaseTimer()
+    with timer.count_queries():
+        context = _search(request, timer, q, return_context, per_page)
+    if return_context or isinstance(context, HttpResponse):
+        return context
+    return render_timed(request, "search.html", context)
+
+
+def _search(request, timer, q, return_context, per_page):
     q = (q or request.GET.get("q", "")).strip()
     search_q, from_date, to_date = parse_date_clauses(q)
     search_q = search_q.strip()
-    start = time.time()
-
-    query = None
-    rank_annotation = None
-    if search_q:
-        query = SearchQuery(search_q, search_type="websearch")
-        rank_annotation = SearchRank(models.F("search_document"), query)
 
     selected_tags = request.GET.getlist("tag")
 
@@ -83,11 +227,13 @@ def search(request, q=None, return_context=False, per_page=30):
     selected_year = request.GET.get("year", "")
     selected_month = request.GET.get("month", "")
     selected_beat = request.GET.get("beat", "")
-
-    # Support type=beat:release etc. - parse into selected_beat_subtype
-    selected_beat_subtype = ""
-    if selected_type.startswith("beat:"):
-        selected_beat_subtype = selected_type[5:]  # e.g. "release"
+    selected_domain = domain_for_url(
+        "//" + request.GET.get("domain", "").strip().split("://")[-1]
+    )
+    selected_min_words = request.GET.get("min_words", "").strip()
+    selected_min_words = (
+        int(selected_min_words) if selected_min_words.isdigit() else None
+    )
 
     # Parse ID filters: entries=1,2,3&notes=4,5&quotations=6&blogmarks=7,8
     id_filter_param_map = {
@@ -109,130 +255,45 @@ def search(request, q=None, return_context=False, per_page=30):
                     ids.add(int(part))
             if ids:
                 id_filters[type_name] = ids
-    has_id_filters = bool(id_filters)
 
-    values = ["pk", "type", "created"]
+    filters = {
+        "q": search_q,
+        "tags": selected_tags,
+        "exclude_tags": excluded_tags,
+        "type": selected_type,
+        "year": selected_year,
+        "month": selected_month,
+        "beat": selected_beat,
+        "from_date": from_date,
+        "to_date": to_date,
+        "domain": selected_domain,
+        "min_words": selected_min_words,
+        "id_filters": id_filters,
+    }
+    items = filtered_content_items(filters)
+    timer.lap("parse")
+    extra = []
     if search_q:
-        values.append("rank")
-
-    def make_queryset(klass, type_name):
-        qs = klass.objects.filter(is_draft=False).annotate(
-            type=models.Value(type_name, output_field=models.CharField())
-        )
-        if klass == Chapter:
-            qs = qs.filter(guide__is_draft=False)
-        if selected_year and selected_year.isdigit() and 2000 <= int(selected_year):
-            qs = qs.filter(created__year=int(selected_year))
-        if (
-            selected_month
-            and selected_month.isdigit()
-            and 1 <= int(selected_month) <= 12
-        ):
-            qs = qs.filter(created__month=int(selected_month))
-        if from_date:
-            qs = qs.filter(created__gte=from_date)
-        if to_date:
-            qs = qs.filter(created__lt=to_date)
-        if search_q:
-            qs = qs.filter(search_document=query)
-            qs = qs.annotate(rank=rank_annotation)
-        if selected_beat and type_name == "beat":
-            qs = qs.filter(beat_type=selected_beat)
-        for tag in selected_tags:
-            qs = qs.filter(tags__tag=tag)
-        for exclude_tag in excluded_tags:
-            qs = qs.exclude(tags__tag=exclude_tag)
-        return qs.order_by()
-
-    # Start with a .none() queryset just so we can union stuff onto it
-    qs = Entry.objects.annotate(
-        type=models.Value("empty", output_field=models.CharField())
+        extra.append("rank")
+    if request.GET.get("sort") == "words":
+        extra.append("word_count")
+    qs = items.as_mixed_dicts(*extra)
+
+    filters_key = normalized_filters(filters)
+    facets = cached_for_content(
+        "search-facets", filters_key, lambda: search_facets(items)
     )
-    if search_q:
-        qs = qs.annotate(rank=rank_annotation)
-    qs = qs.values(*values).none()
-
-    type_counts_raw = {}
-    tag_counts_raw = {}
-    year_counts_raw = {}
-    month_counts_raw = {}
-    beat_type_counts_raw = {}
-
-    for klass, type_name, tag_filter_name in (
-        (Entry, "entry", "entry"),
-        (Blogmark, "blogmark", "blogmark"),
-        (Quotation, "quotation", "quotation"),
-        (Note, "note", "note"),
-        (Beat, "beat", "beat"),
-        (Chapter, "chapter", "guides_chapter_set"),
-    ):
-        # Determine if this type should be included based on selected_type
-        if selected_type:
-            if selected_beat_subtype:
-                # type=beat:something -> only include Beat
-                if type_name != "beat":
-                    continue
-            elif selected_type != type_name:
-                continue
-        # If ID filters are active, skip types not mentioned
-        if has_id_filters and type_name not in id_filters:
-            continue
-        klass_qs = make_queryset(klass, type_name)
-        # Apply beat subtype filter when type=beat:something
-        if selected_beat_subtype and type_name == "beat":
-            klass_qs = klass_qs.filter(beat_type=selected_beat_subtype)
-        # Apply ID filter for this type
-        if type_name in id_filters:
-            klass_qs = klass_qs.filter(pk__in=id_filters[type_name])
-        # For beats, break down into per-beat_type counts in type_counts
-        if type_name == "beat":
-            for row in (
-                klass_qs.order_by().values("beat_type").annotate(n=models.Count("pk"))
-            ):
-                bt_key = f"beat:{row['beat_type']}"
-                type_counts_raw[bt_key] = type_counts_raw.get(bt_key, 0) + row["n"]
-        else:
-            type_count = klass_qs.count()
-            if type_count:
-                type_counts_raw[type_name] = type_count
-        for tag, count in (
-            Tag.objects.filter(**{"%s__in" % tag_filter_name: klass_qs})
-            .annotate(n=models.Count("tag"))
-            .values_list("tag", "n")
-        ):
-            tag_counts_raw[tag] = tag_counts_raw.get(tag, 0) + count
-        for row in (
-            klass_qs.order_by()
-            .annotate(year=TruncYear("created"))
-            .values("year")
-            .annotate(n=models.Count("pk"))
-        ):
-            year_counts_raw[row["year"]] = (
-                year_counts_raw.get(row["year"], 0) + row["n"]
-            )
-        # Only do month counts if a year is selected
-        if selected_year:
-            for row in (
-                klass_qs.order_by()
-                .annotate(month=TruncMonth("created"))
-                .values("month")
-                .annotate(n=models.Count("pk"))
-            ):
-                month_counts_raw[row["month"]] = (
-                    month_counts_raw.get(row["month"], 0) + row["n"]
-                )
-        # Only do beat_type counts if type=beat is selected
-        if selected_type == "beat" and type_name == "beat":
-            for row in (
-                klass_qs.order_by().values("beat_type").annotate(n=models.Count("pk"))
-            ):
-                beat_type_counts_raw[row["beat_type"]] = (
-                    beat_type_counts_raw.get(row["beat_type"], 0) + row["n"]
-                )
-        qs = qs.union(klass_qs.values(*values))
+    timer.lap("facets")
+    type_counts_raw = facets["types"]
+    tag_counts_raw = facets["tags"]
+    year_counts_raw = facets["years"]
+    # Only do month counts if a year is selected
+    month_counts_raw = facets["months"] if selected_year else {}
+    # Only do beat_type counts if type=beat is selected
+    beat_type_counts_raw = facets["beat_types"] if selected_type == "beat" else {}
 
     sort = request.GET.get("sort")
-    if sort not in ("relevance", "date"):
+    if sort not in ("relevance", "date", "words"):
         sort = None
 
     if sort is None:
@@ -245,8 +306,13 @@ def search(request, q=None, return_context=False, per_page=30):
     if sort == "relevance" and not search_q:
         sort = "date"
 
-    db_sort = {"relevance": "-rank", "date": "-created"}[sort]
-    qs = qs.order_by(db_sort)
+    # Tie-break on type and pk so page and cursor pagination agree
+    db_sort = ["-" + field for field, _ in CONTENT_ITEM_ORDERING]
+    if sort == "relevance":
+        db_sort.insert(0, "-rank")
+    elif sort == "words":
+        db_sort.insert(0, "-word_count")
+    qs = qs.order_by(*db_sort)
 
     type_labels = {
         "entry": "Entry",
@@ -300,14 +366,33 @@ def search(request, q=None, return_context=False, per_page=30):
         reverse=True,
     )
 
-    paginator = Paginator(qs, per_page)
-    page_number = request.GET.get("page") or "1"
-    try:
-        page = paginator.page(page_number)
-    except PageNotAnInteger:
-        raise Http404
-    except EmptyPage:
-        raise Http404
+    paginator = CachedCountPaginator(qs, per_page, cache_key=filters_key)
+    total = paginator.count
+    timer.lap("count")
+    cursor = request.GET.get("cursor")
+    if cursor is not None:
+        # Opt-in keyset pagination, cheap at any depth
+        ordering = list(CONTENT_ITEM_ORDERING)
+        if sort == "relevance":
+            ordering.insert(0, ("rank", "rank"))
+        elif sort == "words":
+            ordering.insert(0, ("word_count", "word_count"))
+        try:
+            page = cursor_paginate(qs, ordering, per_page, cursor)
+        except InvalidCursor:
+            raise Http404
+    else:
+        page_number = request.GET.get("page") or "1"
+        try:
+            page = paginator.page(page_number)
+        except PageNotAnInteger:
+            raise Http404
+        except EmptyPage:
+            raise Http404
+    # The query that actually fetched this page, for ?_explain=1
+    page_qs = getattr(page, "queryset", page.object_list)
+    page.object_list = list(page.object_list)
+    timer.lap("results")
 
     results = []
     for obj in load_mixed_objects(page.object_list):
@@ -318,7 +403,7 @@ def search(request, q=None, return_context=False, per_page=30):
                 "obj": obj,
             }
         )
-    end = time.time()
+    timer.lap("hydrate")
 
     selected = {
         "tags": selected_tags,
@@ -338,6 +423,8 @@ def search(request, q=None, return_context=False, per_page=30):
         ),
         "from_date": from_date,
         "to_date": to_date,
+        "domain": selected_domain,
+        "min_words": selected_min_words,
     }
     # Remove empty keys
     selected = {key: value for key, value in list(selected.items()) if value}
@@ -376,6 +463,9 @@ def search(request, q=None, return_context=False, per_page=30):
     if datebits:
         title += " in %s" % (", ".join(datebits))
 
+    if selected_domain:
+        title += " from %s" % selected_domain
+
     if from_date or to_date:
         date_range = []
         if from_date:
@@ -392,8 +482,14 @@ def search(request, q=None, return_context=False, per_page=30):
     num_corrected_results = 0
     if not results and search_q and not return_context:
         suggestion = get_suggestion(search_q)
-        corrected_context = search(request, suggestion, return_context=True)
-        num_corrected_results = corrected_context["total"]
+        if suggestion and suggestion != search_q:
+            num_corrected_results = search_count(dict(filters, q=suggestion))
+        timer.lap("suggest")
+
+    explain = None
+    if request.GET.get("_explain") and request.user.is_staff:
+        explain = page_qs.explain(analyze=True, buffers=True)
+        timer.lap("explain")
 
     # Build id_filter_params for template (preserving raw values)
     id_filter_params = {}
@@ -421,9 +517,11 @@ def search(request, q=None, return_context=False, per_page=30):
         "sort": sort,
         "title": title,
         "results": results,
-        "total": paginator.count,
+        "total": total,
+        "total_is_estimate": paginator.count_is_estimate,
         "page": page,
-        "duration": end - start,
+        "timer": timer,
+        "explain": explain,
         "type_counts": type_counts,
         "tag_counts": tag_counts,
         "year_counts": year_counts,
@@ -439,10 +537,7 @@ def search(request, q=None, return_context=False, per_page=30):
         "id_filter_type_names": id_filter_type_names,
     }
 
-    if return_context:
-        return context
-    else:
-        return render(request, "search.html", context)
+    return context
 
 
 FEED_URLS = {
@@ -471,7 +566,7 @@ def type_listing(request, type_name):
             for value, label in Beat.BeatType.choices
             if value in active_types
         ]
-    return render(request, "search.html", context)
+    return render_timed(request, "search.html", context)
 
 
 def beat_type_listing(request, beat_type):
@@ -483,7 +578,7 @@ def beat_type_listing(request, beat_type):
     context = search(request, return_context=True)
     context["fixed_type"] = True
     context["feed_url"] = f"/atom/beats/{beat_type}/"
-    return render(request, "search.html", context)
+    return render_timed(request, "search.html", context)
 
 
 def tools_search_tags(request):
@@ -1,43 +1,228 @@
 from django.dispatch import receiver
-from django.db.models.signals import post_save, m2m_changed
-from django.db.models import Value, TextField
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_save,
+)
+from django.db.models import Case, Value, TextField, When
 from django.contrib.postgres.search import SearchVector
-from django.db import transaction
-from blog.models import BaseModel, Tag
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection, transaction
+from blog import jobs
+from blog.caching import bump_content_version
+from blog.models import BaseModel, ContentItem, ReindexStats, Tag
+from blog.reindex import content_models, reindex_tagged, sync_tag_ids
+from blog.triggers import search_triggers_enabled, set_search_triggers
+from guides.models import Guide
 import operator
+import weakref
 from functools import reduce
 
 
+@receiver(pre_save, sender=Tag)
+def on_tag_pre_save(sender, instance, **kwargs):
+    instance._renamed = (
+        instance.pk is not None
+        and not kwargs["raw"]
+        and Tag.objects.filter(pk=instance.pk).exclude(tag=instance.tag).exists()
+    )
+
+
 @receiver(post_save)
 def on_save(sender, **kwargs):
+    if sender is Guide:
+        # Chapters inherit draft status from their guide
+        transaction.on_commit(make_guide_chapters_updater(kwargs["instance"]))
+        return
+    if sender is Tag:
+        if getattr(kwargs["instance"], "_renamed", False):
+            # Tag names are part of every tagged item's search_document
+            tag_ids = [kwargs["instance"].pk]
+            if not settings.SEARCH_DOCUMENT_TRIGGERS:
+                transaction.on_commit(lambda: reindex_tagged(tag_ids))
+        # A renamed tag changes the cached tag facets
+        transaction.on_commit(bump_content_version)
+        return
     if not issubclass(sender, BaseModel):
         return
-    transaction.on_commit(make_updater(kwargs["instance"]))
+    mark_for_reindex(kwargs["instance"])
+
+
+@receiver(post_delete)
+def on_delete(sender, **kwargs):
+    instance = kwargs["instance"]
+    if isinstance(instance, Tag):
+        with connection.cursor() as cursor:
+            for table in [ContentItem._meta.db_table] + [
+                model._meta.db_table for model in content_models()
+            ]:
+                cursor.execute(
+                    "update {} set tag_ids = array_remove(tag_ids, %s) "
+                    "where tag_ids @> array[%s]".format(table),
+                    [instance.pk, instance.pk],
+                )
+    elif issubclass(sender, BaseModel):
+        ContentItem.objects.filter(
+            content_type=ContentItem.content_type_for(instance),
+            object_id=instance.pk,
+        ).delete()
+    else:
+        return
+    transaction.on_commit(bump_content_version)
 
 
 @receiver(m2m_changed)
 def on_m2m_changed(sender, **kwargs):
     instance = kwargs["instance"]
     model = kwargs["model"]
+    if not kwargs["action"].startswith("post_"):
+        return
     if model is Tag:
-        transaction.on_commit(make_updater(instance))
+        instance.tag_ids = sync_tag_ids(instance.__class__, [instance.pk]).get(
+            instance.pk, []
+        )
+        mark_for_reindex(instance)
     elif isinstance(instance, Tag):
-        for obj in model.objects.filter(pk__in=kwargs["pk_set"]):
-            transaction.on_commit(make_updater(obj))
-
+        pk_set = kwargs["pk_set"]
+        if pk_set is None:
+            # tag.entry_set.clear() - tag_ids still lists the tag at this point
+            pk_set = set(
+                model.objects.filter(tag_ids__contains=[instance.pk]).values_list(
+                    "pk", flat=True
+                )
+            )
+        sync_tag_ids(model, pk_set)
+        for obj in model.objects.filter(pk__in=pk_set):
+            mark_for_reindex(obj)
 
-def make_updater(instance):
-    components = instance.index_components()
-    pk = instance.pk
 
+def make_guide_chapters_updater(guide):
     def on_commit():
-        search_vectors = []
-        for weight, text in list(components.items()):
-            search_vectors.append(
-                SearchVector(Value(text, output_field=TextField()), weight=weight)
+        for chapter in guide.chapters.all():
+            ContentItem.sync(chapter)
+        bump_content_version()
+
+    return on_commit
+
+
+class PendingReindex:
+    """
+    The content objects saved or re-tagged during a transaction, keyed by
+    (model, pk) so each one is reindexed only once when it commits.
+    """
+
+    def __init__(self):
+        self.instances = {}
+        self.started = False
+
+    def __call__(self):
+        # Anything saved from here on goes in a new batch
+        self.started = True
+        reindex(self.instances.values())
+
+
+def mark_for_reindex(instance):
+    # Only a weak reference: on_commit holds the batch, so it is gone once
+    # Django drops the callback on a rollback (of a savepoint too)
+    ref = getattr(connection, "pending_reindex", None)
+    pending = ref() if ref is not None else None
+    is_new = pending is None or pending.started
+    if is_new:
+        pending = PendingReindex()
+        connection.pending_reindex = weakref.ref(pending)
+    pending.instances[(instance.__class__, instance.pk)] = instance
+    if is_new:
+        # Runs immediately if we are not in a transaction
+        transaction.on_commit(pending)
+
+
+def reindex(instances):
+    "Update search_document with one UPDATE per model, then sync ContentItem"
+    by_model = {}
+    for instance in instances:
+        # delete() clears pk - on_delete has already dealt with those
+        if instance.pk is not None:
+            by_model.setdefault(instance.__class__, []).append(instance)
+    for model, objs in by_model.items():
+        # Otherwise the database triggers have already done this
+        if settings.SEARCH_DOCUMENT_TRIGGERS:
+            pass
+        elif settings.BACKGROUND_JOBS:
+            jobs.enqueue(
+                "update_search_documents",
+                label=model._meta.label,
+                pks=[obj.pk for obj in objs],
             )
-        instance.__class__.objects.filter(pk=pk).update(
-            search_document=reduce(operator.add, search_vectors)
+        else:
+            update_search_documents(model, objs)
+        # A job copies search_document across once it has written it
+        queued = settings.BACKGROUND_JOBS and not settings.SEARCH_DOCUMENT_TRIGGERS
+        for obj in objs:
+            ContentItem.sync(obj, search_document=not queued)
+    if by_model:
+        bump_content_version()
+
+
+def update_search_documents(model, objs):
+    """
+    Rewrite search_document for objs whose index_components() have changed,
+    returning their primary keys
+    """
+    stored = dict(
+        model.objects.filter(pk__in=[obj.pk for obj in objs]).values_list(
+            "pk", "search_document_hash"
+        )
+    )
+    changed = {}
+    for obj in objs:
+        components = obj.index_components()
+        digest = model.components_hash(components)
+        if stored.get(obj.pk) != digest:
+            changed[obj.pk] = (components, digest)
+    if changed:
+        model.objects.filter(pk__in=changed).update(
+            search_document=Case(
+                *[
+                    When(pk=pk, then=search_vector(components))
+                    for pk, (components, _) in changed.items()
+                ]
+            ),
+            search_document_hash=Case(
+                *[
+                    When(pk=pk, then=Value(digest))
+                    for pk, (_, digest) in changed.items()
+                ]
+            ),
         )
+    ReindexStats.record(
+        model._meta.model_name, written=len(changed), skipped=len(objs) - len(changed)
+    )
+    return list(changed)
 
-    return on_commit
+
+def search_vector(components):
+    return reduce(
+        operator.add,
+        [
+            SearchVector(Value(text, output_field=TextField()), weight=weight)
+            for weight, text in components.items()
+        ],
+    )
+
+
+@receiver(post_migrate)
+def on_migrate(sender, **kwargs):
+    if sender.name != "blog":
+        # Sent for every app once all migrations have run: once is enough
+        return
+    # The content version lives in the "shared" DatabaseCache table
+    call_command("createcachetable", database=kwargs["using"], verbosity=0)
+    # Migrations (and test database flushes) can rewrite content wholesale
+    bump_content_version()
+    enabled = search_triggers_enabled()
+    # Missing if migrated to before 0052
+    if enabled and set(enabled.values()) != {settings.SEARCH_DOCUMENT_TRIGGERS}:
+        set_search_triggers(settings.SEARCH_DOCUMENT_TRIGGERS)
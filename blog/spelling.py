@@ -0,0 +1,237 @@
+"""
+Symmetric-delete (SymSpell-style) spelling suggestions for search.
+
+build_index() writes a sorted, memory-mappable index of the words used
+across the blog. Every gunicorn worker maps the same file, so the index
+is shared between processes and lookups are a handful of binary searches.
+
+The build_spelling_index command (run on release) also keeps a copy in
+the database, which fetch_spelling_index writes to disk as each web
+dyno starts - files written during release never reach the web dynos.
+
+File layout, all integers little-endian:
+
+    header   b"SYMS", max_distance, prefix_length, record count (uint32s)
+    offsets  one uint32 per record, relative to the start of the records
+    records  b"key\\tword:count,word:count\\n", sorted by key
+
+A record's key is the first prefix_length characters of a word, or one of
+that prefix's deletes up to max_distance characters shorter.
+"""
+
+import itertools
+import logging
+import mmap
+import os
+import re
+import struct
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"SYMS"
+HEADER = struct.Struct("<4sIII")
+OFFSET = struct.Struct("<I")
+MAX_DISTANCE = 2
+PREFIX_LENGTH = 7
+
+WORD_RE = re.compile(r"[a-z][a-z0-9]+")
+
+
+def words_in(text):
+    return WORD_RE.findall(text.lower())
+
+
+def deletes(word, max_distance):
+    "All strings made by deleting up to max_distance characters from word"
+    found = set()
+    edits = {word}
+    for _ in range(max_distance):
+        edits = {
+            edit[:i] + edit[i + 1 :]
+            for edit in edits
+            if len(edit) > 1
+            for i in range(len(edit))
+        }
+        found.update(edits)
+    return found
+
+
+def build_index(
+    word_counts, path, max_distance=MAX_DISTANCE, prefix_length=PREFIX_LENGTH
+):
+    """
+    Write an index for a {word: count} dictionary to path. The file is
+    written alongside and renamed into place, so running workers keep
+    reading the old index until they next reopen it.
+    """
+    keys = {}
+    for word, count in word_counts.items():
+        prefix = word[:prefix_length]
+        for key in {prefix} | deletes(prefix, max_distance):
+            keys.setdefault(key, []).append((word, count))
+    records = []
+    for key in sorted(keys):
+        entries = sorted(keys[key], key=lambda pair: (-pair[1], pair[0]))
+        payload = ",".join("{}:{}".format(word, count) for word, count in entries)
+        records.append("{}\t{}\n".format(key, payload).encode("utf-8"))
+    offsets = itertools.accumulate((len(record) for record in records), initial=0)
+
+    def write(fp):
+        fp.write(HEADER.pack(MAGIC, max_distance, prefix_length, len(records)))
+        for offset, _ in zip(offsets, records):
+            fp.write(OFFSET.pack(offset))
+        for record in records:
+            fp.write(record)
+
+    _write_atomically(path, write)
+    return len(records)
+
+
+def install_index(data, path):
+    """
+    Write an index built elsewhere, e.g. the bytes stored by the
+    build_spelling_index command, to path
+    """
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("Not a spelling index")
+    _write_atomically(path, lambda fp: fp.write(data))
+
+
+def _write_atomically(path, write):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".spelling-")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            write(fp)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Leave any existing index as it was, and no partial file behind
+        os.unlink(tmp_path)
+        raise
+
+
+class SpellingIndex:
+    def __init__(self, path):
+        with open(path, "rb") as fp:
+            self.mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.max_distance, self.prefix_length, self.count = HEADER.unpack_from(
+            self.mm, 0
+        )
+        if magic != MAGIC:
+            raise ValueError("{} is not a spelling index".format(path))
+        self.records_start = HEADER.size + OFFSET.size * self.count
+
+    def _record(self, i):
+        start = (
+            self.records_start
+            + OFFSET.unpack_from(self.mm, HEADER.size + OFFSET.size * i)[0]
+        )
+        end = self.mm.find(b"\n", start)
+        key, _, payload = self.mm[start:end].partition(b"\t")
+        return key, payload
+
+    def _lookup(self, key):
+        "Binary search for key, returning a list of (word, count)"
+        key = key.encode("utf-8")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_key, payload = self._record(mid)
+            if mid_key < key:
+                lo = mid + 1
+            elif mid_key > key:
+                hi = mid
+            else:
+                return [
+                    (word, int(count))
+                    for word, _, count in (
+                        entry.decode("utf-8").rpartition(":")
+                        for entry in payload.split(b",")
+                    )
+                ]
+        return []
+
+    def is_known(self, word):
+        return any(
+            known == word for known, _ in self._lookup(word[: self.prefix_length])
+        )
+
+    def correction(self, word):
+        """
+        The closest known word to word, preferring the most frequent word
+        at the smallest edit distance. Returns None if nothing is close.
+        """
+        prefix = word[: self.prefix_length]
+        best = None
+        seen = set()
+        for key in {prefix} | deletes(prefix, self.max_distance):
+            for candidate, count in self._lookup(key):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if abs(len(candidate) - len(word)) > self.max_distance:
+                    continue
+                distance = edit_distance(word, candidate, self.max_distance)
+                if distance is None:
+                    continue
+                rank = (distance, -count, candidate)
+                if best is None or rank < best:
+                    best = rank
+        return best[2] if best else None
+
+
+def edit_distance(a, b, max_distance):
+    """
+    Optimal string alignment distance between a and b, or None if it is
+    greater than max_distance.
+    """
+    if a == b:
+        return 0
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(
+                previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return None
+        previous2, previous = previous, current
+    return previous[-1] if previous[-1] <= max_distance else None
+
+
+_index = None
+_index_key = None
+_missing_logged = set()
+
+
+def get_index(path):
+    """
+    The worker's memory-mapped index, reopened if the file has been rebuilt
+    since. Returns None, logging an error once per process, if there is no
+    index at path.
+    """
+    global _index, _index_key
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except FileNotFoundError:
+        if path not in _missing_logged:
+            _missing_logged.add(path)
+            logger.error(
+                "No spelling index at %s, so no search suggestions - "
+                "run manage.py fetch_spelling_index",
+                path,
+            )
+        return None
+    if _index is None or key != _index_key:
+        _index = SpellingIndex(path)
+        _index_key = key
+    return _index
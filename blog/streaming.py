@@ -0,0 +1,82 @@
+"""
+Streaming responses for pages with long blog_mixed_list listings, such as
+tag and month archives with ?size=1000.
+
+    return render_streaming(request, "archive_tag.html", context)
+
+The page is rendered with each {% blog_mixed_list %} left empty apart
+from a marker. Everything up to the first marker is sent straight away,
+then that list's items CHUNK_SIZE at a time, and so on. The HTML is the
+same as render() would have produced.
+"""
+
+import secrets
+
+from django.http import StreamingHttpResponse
+from django.shortcuts import render
+from django.template.loader import get_template, render_to_string
+
+from blog.caching import ItemFragments
+
+CHUNK_SIZE = 50
+# Pages listing fewer items than this are not worth streaming
+STREAM_MIN_ITEMS = 200
+
+LIST_FLAGS = ("showdate", "year_headers", "day_headers", "day_links")
+
+
+class StreamedLists:
+    "The blog_mixed_list items left out of a page, see render_streaming()"
+
+    def __init__(self):
+        self.token = secrets.token_hex(8)
+        self.lists = []
+
+    def add(self, context, items):
+        "Record a list's items and flags, returning the marker to output"
+        flags = {name: context.get(name) for name in LIST_FLAGS}
+        self.lists.append((flags, items))
+        return self.marker(len(self.lists) - 1)
+
+    def marker(self, index):
+        # Nothing that autoescaping would change
+        return "stream-{}-{}".format(self.token, index)
+
+    def stream(self, page, request):
+        "Yield page with each marked list's items rendered in chunks"
+        template = get_template("includes/blog_mixed_list.html")
+        for index, (flags, items) in enumerate(self.lists):
+            marker = self.marker(index)
+            # The template outputs the marker either side of its loop
+            before, page = page.split(marker * 2, 1)
+            yield before
+            for start in range(0, len(items), CHUNK_SIZE):
+                chunk = items[start : start + CHUNK_SIZE]
+                html = template.render(
+                    dict(
+                        flags,
+                        items=chunk,
+                        stream_marker=marker,
+                        item_fragments=ItemFragments(
+                            chunk, "date" if flags["showdate"] else "nodate"
+                        ),
+                    ),
+                    request,
+                )
+                yield html.split(marker)[1]
+        yield page
+
+
+def render_streaming(request, template_name, context):
+    """
+    render(), except that a page with at least STREAM_MIN_ITEMS
+    context["items"] is sent as a StreamingHttpResponse, rendering its
+    list as it goes
+    """
+    if len(context["items"]) < STREAM_MIN_ITEMS:
+        return render(request, template_name, context)
+    streamed_lists = StreamedLists()
+    page = render_to_string(
+        template_name, dict(context, streamed_lists=streamed_lists), request
+    )
+    return StreamingHttpResponse(streamed_lists.stream(page, request))
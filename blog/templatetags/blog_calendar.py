@@ -3,6 +3,7 @@ from django import template
 register = template.Library()
 
 from blog.models import Entry, Photo, Quotation, Blogmark, Photoset, Note, Beat
+from blog.concurrency import run_in_parallel
 from guides.models import Chapter
 import datetime, copy
 
@@ -91,6 +92,7 @@ def calendar_context(date):
     for day in list(day_things.keys()):
         if day.month != date.month:
             day_things[day]["display"] = False
+    querysets = []
     for name, model, score, created_lookup in MODELS_TO_CHECK:
         lookup_args = {
             created_lookup + "__month": date.month,
@@ -100,14 +102,23 @@ def calendar_context(date):
             lookup_args["is_draft"] = False
         if model == Chapter:
             lookup_args["guide__is_draft"] = False
-        for item in model.objects.filter(**lookup_args):
+        querysets.append(model.objects.filter(**lookup_args))
+    # Also check for beats - they make days linkable but don't affect the score/colour
+    querysets.append(
+        Beat.objects.filter(
+            created__month=date.month, created__year=date.year, is_draft=False
+        )
+    )
+    querysets.append(Entry.objects.all().order_by("created")[:1])
+    *model_items, beats, first_entry = run_in_parallel(*querysets)
+    for (name, model, score, created_lookup), items in zip(
+        MODELS_TO_CHECK, model_items
+    ):
+        for item in items:
             day = day_things[attribute_lookup(item, created_lookup).date()]
             day[name].append(item)
             day["populated"] = True
-    # Also check for beats - they make days linkable but don't affect the score/colour
-    for item in Beat.objects.filter(
-        created__month=date.month, created__year=date.year, is_draft=False
-    ):
+    for item in beats:
         day = day_things[item.created.date()]
         day["beats"].append(item)
         day["populated"] = True
@@ -133,7 +144,7 @@ def calendar_context(date):
     # Find next and previous months
     # WARNING: This makes an assumption that I posted at least one thing every
     # month since I started.
-    first_month = Entry.objects.all().order_by("created")[0].created.date()
+    first_month = first_entry[0].created.date()
     if get_next_month(first_month) <= date:
         previous_month = get_previous_month(date)
     else:
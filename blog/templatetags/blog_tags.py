@@ -1,30 +1,95 @@
 from django import template
 from django.utils.safestring import mark_safe
-from markdown import markdown
+from blog.caching import ItemFragments
+from blog.rendering import render_markdown
 
 register = template.Library()
 
 
+def with_headers(items):
+    """
+    Copies of the {type, obj} items, with new_year and new_day set on those
+    that start a new year or day - for year_headers and day_headers
+    """
+    rows = []
+    for item in items:
+        created = item["obj"].created
+        previous = rows[-1]["obj"].created if rows else None
+        rows.append(
+            dict(
+                item,
+                new_year=previous is None or created.year != previous.year,
+                new_day=previous is None or created.date() != previous.date(),
+            )
+        )
+    return rows
+
+
+def _mixed_list(context, items, values):
+    """
+    Context for blog_mixed_list.html - or, if the page is being streamed by
+    blog.streaming.render_streaming(), a marker for where its items go
+    """
+    items = with_headers(items)
+    context.update(values)
+    streamed_lists = context.get("streamed_lists")
+    if streamed_lists is not None:
+        context.update(
+            {"items": [], "stream_marker": streamed_lists.add(context, items)}
+        )
+    else:
+        context.update(
+            {
+                "items": items,
+                "item_fragments": ItemFragments(
+                    items, "date" if context["showdate"] else "nodate"
+                ),
+            }
+        )
+    return context
+
+
 @register.inclusion_tag("includes/blog_mixed_list.html", takes_context=True)
 def blog_mixed_list(context, items):
-    context.update({"items": items, "showdate": False})
-    return context
+    return _mixed_list(context, items, {"showdate": False})
 
 
 @register.inclusion_tag("includes/blog_mixed_list.html", takes_context=True)
 def blog_mixed_list_with_dates(
     context, items, year_headers=False, day_headers=False, day_links=False
 ):
-    context.update(
+    return _mixed_list(
+        context,
+        items,
         {
-            "items": items,
             "showdate": not day_headers,
             "year_headers": year_headers,
             "day_headers": day_headers,
             "day_links": day_links,
-        }
+        },
     )
-    return context
+
+
+class ItemFragmentNode(template.Node):
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+
+    def render(self, context):
+        fragments = context.get("item_fragments")
+        if fragments is None:
+            return self.nodelist.render(context)
+        return fragments.get(context["item"], lambda: self.nodelist.render(context))
+
+
+@register.tag
+def item_fragment(parser, token):
+    """
+    {% item_fragment %}...{% enditem_fragment %} caches the markup for the
+    current item of blog_mixed_list.html, using its item_fragments
+    """
+    nodelist = parser.parse(("enditem_fragment",))
+    parser.delete_first_token()
+    return ItemFragmentNode(nodelist)
 
 
 @register.inclusion_tag("includes/comments_list.html", takes_context=True)
@@ -50,11 +115,17 @@ def comments_list_with_headers(context, comments):
 
 
 @register.simple_tag(takes_context=True)
-def page_href(context, page):
+def page_href(context, page=None, cursor=None):
     query_dict = context["request"].GET.copy()
-    if page == 1 and "page" in query_dict:
-        del query_dict["page"]
-    query_dict["page"] = str(page)
+    if cursor is not None:
+        # Keyset pagination: the cursor replaces the page number
+        query_dict.pop("page", None)
+        query_dict["cursor"] = cursor
+    else:
+        query_dict.pop("cursor", None)
+        if page == 1 and "page" in query_dict:
+            del query_dict["page"]
+        query_dict["page"] = str(page)
     if context.get("fixed_type") and "type" in query_dict:
         del query_dict["type"]
     return "?" + query_dict.urlencode()
@@ -105,7 +176,7 @@ def markdownify(text):
     """
     Convert Markdown text to HTML.
     """
-    return mark_safe(markdown(text))
+    return mark_safe(render_markdown(text))
 
 
 @register.filter
@@ -7,6 +7,8 @@ import datetime
 
 from django.utils import timezone
 
+from blog.caching import cached_fragment
+
 register = template.Library()
 entry_stripper = re.compile("^<entry>(.*?)</entry>$", re.DOTALL)
 _script_style_re = re.compile(
@@ -49,16 +51,20 @@ class XhtmlString(object):
 
 @register.filter
 def resize_images_to_fit_width(value, arg):
-    max_width = int(arg)
     x = XhtmlString(value)
-    for img in x.et.findall(".//img"):
+    do_resize_images(x.et, int(arg))
+    return x
+
+
+def do_resize_images(et, max_width):
+    for img in et.findall(".//img"):
         width = int(img.get("width", 0))
         height = int(img.get("height", 0))
         if width > max_width:
             # Scale down
             img.set("width", str(max_width))
             img.set("height", str(int(float(max_width) / width * height)))
-    return x
+    return et
 
 
 xhtml_endtag_fragment = re.compile(r"\s*/>")
@@ -79,15 +85,20 @@ def split_cutoff(xhtml):
 @register.filter
 def remove_context_paragraph(xhtml):
     x = XhtmlString(xhtml)
-    p = x.et.find("p")
+    do_remove_context_paragraph(x.et)
+    return x
+
+
+def do_remove_context_paragraph(et):
+    p = et.find("p")
     if p is None:
-        return x
+        return et
     xhtml = ElementTree.tostring(p, "unicode")
     if xhtml.startswith("<p><em>My answer to") or xhtml.startswith(
         '<p class="context">'
     ):
-        x.et.remove(p)
-    return x
+        et.remove(p)
+    return et
 
 
 @register.filter
@@ -136,15 +147,9 @@ def first_three_paragraphs(html):
 @register.simple_tag
 def chapter_excerpt(chapter):
     """Render first three paragraphs of a chapter, with word count appended inline to the last paragraph."""
-    body_rendered = chapter.body_rendered()
-    try:
-        html = str(xhtml2html(first_three_paragraphs(body_rendered)))
-    except ElementTree.ParseError:
-        html = str(body_rendered)
+    html = str(chapter.excerpt_rendered())
     if chapter.multi_paragraph():
-        from django.template.defaultfilters import wordcount
-
-        count = int(wordcount(chapter.body))
+        count = chapter.words()
         url = conditional_escape(chapter.get_absolute_url())
         suffix = (
             f' <span style="font-size: 0.9em">'
@@ -178,10 +183,15 @@ def ends_with_punctuation(value):
 @register.filter
 def strip_p_ids(xhtml):
     x = XhtmlString(xhtml)
-    for p in x.et.findall(".//p"):
+    do_strip_p_ids(x.et)
+    return x
+
+
+def do_strip_p_ids(et):
+    for p in et.findall(".//p"):
         if "id" in p.attrib:
             del p.attrib["id"]
-    return x
+    return et
 
 
 @register.filter
@@ -240,9 +250,12 @@ def strip_wrapping_p(xhtml):
     return mark_safe(xhtml)
 
 
+TYPOGRAPHY_SKIP_TAGS = ("pre", "code", "script", "style")
+
+
 def do_typography(et):
     # Designed to be called recursively on ElementTree objects
-    if et.tag not in ("pre", "code", "script", "style"):
+    if et.tag not in TYPOGRAPHY_SKIP_TAGS:
         # Don't do et.text or children for those tags; just do et.tail
         if et.text:
             et.text = do_typography_string(et.text)
@@ -293,6 +306,150 @@ def do_typography_string(s):
     return s
 
 
+def do_first_paragraph(et):
+    "Tree version of first_paragraph: a new root holding just the first <p>"
+    root = ElementTree.Element("entry")
+    p = et.find("p")
+    if p is None:
+        p = ElementTree.SubElement(root, "p")
+        p.text = et.text
+        p.extend(list(et))
+    else:
+        root.append(p)
+    return root
+
+
+def do_text_transforms(et, transforms):
+    """
+    Apply (skip_tags, fn) pairs to every text and tail string in one walk.
+    Like do_typography, a transform leaves the text and children of its
+    skip_tags alone but still handles their tails.
+    """
+    inner = [t for t in transforms if et.tag not in t[0]]
+    if inner:
+        if et.text:
+            et.text = _apply_text_transforms(inner, et.text)
+        for child in et:
+            do_text_transforms(child, inner)
+    if et.tail:
+        et.tail = _apply_text_transforms(transforms, et.tail)
+
+
+def _apply_text_transforms(transforms, s):
+    for _, fn in transforms:
+        s = fn(s)
+    return s
+
+
+class XhtmlPipeline:
+    """
+    A chain of the filters above that parses the body once, runs each step
+    against the same tree - with adjacent text steps (typography,
+    break_up_long_words) fused into a single walk - and serializes once.
+
+        XhtmlPipeline("remove_context_paragraph", "typography")(body)
+
+    returns the same HTML as
+
+        body|xhtml|remove_context_paragraph|typography|xhtml2html
+
+    Steps taking an argument are given as tuples, e.g.
+    ("resize_images_to_fit_width", 450).
+    """
+
+    string_steps = {"split_cutoff": split_cutoff}
+    tree_steps = {
+        "remove_context_paragraph": do_remove_context_paragraph,
+        "first_paragraph": do_first_paragraph,
+        "resize_images_to_fit_width": lambda et, width: do_resize_images(
+            et, int(width)
+        ),
+        "strip_p_ids": do_strip_p_ids,
+    }
+    text_steps = {
+        "typography": lambda: (TYPOGRAPHY_SKIP_TAGS, do_typography_string),
+        "break_up_long_words": lambda length: (
+            (),
+            lambda s: do_break_long_words_string(s, int(length)),
+        ),
+    }
+
+    def __init__(self, *steps):
+        self.steps = steps
+        self.string_fns = []
+        # Each stage is a tree transform, or a list of fused text transforms
+        self.stages = []
+        for step in steps:
+            name, *args = (step,) if isinstance(step, str) else step
+            if name in self.string_steps:
+                if self.stages:
+                    raise ValueError("{} must come before tree steps".format(name))
+                self.string_fns.append(self.string_steps[name])
+            elif name in self.tree_steps:
+                fn = self.tree_steps[name]
+                self.stages.append(lambda et, fn=fn, args=args: fn(et, *args))
+            elif name in self.text_steps:
+                transform = self.text_steps[name](*args)
+                if self.stages and isinstance(self.stages[-1], list):
+                    self.stages[-1].append(transform)
+                else:
+                    self.stages.append([transform])
+            else:
+                raise ValueError("Unknown XHTML pipeline step {!r}".format(name))
+
+    def __repr__(self):
+        return "XhtmlPipeline{!r}".format(self.steps)
+
+    def __call__(self, body):
+        for fn in self.string_fns:
+            body = fn(body)
+        et = ElementTree.fromstring("<entry>%s</entry>" % body)
+        for stage in self.stages:
+            if isinstance(stage, list):
+                do_text_transforms(et, stage)
+            else:
+                et = stage(et)
+        s = ElementTree.tostring(et, "unicode")
+        if "<script" in s or "<style" in s:
+            s = _script_style_re.sub(_unescape_script_style, s)
+        # "<entry>...</entry>", or "<entry />" if empty
+        s = s[len("<entry>") : -len("</entry>")] if s.startswith("<entry>") else ""
+        return xhtml_endtag_fragment.sub(">", s.replace("&apos;", "&#39;"))
+
+
+# Bump when any step used below changes its output
+XHTML_PIPELINE_VERSION = 2
+
+XHTML_PIPELINES = {
+    # Homepage, archive and search listings
+    "summary": XhtmlPipeline(
+        "split_cutoff", "remove_context_paragraph", "first_paragraph", "typography"
+    ),
+    # Entry pages
+    "body": XhtmlPipeline(("resize_images_to_fit_width", 450), "typography"),
+    # Social card descriptions, before striptags
+    "card": XhtmlPipeline("remove_context_paragraph", "typography"),
+}
+# The pipelines templates run through {% xhtml_pipeline %}, which records
+# their cache hits and misses. Entry.render() runs "summary" and "body"
+# directly when an entry is saved, so those never reach the cache.
+TEMPLATE_XHTML_PIPELINES = ("card",)
+
+
+@register.simple_tag
+def xhtml_pipeline(body, name):
+    """
+    {% xhtml_pipeline entry.body "summary" %} - the same output as the
+    equivalent chain of filters in XHTML_PIPELINES, cached by body hash
+    so each body is only parsed once.
+    """
+    pipeline = XHTML_PIPELINES[name]
+    html = cached_fragment(
+        "xhtml-" + name, XHTML_PIPELINE_VERSION, body, lambda: pipeline(body)
+    )
+    return mark_safe(html)
+
+
 NUMBERS = "zero one two three four five six seven eight nine".split()
 number_re = re.compile(r"\d+")
 
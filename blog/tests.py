@@ -1,5 +1,6 @@
 import re
 
+from django.core.paginator import EmptyPage
 from django.test import TransactionTestCase
 from django.contrib.admin.models import LogEntry
 from django.contrib.auth.models import User
@@ -21,7 +22,7 @@ from .factories import (
     SponsorMessageFactory,
 )
 from guides.factories import ChapterFactory, GuideFactory, GuideSectionFactory
-from blog.models import Tag, PreviousTagName, TagMerge
+from blog.models import ContentItem, Tag, PreviousTagName, TagMerge
 from guides.models import ChapterChange, GuideSection
 from django.utils import timezone
 import datetime
@@ -42,8 +43,10 @@ class HomepageWeightedBudgetTests(TransactionTestCase):
     """
 
     def _homepage_items(self):
-        response = self.client.get("/")
-        return response.context["items"]
+        from blog.views import homepage_items
+
+        self.assertEqual(self.client.get("/").status_code, 200)
+        return homepage_items()
 
     def test_bare_beats_cost_0_2(self):
         """With budget=30, we can fit 30 entries + many bare beats (0.2 each).
@@ -1274,6 +1277,54 @@ class MergeTagsTests(TransactionTestCase):
         self.assertContains(response, "source-tag")
         self.assertContains(response, "dest-tag")
 
+    def test_merge_covers_every_type_and_reindexes(self):
+        """Beats and chapters are merged too, and search documents updated."""
+        source_tag = Tag.objects.create(tag="mergesource")
+        dest_tag = Tag.objects.create(tag="mergedest")
+        beat = BeatFactory()
+        beat.tags.add(source_tag)
+        chapter = ChapterFactory()
+        chapter.tags.add(source_tag, dest_tag)
+
+        self.client.login(username="staff", password="password")
+        self.client.post(
+            "/admin/merge-tags/",
+            {"source": "mergesource", "destination": "mergedest", "confirm": "yes"},
+        )
+        for obj in (beat, chapter):
+            obj.refresh_from_db()
+            self.assertEqual(list(obj.tags.all()), [dest_tag])
+            self.assertEqual(obj.tag_ids, [dest_tag.pk])
+            self.assertIn("'mergedest':", obj.search_document)
+            self.assertNotIn("'mergesourc':", obj.search_document)
+        merge = TagMerge.objects.get()
+        self.assertEqual(merge.details["beats"]["added"], [beat.pk])
+        self.assertEqual(merge.details["chapters"]["already_tagged"], [chapter.pk])
+        self.assertEqual(
+            ContentItem.objects.get(content_type="beat").tag_ids, [dest_tag.pk]
+        )
+
+    def test_merge_ignores_stale_tag_ids(self):
+        """The through table decides what gets merged, not tag_ids."""
+        from blog.models import Entry
+
+        source_tag = Tag.objects.create(tag="stalesource")
+        dest_tag = Tag.objects.create(tag="staledest")
+        entry = EntryFactory()
+        entry.tags.add(source_tag, dest_tag)
+        Entry.objects.filter(pk=entry.pk).update(tag_ids=[])
+
+        self.client.login(username="staff", password="password")
+        self.client.post(
+            "/admin/merge-tags/",
+            {"source": "stalesource", "destination": "staledest", "confirm": "yes"},
+        )
+        entry.refresh_from_db()
+        self.assertEqual(list(entry.tags.all()), [dest_tag])
+        self.assertEqual(entry.tag_ids, [dest_tag.pk])
+        merge = TagMerge.objects.get()
+        self.assertEqual(merge.details["entries"]["already_tagged"], [entry.pk])
+
 
 class AdminAutosaveTests(TransactionTestCase):
     def setUp(self):
@@ -2219,6 +2270,1766 @@ class BeatTypeFacetTests(TransactionTestCase):
         self.assertContains(response, "TIL beat")
 
 
+class SearchFacetTests(TransactionTestCase):
+    """Facet counts on /search/ are computed by a single GROUPING SETS query."""
+
+    def _make_content(self):
+        python = Tag.objects.create(tag="python")
+        django = Tag.objects.create(tag="django")
+        created = datetime.datetime(2024, 3, 5, tzinfo=datetime.timezone.utc)
+        entry = EntryFactory(title="Facet entry", created=created)
+        entry.tags.add(python, django)
+        blogmark = BlogmarkFactory(created=created.replace(month=4))
+        blogmark.tags.add(python)
+        QuotationFactory(created=created.replace(year=2023))
+        NoteFactory(created=created)
+        BeatFactory(beat_type="release", created=created)
+        BeatFactory(beat_type="til", created=created)
+        ChapterFactory(
+            guide=GuideFactory(is_draft=False), is_draft=False, created=created
+        )
+
+    def test_facet_counts(self):
+        self._make_content()
+        response = self.client.get("/search/?q=&year=2024")
+        counts = {t["type"]: t["n"] for t in response.context["type_counts"]}
+        self.assertEqual(
+            counts,
+            {
+                "entry": 1,
+                "blogmark": 1,
+                "note": 1,
+                "beat:release": 1,
+                "beat:til": 1,
+                "chapter": 1,
+            },
+        )
+        self.assertEqual(
+            response.context["tag_counts"],
+            [{"tag": "python", "n": 2}, {"tag": "django", "n": 1}],
+        )
+        self.assertEqual(
+            [(t["year"].year, t["n"]) for t in response.context["year_counts"]],
+            [(2024, 6)],
+        )
+        self.assertEqual(
+            [(t["month"].month, t["n"]) for t in response.context["month_counts"]],
+            [(3, 5), (4, 1)],
+        )
+
+    def test_beat_type_counts_only_for_type_beat(self):
+        self._make_content()
+        response = self.client.get("/search/?q=")
+        self.assertEqual(response.context["beat_type_counts"], [])
+        self.assertEqual(response.context["month_counts"], [])
+        response = self.client.get("/search/?type=beat")
+        self.assertEqual(
+            sorted(
+                (t["beat_type"], t["n"]) for t in response.context["beat_type_counts"]
+            ),
+            [("release", 1), ("til", 1)],
+        )
+
+    def test_facets_are_one_query(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self._make_content()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/search/?q=&tag=python")
+        self.assertEqual(response.status_code, 200)
+        content_queries = [
+            q for q in ctx.captured_queries if "blog_contentitem" in q["sql"]
+        ]
+        # Facets, paginator count and the page of results
+        self.assertEqual(len(content_queries), 3)
+        self.assertEqual(
+            len([q for q in content_queries if "GROUPING SETS" in q["sql"].upper()]), 1
+        )
+
+
+class SearchCacheTests(TransactionTestCase):
+    """Facets and counts are cached until content changes."""
+
+    def _content_queries(self, url):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, [
+            q["sql"] for q in ctx.captured_queries if "blog_contentitem" in q["sql"]
+        ]
+
+    def test_second_page_skips_aggregates(self):
+        for i in range(3):
+            EntryFactory(title="Cached entry {}".format(i))
+        self._content_queries("/search/?q=cached")
+        response, queries = self._content_queries("/search/?q=cached&page=1")
+        # Only the page of results itself
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(response.context["total"], 3)
+        self.assertEqual(response.context["type_counts"][0]["n"], 3)
+
+    def test_save_invalidates_cache(self):
+        EntryFactory(title="Cached entry")
+        response, _ = self._content_queries("/entries/")
+        self.assertEqual(response.context["total"], 1)
+        EntryFactory(title="Another entry")
+        response, queries = self._content_queries("/entries/")
+        self.assertEqual(response.context["total"], 2)
+        self.assertEqual(len(queries), 3)
+
+    def test_tag_change_invalidates_tag_archive_count(self):
+        tag = Tag.objects.create(tag="cachedtag")
+        EntryFactory().tags.add(tag)
+        response = self.client.get("/tags/cachedtag/")
+        self.assertEqual(response.context["total"], 1)
+        BlogmarkFactory().tags.add(tag)
+        response = self.client.get("/tags/cachedtag/")
+        self.assertEqual(response.context["total"], 2)
+
+    def test_version_shared_between_processes(self):
+        from django.core.cache.backends.db import DatabaseCache
+
+        from blog.caching import CONTENT_VERSION_KEY, content_version
+
+        version = content_version()
+        # Another process has its own cache instance on the same table
+        other = DatabaseCache("blog_shared_cache", {})
+        self.assertEqual(other.get(CONTENT_VERSION_KEY), version)
+        other.set(CONTENT_VERSION_KEY, version + 1, None)
+        self.assertEqual(content_version(), version + 1)
+
+    def test_bumped_version_never_expires(self):
+        from django.core.cache import caches
+        from django.db import connection
+
+        from blog.caching import (
+            CONTENT_VERSION_KEY,
+            bump_content_version,
+            content_version,
+        )
+
+        version = content_version()
+        bump_content_version()
+        self.assertNotEqual(content_version(), version)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "select expires from blog_shared_cache where cache_key = %s",
+                [caches["shared"].make_key(CONTENT_VERSION_KEY)],
+            )
+            (expires,) = cursor.fetchone()
+        self.assertEqual(expires.year, 9999)
+
+
+class CursorPaginationTests(TransactionTestCase):
+    """Opt-in ?cursor= keyset pagination for tag archives and search."""
+
+    def setUp(self):
+        self.tag = Tag.objects.create(tag="cursortag")
+        created = datetime.datetime(
+            2024, 1, 1, 12, 0, 0, 123456, tzinfo=datetime.timezone.utc
+        )
+        self.items = []
+        for i, factory in enumerate(
+            (EntryFactory, BlogmarkFactory, EntryFactory, NoteFactory, EntryFactory)
+        ):
+            # Two items share a timestamp to exercise the tie-breakers
+            obj = factory(created=created - timedelta(days=i // 2 * 2))
+            obj.tags.add(self.tag)
+            self.items.append(obj)
+
+    def _walk(self, url):
+        seen = []
+        pages = 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            page = response.context["page"]
+            seen.extend(
+                (item["type"], item["obj"].pk) for item in response.context["items"]
+            )
+            url = None
+            if page.has_next():
+                url = "/tags/cursortag/?size=2&cursor=" + page.next_cursor
+            pages += 1
+        return seen, pages
+
+    def test_walk_tag_archive(self):
+        seen, pages = self._walk("/tags/cursortag/?size=2&cursor=")
+        self.assertEqual(pages, 3)
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
+        # Same order as page-number pagination
+        response = self.client.get("/tags/cursortag/?size=5")
+        self.assertEqual(
+            seen,
+            [(item["type"], item["obj"].pk) for item in response.context["items"]],
+        )
+
+    def test_previous_cursor(self):
+        response = self.client.get("/tags/cursortag/?size=2&cursor=")
+        first_page = [item["obj"].pk for item in response.context["items"]]
+        self.assertFalse(response.context["page"].has_previous())
+        next_cursor = response.context["page"].next_cursor
+        response = self.client.get("/tags/cursortag/?size=2&cursor=" + next_cursor)
+        page = response.context["page"]
+        self.assertTrue(page.has_previous())
+        self.assertContains(response, "cursor=" + page.next_cursor)
+        response = self.client.get(
+            "/tags/cursortag/?size=2&cursor=" + page.previous_cursor
+        )
+        self.assertEqual(
+            [item["obj"].pk for item in response.context["items"]], first_page
+        )
+
+    def test_invalid_cursor_404s(self):
+        response = self.client.get("/tags/cursortag/?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get("/search/?q=&tag=cursortag&cursor=e30")
+        self.assertEqual(response.status_code, 404)
+
+    def test_search_cursor(self):
+        response = self.client.get("/search/?tag=cursortag&cursor=")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["results"]), 5)
+        self.assertEqual(response.context["total"], 5)
+        self.assertFalse(response.context["page"].has_next())
+
+    def test_page_numbers_still_work(self):
+        response = self.client.get("/tags/cursortag/?size=2&page=3")
+        self.assertEqual(len(response.context["items"]), 1)
+        self.assertContains(response, "page 3 / 3")
+
+
+class EstimatedCountTests(TransactionTestCase):
+    """Counts above EXACT_COUNT_LIMIT come from the query planner."""
+
+    def setUp(self):
+        tag = Tag.objects.create(tag="estimated")
+        for i in range(4):
+            EntryFactory(title="Estimated entry {}".format(i)).tags.add(tag)
+
+    def test_exact_below_limit(self):
+        response = self.client.get("/search/?tag=estimated")
+        self.assertEqual(response.context["total"], 4)
+        self.assertFalse(response.context["total_is_estimate"])
+        self.assertContains(response, "<strong>4 results</strong>", html=False)
+
+    def test_estimate_above_limit(self):
+        with self.settings(EXACT_COUNT_LIMIT=2):
+            response = self.client.get("/search/?tag=estimated")
+        self.assertTrue(response.context["total_is_estimate"])
+        # Never less than the rows we know exist
+        self.assertGreaterEqual(response.context["total"], 3)
+        self.assertContains(response, "about ")
+
+    def test_tag_archive_estimate(self):
+        with self.settings(EXACT_COUNT_LIMIT=2):
+            response = self.client.get("/tags/estimated/?size=2")
+        self.assertTrue(response.context["total_is_estimate"])
+        self.assertContains(response, "About ")
+        self.assertEqual(len(response.context["items"]), 2)
+
+    def test_tag_archive_last_page_with_estimate(self):
+        from unittest import mock
+
+        from blog.caching import CachedCountPaginator
+
+        # Estimates too high and too low
+        for guess in (1000, 2):
+            with (
+                mock.patch.object(CachedCountPaginator, "counted", (guess, True)),
+                self.settings(EXACT_COUNT_LIMIT=2),
+            ):
+                response = self.client.get("/tags/estimated/?size=3&page=last")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.context["page"].number, 2)
+            self.assertEqual(len(response.context["items"]), 1)
+            self.assertFalse(response.context["page"].has_next())
+
+    def test_estimated_pages_past_the_end_404(self):
+        from blog.pagination import EstimatedCountPaginator
+        from blog.models import ContentItem
+
+        paginator = EstimatedCountPaginator(ContentItem.objects.order_by("-created"), 2)
+        paginator.counted = (1000, True)
+        self.assertEqual(len(paginator.page(2).object_list), 2)
+        with self.assertRaises(EmptyPage):
+            paginator.page(10)
+
+    def test_estimated_pages_beyond_the_estimate(self):
+        from blog.pagination import EstimatedCountPaginator
+        from blog.models import ContentItem
+
+        paginator = EstimatedCountPaginator(ContentItem.objects.order_by("-created"), 1)
+        # An estimate lower than the four rows there really are
+        paginator.counted = (2, True)
+        page = paginator.page(3)
+        self.assertEqual(len(page.object_list), 1)
+        self.assertTrue(page.has_next())
+        self.assertEqual(page.next_page_number(), 4)
+        page = paginator.page(4)
+        self.assertFalse(page.has_next())
+        self.assertEqual((page.start_index(), page.end_index()), (4, 4))
+        with self.assertRaises(EmptyPage):
+            paginator.page(5)
+
+
+class SpellingSuggestionTests(TransactionTestCase):
+    """The build_spelling_index command and the suggestions it powers."""
+
+    def setUp(self):
+        import tempfile
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = self.tmpdir.name + "/spelling-index.bin"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_index_corrections(self):
+        from blog.spelling import SpellingIndex, build_index
+
+        build_index({"datasette": 50, "database": 30, "data": 100}, self.path)
+        index = SpellingIndex(self.path)
+        self.assertTrue(index.is_known("datasette"))
+        self.assertFalse(index.is_known("datasete"))
+        self.assertEqual(index.correction("datasete"), "datasette")
+        self.assertEqual(index.correction("databse"), "database")
+        self.assertEqual(index.correction("dta"), "data")
+        self.assertIsNone(index.correction("xylophone"))
+
+    def test_failed_build_keeps_old_index(self):
+        import os
+        from unittest import mock
+
+        from blog.spelling import SpellingIndex, build_index
+
+        build_index({"datasette": 50}, self.path)
+        with mock.patch("blog.spelling.os.replace", side_effect=OSError):
+            with self.assertRaises(OSError):
+                build_index({"database": 30}, self.path)
+        self.assertEqual(os.listdir(self.tmpdir.name), ["spelling-index.bin"])
+        self.assertTrue(SpellingIndex(self.path).is_known("datasette"))
+
+    def test_search_suggestion_uses_index(self):
+        from django.core.management import call_command
+        from io import StringIO
+
+        tag = Tag.objects.create(tag="datasette-plugins")
+        EntryFactory(title="Datasette plugins are great").tags.add(tag)
+        call_command("build_spelling_index", path=self.path, stdout=StringIO())
+        with self.settings(SPELLING_INDEX_PATH=self.path):
+            response = self.client.get("/search/?q=datasete")
+        self.assertEqual(response.context["suggestion"], "datasette")
+        self.assertEqual(response.context["num_corrected_results"], 1)
+        self.assertContains(response, "Suggestion:")
+
+    def test_suggestion_is_counted_with_one_query(self):
+        from blog.spelling import build_index
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        EntryFactory(title="Datasette plugins")
+        EntryFactory(title="Datasette tutorial")
+        build_index({"datasette": 2, "plugins": 1, "tutorial": 1}, self.path)
+        with self.settings(SPELLING_INDEX_PATH=self.path):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get("/search/?q=datasete")
+        self.assertEqual(response.context["num_corrected_results"], 2)
+        queries = [
+            q["sql"] for q in ctx.captured_queries if "blog_contentitem" in q["sql"]
+        ]
+        # Facets and count for the search itself, then one corrected COUNT
+        self.assertEqual(len(queries), 3)
+        self.assertIn("datasette", queries[-1])
+        self.assertIn("COUNT(", queries[-1].upper())
+
+    def test_no_index_no_suggestion(self):
+        EntryFactory(title="Datasette plugins")
+        with self.settings(SPELLING_INDEX_PATH=self.path):
+            with self.assertLogs("blog.spelling", "ERROR") as logs:
+                response = self.client.get("/search/?q=datasete")
+        self.assertIsNone(response.context["suggestion"])
+        self.assertNotContains(response, "Suggestion:")
+        self.assertIn("No spelling index at " + self.path, logs.output[0])
+
+    def test_fetch_stored_index(self):
+        from django.core.management import CommandError, call_command
+        from io import StringIO
+
+        from blog.spelling import SpellingIndex
+
+        fetched = self.tmpdir.name + "/fetched.bin"
+        with self.assertRaises(CommandError):
+            call_command("fetch_spelling_index", path=fetched, stdout=StringIO())
+        EntryFactory(title="Datasette plugins and Datasette tutorials")
+        call_command("build_spelling_index", path=self.path, stdout=StringIO())
+        # As on a web dyno, which never sees the file the release wrote
+        call_command("fetch_spelling_index", path=fetched, stdout=StringIO())
+        with open(self.path, "rb") as built, open(fetched, "rb") as copy:
+            self.assertEqual(built.read(), copy.read())
+        self.assertTrue(SpellingIndex(fetched).is_known("datasette"))
+
+
+class ParallelQueryTests(TransactionTestCase):
+    """run_in_parallel() and the views that fan out through it."""
+
+    def test_results_in_order(self):
+        from blog.concurrency import run_in_parallel
+        from blog.models import Entry, Note
+
+        entry = EntryFactory()
+        note = NoteFactory()
+        with self.settings(PARALLEL_QUERY_THREADS=3):
+            entries, notes, count = run_in_parallel(
+                Entry.objects.all(), Note.objects.all(), Entry.objects.count
+            )
+        self.assertEqual(entries, [entry])
+        self.assertEqual(notes, [note])
+        self.assertEqual(count, 1)
+
+    def test_archive_day_same_in_parallel_and_serial(self):
+        created = datetime.datetime(2024, 5, 10, 12, tzinfo=datetime.timezone.utc)
+        EntryFactory(title="Day entry", created=created)
+        BlogmarkFactory(link_title="Day link", created=created)
+        EntryFactory(created=created - timedelta(days=3))
+        EntryFactory(created=created + timedelta(days=2))
+        contexts = []
+        for threads in (0, 4):
+            with self.settings(PARALLEL_QUERY_THREADS=threads):
+                response = self.client.get("/2024/May/10/")
+            self.assertEqual(response.status_code, 200)
+            contexts.append(
+                (
+                    [item["obj"].pk for item in response.context["items"]],
+                    response.context["previous_day"],
+                    response.context["next_day"],
+                )
+            )
+        self.assertEqual(contexts[0], contexts[1])
+        self.assertEqual(contexts[0][1], datetime.date(2024, 5, 7))
+        self.assertEqual(contexts[0][2], datetime.date(2024, 5, 12))
+
+
+class SearchTimingTests(TransactionTestCase):
+    """Server-Timing phases and staff-only EXPLAIN ANALYZE for search."""
+
+    def test_server_timing_header(self):
+        EntryFactory(title="Timed entry")
+        response = self.client.get("/search/?q=timed")
+        names = [
+            metric.split(";")[0].strip()
+            for metric in response["Server-Timing"].split(",")
+        ]
+        self.assertEqual(
+            names, ["parse", "facets", "count", "results", "hydrate", "render", "total"]
+        )
+        self.assertIn("facets;dur=", response["Server-Timing"])
+        self.assertIn('desc="1 query"', response["Server-Timing"])
+
+    def test_type_listing_has_server_timing(self):
+        response = self.client.get("/entries/")
+        self.assertIn("render;dur=", response["Server-Timing"])
+
+    def test_explain_is_staff_only(self):
+        EntryFactory(title="Explained entry")
+        response = self.client.get("/search/?q=explained&_explain=1")
+        self.assertIsNone(response.context["explain"])
+        self.assertNotContains(response, "EXPLAIN ANALYZE")
+        User.objects.create_superuser("staff", "staff@example.com", "password")
+        self.client.login(username="staff", password="password")
+        response = self.client.get("/search/?q=explained&_explain=1")
+        self.assertContains(response, "EXPLAIN ANALYZE")
+        self.assertIn("actual time=", response.context["explain"])
+
+    def test_explain_with_cursor(self):
+        from blog.pagination import encode_cursor
+
+        EntryFactory(title="Explained entry")
+        User.objects.create_superuser("staff", "staff@example.com", "password")
+        self.client.login(username="staff", password="password")
+        # rank, created, type, pk
+        cursor = encode_cursor([1.0, timezone.now().isoformat(), "zzz", 0], "next")
+        response = self.client.get("/search/?q=explained&_explain=1&cursor=" + cursor)
+        # The plan for the keyset-filtered query, not just the first page
+        self.assertIn("zzz", response.context["explain"])
+
+    def test_explain_with_estimated_count(self):
+        EntryFactory(title="Explained entry")
+        EntryFactory(title="Explained entry two")
+        User.objects.create_superuser("staff", "staff@example.com", "password")
+        self.client.login(username="staff", password="password")
+        with self.settings(EXACT_COUNT_LIMIT=1):
+            response = self.client.get("/search/?q=explained&_explain=1")
+        self.assertTrue(response.context["total_is_estimate"])
+        self.assertIn("actual time=", response.context["explain"])
+
+
+class TagIdsTests(TransactionTestCase):
+    """The denormalized tag_ids arrays on each content model."""
+
+    def _tag_ids(self, obj):
+        return obj.__class__.objects.values_list("tag_ids", flat=True).get(pk=obj.pk)
+
+    def test_add_remove_and_clear(self):
+        entry = EntryFactory()
+        tag1 = Tag.objects.create(tag="ids-one")
+        tag2 = Tag.objects.create(tag="ids-two")
+        entry.tags.add(tag2, tag1)
+        self.assertEqual(self._tag_ids(entry), sorted([tag1.pk, tag2.pk]))
+        self.assertEqual(entry.tag_ids, sorted([tag1.pk, tag2.pk]))
+        entry.tags.remove(tag1)
+        self.assertEqual(self._tag_ids(entry), [tag2.pk])
+        entry.tags.clear()
+        self.assertEqual(self._tag_ids(entry), [])
+
+    def test_reverse_add_and_clear(self):
+        note = NoteFactory()
+        chapter = ChapterFactory()
+        tag = Tag.objects.create(tag="ids-reverse")
+        tag.note_set.add(note)
+        tag.guides_chapter_set.add(chapter)
+        self.assertEqual(self._tag_ids(note), [tag.pk])
+        self.assertEqual(self._tag_ids(chapter), [tag.pk])
+        tag.note_set.clear()
+        self.assertEqual(self._tag_ids(note), [])
+        self.assertEqual(ContentItem.objects.get(content_type="note").tag_ids, [])
+
+    def test_stale_instance_save_keeps_tags(self):
+        blogmark = BlogmarkFactory()
+        stale = blogmark.__class__.objects.get(pk=blogmark.pk)
+        tag = Tag.objects.create(tag="ids-stale")
+        blogmark.tags.add(tag)
+        stale.save()
+        self.assertEqual(self._tag_ids(blogmark), [tag.pk])
+
+    def test_deleting_tag_removes_id(self):
+        quotation = QuotationFactory()
+        tag = Tag.objects.create(tag="ids-deleted")
+        quotation.tags.add(tag)
+        tag.delete()
+        self.assertEqual(self._tag_ids(quotation), [])
+
+    def test_counts_and_related_tags(self):
+        python = Tag.objects.create(tag="ids-python")
+        django = Tag.objects.create(tag="ids-django")
+        sqlite = Tag.objects.create(tag="ids-sqlite")
+        for _ in range(2):
+            EntryFactory().tags.add(python, django)
+        BlogmarkFactory().tags.add(python, sqlite)
+        EntryFactory(is_draft=True).tags.add(python)
+        self.assertEqual(python.entry_count(), 2)
+        self.assertEqual(python.link_count(), 1)
+        self.assertEqual(python.total_count(), 3)
+        self.assertEqual(python.get_related_tags(), [django, sqlite])
+
+
+class CoalescedReindexTests(TransactionTestCase):
+    """Search documents are rebuilt once per object per transaction."""
+
+    def _search_document_updates(self, queries):
+        return [
+            q["sql"]
+            for q in queries
+            # The reindex, rather than save() writing every column
+            if q["sql"].startswith("UPDATE") and '"search_document" = CASE' in q["sql"]
+        ]
+
+    def test_one_update_per_model_per_transaction(self):
+        from django.db import connection, transaction
+        from django.test.utils import CaptureQueriesContext
+
+        tag1 = Tag.objects.create(tag="coalesce-one")
+        tag2 = Tag.objects.create(tag="coalesce-two")
+        with CaptureQueriesContext(connection) as ctx:
+            with transaction.atomic():
+                entry1 = EntryFactory(title="Coalesced one")
+                entry2 = EntryFactory(title="Coalesced two")
+                entry1.tags.add(tag1)
+                entry1.tags.add(tag2)
+                entry2.tags.set([tag2])
+                entry1.save()
+                note = NoteFactory(body="Coalesced note")
+        self.assertEqual(len(self._search_document_updates(ctx.captured_queries)), 2)
+        entry1.refresh_from_db()
+        self.assertIn("'coalesce-two':", entry1.search_document)
+        self.assertIn(
+            "'coalesc':", str(note.__class__.objects.get(pk=note.pk).search_document)
+        )
+        self.assertEqual(
+            ContentItem.objects.get(content_type="entry", object_id=entry1.pk).tag_ids,
+            sorted([tag1.pk, tag2.pk]),
+        )
+
+    def test_rolled_back_savepoint(self):
+        from django.db import transaction
+
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    EntryFactory(title="Rolled back")
+                    raise ValueError
+            except ValueError:
+                pass
+            entry = EntryFactory(title="Survivor")
+        entry.refresh_from_db()
+        self.assertIsNotNone(entry.search_document)
+        self.assertEqual(ContentItem.objects.filter(object_id=entry.pk).count(), 1)
+
+    def test_rolled_back_transaction(self):
+        from django.db import transaction
+
+        try:
+            with transaction.atomic():
+                EntryFactory(title="Rolled back")
+                raise ValueError
+        except ValueError:
+            pass
+        with transaction.atomic():
+            entry = EntryFactory(title="Survivor")
+            entry.tags.add(Tag.objects.create(tag="survivor"))
+        entry.refresh_from_db()
+        self.assertIn("'survivor':", entry.search_document)
+        self.assertEqual(ContentItem.objects.filter(object_id=entry.pk).count(), 1)
+
+
+class ReindexAllTests(TransactionTestCase):
+    """The set-based reindex_all command."""
+
+    def setUp(self):
+        import tempfile
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.progress_file = self.tmpdir.name + "/progress.json"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _reindex(self, *args):
+        from django.core.management import call_command
+        from io import StringIO
+
+        stdout = StringIO()
+        call_command(
+            "reindex_all",
+            *args,
+            workers=1,
+            batch_size=2,
+            progress_file=self.progress_file,
+            stdout=stdout,
+        )
+        return stdout.getvalue()
+
+    def _documents(self, objs):
+        return [
+            obj.__class__.objects.values_list("search_document", flat=True).get(
+                pk=obj.pk
+            )
+            for obj in objs
+        ]
+
+    def test_matches_signal_indexing_for_every_type(self):
+        tag1 = Tag.objects.create(tag="reindexed")
+        tag2 = Tag.objects.create(tag="also-reindexed")
+        objs = [
+            EntryFactory(title="An entry", body="<p>Some <b>bold</b> text</p>"),
+            EntryFactory(title="Another entry"),
+            BlogmarkFactory(link_title="A link", via_title="Someone"),
+            QuotationFactory(quotation="A quote", source="A person"),
+            NoteFactory(body="A note"),
+            BeatFactory(title="A beat", commentary="Nice", note="More"),
+            ChapterFactory(title="A chapter", body="Chapter body"),
+        ]
+        for obj in objs:
+            obj.tags.add(tag1, tag2)
+        expected = self._documents(objs)
+        for obj in objs:
+            obj.__class__.objects.filter(pk=obj.pk).update(
+                search_document=None, search_document_hash=""
+            )
+        ContentItem.objects.update(search_document=None)
+        output = self._reindex()
+        self.assertIn("Rewrote 7 search documents", output)
+        self.assertEqual(self._documents(objs), expected)
+        self.assertFalse(ContentItem.objects.filter(search_document=None).exists())
+
+    def test_tag_names_in_order_added(self):
+        from blog.models import Entry
+
+        tags = [Tag.objects.create(tag=name) for name in ("zebra", "apple", "mango")]
+        entry = EntryFactory()
+        for tag in (tags[2], tags[0], tags[1]):
+            entry.tags.add(tag)
+        self.assertEqual(entry.tag_names(), "mango zebra apple")
+        self.assertEqual(
+            Entry.objects.annotate(names=Entry.tag_names_expression())
+            .get(pk=entry.pk)
+            .names,
+            "mango zebra apple",
+        )
+        entry.refresh_from_db()
+        self.assertEqual(
+            entry.search_document_hash,
+            entry.components_hash(entry.index_components()),
+        )
+
+    def test_since_and_resume(self):
+        import json
+
+        old = EntryFactory(created=timezone.now() - timedelta(days=30))
+        new = EntryFactory(created=timezone.now())
+        note = NoteFactory()
+        for obj in (old, new, note):
+            obj.__class__.objects.filter(pk=obj.pk).update(
+                search_document=None, search_document_hash=""
+            )
+        since = (timezone.now() - timedelta(days=1)).date().isoformat()
+        self._reindex("blog.Entry", "--since", since)
+        self.assertEqual(
+            [doc is None for doc in self._documents([old, new, note])],
+            [True, False, True],
+        )
+        # An interrupted run that had already done the notes
+        with open(self.progress_file, "w") as fp:
+            json.dump({"since": None, "done": [["blog.Note", note.pk]]}, fp)
+        self._reindex("--resume")
+        self.assertEqual(
+            [doc is None for doc in self._documents([old, new, note])],
+            [False, False, True],
+        )
+
+
+class SearchDocumentTriggerTests(TransactionTestCase):
+    """The optional Postgres triggers that maintain search_document."""
+
+    def setUp(self):
+        from blog.triggers import set_search_triggers
+
+        set_search_triggers(True)
+        self.settings_override = self.settings(SEARCH_DOCUMENT_TRIGGERS=True)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        from blog.triggers import set_search_triggers
+
+        self.settings_override.disable()
+        set_search_triggers(False)
+
+    def _document(self, obj):
+        return obj.__class__.objects.values_list("search_document", flat=True).get(
+            pk=obj.pk
+        )
+
+    def test_updates_that_bypass_signals(self):
+        from blog.models import Entry
+
+        entry = EntryFactory(title="Original title")
+        tag = Tag.objects.create(tag="triggered")
+        Entry.objects.filter(pk=entry.pk).update(title="Bypassed title")
+        self.assertIn("'bypass':", self._document(entry))
+        Entry.tags.through.objects.create(entry=entry, tag=tag)
+        self.assertIn("'trigger':", self._document(entry))
+        self.assertEqual(
+            ContentItem.objects.get(object_id=entry.pk).search_document,
+            self._document(entry),
+        )
+        Tag.objects.filter(pk=tag.pk).update(tag="renamed")
+        self.assertNotIn("'trigger':", self._document(entry))
+        self.assertIn("'renam':", self._document(entry))
+
+    def test_matches_python_documents(self):
+        from blog.reindex import content_models
+        from blog.triggers import trigger_mismatches
+
+        tag = Tag.objects.create(tag="consistent")
+        for obj in (
+            EntryFactory(body="<p>Some <em>markup</em></p>"),
+            EntryFactory(
+                body="<p>Fish &amp; chips &lt;3 &#8212; caf&eacute;</p>"
+                "<!-- a <b>comment</b> --><p>1 < 2, tea<br/>time</p>"
+            ),
+            BlogmarkFactory(via_title=None),
+            QuotationFactory(),
+            NoteFactory(),
+            BeatFactory(commentary="", note="A note"),
+            ChapterFactory(),
+        ):
+            obj.tags.add(tag)
+        for model in content_models():
+            self.assertEqual(list(trigger_mismatches(model)), [])
+
+    def test_python_and_sql_hash_the_same_text(self):
+        from blog.models import Entry
+
+        entry = EntryFactory(body="<p>Fish &amp; chips</p><!-- x --><p>1 < 2</p>")
+        self.assertEqual(
+            Entry.objects.annotate(digest=Entry.search_document_hash_expression())
+            .values_list("digest", flat=True)
+            .get(pk=entry.pk),
+            Entry.components_hash(entry.index_components()),
+        )
+
+    def test_clears_hash_when_document_changes(self):
+        from blog.models import Entry
+        from blog.reindex import reindex_queryset
+
+        entry = EntryFactory(title="Hashed title")
+        reindex_queryset(Entry.objects.filter(pk=entry.pk), force=True)
+        hashes = Entry.objects.values_list("search_document_hash", flat=True)
+        # The trigger agreed with the document reindex_queryset() wrote
+        self.assertNotEqual(hashes.get(pk=entry.pk), "")
+        Entry.objects.filter(pk=entry.pk).update(title="Bypassed title")
+        self.assertEqual(hashes.get(pk=entry.pk), "")
+        self.assertEqual(
+            reindex_queryset(Entry.objects.filter(pk=entry.pk)), [entry.pk]
+        )
+
+    def test_disabled_by_default(self):
+        from django.core.management import call_command
+        from blog.triggers import search_triggers_enabled
+
+        self.settings_override.disable()
+        call_command("migrate", verbosity=0)
+        self.settings_override.enable()
+        self.assertEqual(set(search_triggers_enabled().values()), {False})
+
+
+class SearchDocumentHashTests(TransactionTestCase):
+    """search_document is only rewritten when index_components() change."""
+
+    def _stats(self):
+        from blog.models import ReindexStats
+
+        return {
+            stats.content_type: (stats.written, stats.skipped)
+            for stats in ReindexStats.objects.all()
+        }
+
+    def test_unchanged_save_is_skipped(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        entry = EntryFactory(title="Hashed entry")
+        digest = entry.__class__.objects.get(pk=entry.pk).search_document_hash
+        self.assertEqual(digest, entry.components_hash(entry.index_components()))
+        with CaptureQueriesContext(connection) as ctx:
+            entry.save()
+        self.assertFalse(
+            [q for q in ctx.captured_queries if '"search_document" = CASE' in q["sql"]]
+        )
+        entry.title = "Rehashed entry"
+        entry.save()
+        entry.refresh_from_db()
+        self.assertIn("'rehash':", entry.search_document)
+        self.assertEqual(self._stats(), {"entry": (2, 1)})
+
+    def test_sql_hash_matches_python_hash(self):
+        from django.core.management import call_command
+        from io import StringIO
+
+        tag = Tag.objects.create(tag="hashed")
+        objs = [
+            EntryFactory(body="<p>Some <em>markup</em></p>"),
+            BlogmarkFactory(via_title=None),
+            QuotationFactory(),
+            NoteFactory(),
+            BeatFactory(commentary="", note="A note"),
+            ChapterFactory(),
+        ]
+        for obj in objs:
+            obj.tags.add(tag)
+        stdout = StringIO()
+        call_command("reindex_all", workers=1, progress_file="", stdout=stdout)
+        self.assertIn("Rewrote 0 search documents", stdout.getvalue())
+        # Written on create and again when tagged, skipped by reindex_all
+        self.assertEqual(self._stats()["note"], (2, 1))
+
+
+class TagRenameReindexTests(TransactionTestCase):
+    """Renaming a tag rewrites the search documents of everything tagged."""
+
+    def test_rename_reindexes_in_bulk(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        tag = Tag.objects.create(tag="oldname")
+        objs = [EntryFactory() for _ in range(5)] + [NoteFactory(), ChapterFactory()]
+        for obj in objs:
+            obj.tags.add(tag)
+        with CaptureQueriesContext(connection) as ctx:
+            tag.rename_tag("newname")
+        for obj in objs:
+            obj.refresh_from_db()
+            self.assertIn("'newnam':", obj.search_document)
+            self.assertNotIn("'oldnam':", obj.search_document)
+        self.assertFalse(
+            ContentItem.objects.exclude(search_document__contains="newnam").exists()
+        )
+        # Independent of how many items carry the tag
+        self.assertLess(len(ctx.captured_queries), 40)
+
+    def test_description_change_does_not_reindex(self):
+        from blog.models import ReindexStats
+
+        tag = Tag.objects.create(tag="described")
+        EntryFactory().tags.add(tag)
+        ReindexStats.objects.all().delete()
+        tag.description = "Now with a description"
+        tag.save()
+        self.assertFalse(ReindexStats.objects.exists())
+
+
+class JobQueueTests(TransactionTestCase):
+    """The blog_job queue, the run_jobs worker and /tools/jobs/."""
+
+    def setUp(self):
+        from blog import jobs
+
+        self.calls = []
+        self.failures_left = 0
+
+        def record(**kwargs):
+            if self.failures_left:
+                self.failures_left -= 1
+                raise ValueError("Not yet")
+            self.calls.append(kwargs)
+
+        jobs.registry["test_record"] = record
+        self.addCleanup(jobs.registry.pop, "test_record")
+
+    def test_inline_without_background_jobs(self):
+        from blog import jobs
+        from blog.models import Job
+
+        self.assertIsNone(jobs.enqueue("test_record", n=1))
+        self.assertEqual(self.calls, [{"n": 1}])
+        self.assertFalse(Job.objects.exists())
+
+    def test_queued_and_run_by_worker(self):
+        from blog import jobs
+        from blog.models import Job
+        from django.core.management import call_command
+        from io import StringIO
+
+        with self.settings(BACKGROUND_JOBS=True):
+            job = jobs.enqueue("test_record", n=1)
+            self.assertIsNotNone(jobs.enqueue("test_record", key="k", n=2))
+            self.assertIs(
+                jobs.enqueue("test_record", key="k", n=3), jobs.ALREADY_QUEUED
+            )
+        self.assertEqual(self.calls, [])
+        self.assertEqual(job.status, Job.Status.QUEUED)
+        stdout = StringIO()
+        call_command("run_jobs", once=True, stdout=stdout)
+        self.assertEqual(stdout.getvalue().strip(), "Ran 2 jobs")
+        self.assertEqual(self.calls, [{"n": 1}, {"n": 2}])
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.DONE)
+        self.assertIsNotNone(job.finished)
+
+    def test_retry_with_backoff(self):
+        from blog import jobs
+        from blog.models import Job
+
+        self.failures_left = 2
+        with self.settings(BACKGROUND_JOBS=True):
+            job = jobs.enqueue("test_record")
+        self.assertEqual(jobs.run_pending(), 1)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.Status.QUEUED, 1))
+        self.assertIn("Not yet", job.last_error)
+        self.assertGreater(job.run_after, timezone.now() + timedelta(seconds=5))
+        # Not runnable until the backoff has passed
+        self.assertEqual(jobs.run_pending(), 0)
+        Job.objects.update(run_after=timezone.now())
+        jobs.run_pending()
+        Job.objects.update(run_after=timezone.now())
+        jobs.run_pending()
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.Status.DONE, 3))
+        self.assertEqual(job.last_error, "")
+        self.assertEqual(self.calls, [{}])
+
+    def test_fail_while_duplicate_queued(self):
+        from blog import jobs
+        from blog.models import Job
+
+        self.failures_left = 1
+        with self.settings(BACKGROUND_JOBS=True):
+            job = jobs.enqueue("test_record", key="k", n=1)
+            running = jobs.claim()
+            newer = jobs.enqueue("test_record", key="k", n=2)
+        self.assertEqual(running.pk, job.pk)
+        self.assertIsNotNone(newer)
+        jobs.run(running)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.FAILED)
+        self.assertIn("Not retried", job.last_error)
+        self.assertEqual(jobs.run_pending(), 1)
+        self.assertEqual(self.calls, [{"n": 2}])
+
+    def test_gives_up_after_max_attempts(self):
+        from blog import jobs
+        from blog.models import Job
+
+        self.failures_left = 10
+        with self.settings(BACKGROUND_JOBS=True):
+            job = jobs.enqueue("test_record")
+        Job.objects.update(max_attempts=1)
+        jobs.run_pending()
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.FAILED)
+
+    def test_search_documents_updated_by_worker(self):
+        from blog import jobs
+
+        with self.settings(BACKGROUND_JOBS=True):
+            entry = EntryFactory(title="Queued indexing")
+            entry.refresh_from_db()
+            self.assertIsNone(entry.search_document)
+            self.assertEqual(jobs.run_pending(), 1)
+        entry.refresh_from_db()
+        self.assertIn("'queu':", entry.search_document)
+        self.assertEqual(
+            ContentItem.objects.get(object_id=entry.pk).search_document,
+            entry.search_document,
+        )
+        with self.settings(BACKGROUND_JOBS=True):
+            entry.title = "Edited later"
+            entry.save()
+            item = ContentItem.objects.get(object_id=entry.pk)
+            # Left for the job, rather than copied before it has run
+            self.assertIn("'queu':", item.search_document)
+            self.assertEqual(jobs.run_pending(), 1)
+        item.refresh_from_db()
+        self.assertIn("'edit':", item.search_document)
+
+    def test_purge_is_queued_and_jobs_page(self):
+        from blog.models import Job
+
+        User.objects.create_superuser("admin", "a@b.com", "password")
+        self.assertEqual(self.client.get("/tools/jobs/").status_code, 302)
+        self.client.login(username="admin", password="password")
+        with self.settings(BACKGROUND_JOBS=True):
+            self.client.post("/admin/purge-cache/")
+            response = self.client.get("/admin/")
+            self.assertContains(response, "Cloudflare cache purge queued")
+            self.client.post("/admin/purge-cache/")
+            response = self.client.get("/admin/")
+            self.assertContains(response, "Cloudflare cache purge already queued")
+            response = self.client.post("/tools/", {"purge_all": "1"})
+            self.assertIn("already+queued", response.url)
+        self.assertEqual(Job.objects.get().name, "purge_cloudflare_cache")
+        response = self.client.get("/tools/jobs/")
+        self.assertEqual(response.context["counts"], {"queued": 1})
+        self.assertContains(response, "purge_cloudflare_cache: 1")
+
+
+class XhtmlPipelineCacheTests(TransactionTestCase):
+    """{% xhtml_pipeline %} caches each filter chain's output by body hash."""
+
+    BODY = (
+        '<p class="context">Context</p><p>It\'s "quoted" - here</p>'
+        '<p>Second <img src="x.png" width="900" height="300" /></p>'
+        "<!-- cutoff --><p>After</p>"
+    )
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+
+    def render(self, name, body=None):
+        from django.template import Context, Template
+
+        return Template(
+            '{% load entry_tags %}{% xhtml_pipeline body "' + name + '" %}'
+        ).render(Context({"body": self.BODY if body is None else body}))
+
+    def test_matches_filter_chains(self):
+        from django.template import Context, Template
+
+        chains = {
+            "summary": "split_cutoff|xhtml|remove_context_paragraph"
+            "|first_paragraph|typography|xhtml2html",
+            "body": 'xhtml|resize_images_to_fit_width:"450"|typography|xhtml2html',
+            "card": "xhtml|remove_context_paragraph|typography|xhtml2html",
+        }
+        for name, chain in chains.items():
+            with self.subTest(name=name):
+                expected = Template(
+                    "{% load entry_tags %}{{ body|" + chain + " }}"
+                ).render(Context({"body": self.BODY}))
+                self.assertEqual(self.render(name), expected)
+                # And again from the cache
+                self.assertEqual(self.render(name), expected)
+
+    def test_hit_rates(self):
+        from unittest import mock
+
+        from blog.caching import fragment_cache_stats
+        from blog.templatetags import entry_tags
+
+        with mock.patch.object(
+            entry_tags.ElementTree,
+            "fromstring",
+            wraps=entry_tags.ElementTree.fromstring,
+        ) as parsed:
+            self.render("summary")
+            self.render("summary")
+            self.render("summary")
+            self.render("summary", body="<p>Different</p>")
+        self.assertEqual(parsed.call_count, 2)
+        self.assertEqual(
+            fragment_cache_stats(["xhtml-summary", "xhtml-body"]),
+            {
+                "xhtml-summary": {"hits": 2, "misses": 2, "hit_rate": 50},
+                "xhtml-body": {"hits": 0, "misses": 0, "hit_rate": None},
+            },
+        )
+
+    def test_version_changes_key(self):
+        from unittest import mock
+
+        from blog.caching import fragment_cache_stats
+        from blog.templatetags import entry_tags
+
+        self.render("card")
+        with mock.patch.object(
+            entry_tags, "XHTML_PIPELINE_VERSION", entry_tags.XHTML_PIPELINE_VERSION + 1
+        ):
+            self.render("card")
+        self.assertEqual(
+            fragment_cache_stats(["xhtml-card"])["xhtml-card"]["misses"], 2
+        )
+
+    def test_pipeline_edge_cases(self):
+        from blog.templatetags.entry_tags import (
+            XhtmlPipeline,
+            break_up_long_words,
+            first_paragraph,
+            strip_p_ids,
+            xhtml2html,
+        )
+
+        bodies = [
+            "",
+            'No paragraphs - just "text" <em>here</em>',
+            '<p id="a">It\'s</p><pre>"raw" - x<b>"b"</b></pre> tail "q"<p>x</p>',
+            "<script>if (a &lt; b) {}</script><p>Averyveryverylongword</p>",
+            '<style>p &gt; a {}</style><p><code>"c"</code> "d"</p>',
+        ]
+        pipeline = XhtmlPipeline(
+            "strip_p_ids", "typography", ("break_up_long_words", 5)
+        )
+        first = XhtmlPipeline("first_paragraph", "typography")
+        for body in bodies:
+            with self.subTest(body=body):
+                self.assertEqual(
+                    pipeline(body),
+                    str(
+                        xhtml2html(
+                            break_up_long_words(typography(strip_p_ids(xhtml(body))), 5)
+                        )
+                    ),
+                )
+                self.assertEqual(
+                    first(body),
+                    str(xhtml2html(typography(first_paragraph(xhtml(body))))),
+                )
+
+    def test_pipeline_fuses_text_steps(self):
+        from blog.templatetags.entry_tags import XhtmlPipeline
+
+        pipeline = XhtmlPipeline(
+            "typography", ("break_up_long_words", 5), ("resize_images_to_fit_width", 1)
+        )
+        self.assertEqual(len(pipeline.stages), 2)
+        self.assertEqual(len(pipeline.stages[0]), 2)
+        with self.assertRaises(ValueError):
+            XhtmlPipeline("typography", "split_cutoff")
+        with self.assertRaises(ValueError):
+            XhtmlPipeline("nonsense")
+
+    def test_benchmark_command(self):
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        stdout = StringIO()
+        call_command("benchmark_xhtml_pipeline", limit=20, iterations=1, stdout=stdout)
+        lines = stdout.getvalue().strip().split("\n")
+        self.assertEqual(
+            [line.split(":")[0] for line in lines], ["summary", "body", "card"]
+        )
+        for line in lines:
+            self.assertTrue(line.endswith(", 0 mismatches"), line)
+
+    def test_card_description_and_tools_page(self):
+        entry = EntryFactory(body="<p>First para</p><p>Second para</p>")
+        response = self.client.get(entry.get_absolute_url())
+        self.assertContains(
+            response, '<meta property="og:description" content="First para'
+        )
+        User.objects.create_superuser("admin", "a@b.com", "password")
+        self.client.login(username="admin", password="password")
+        response = self.client.get("/tools/")
+        self.assertEqual(response.context["fragment_stats"]["xhtml-card"]["misses"], 1)
+        self.assertContains(response, "<td>xhtml-card</td>")
+        # Rendered on save, never through the cache
+        self.assertNotContains(response, "<td>xhtml-summary</td>")
+        self.assertNotContains(response, "<td>xhtml-body</td>")
+
+
+class RenderedHtmlTests(TransactionTestCase):
+    """HTML is rendered once on save into rendered_html/rendered_excerpt."""
+
+    def test_rendered_on_save(self):
+        from unittest import mock
+
+        from blog.models import Beat, Blogmark, Note, Quotation
+
+        note = NoteFactory(body="Hello *world*")
+        quotation = QuotationFactory(quotation="A **bold** quote")
+        blogmark = BlogmarkFactory(commentary="Some _markdown_", use_markdown=True)
+        beat = BeatFactory(note="A `note`")
+        self.assertEqual(note.rendered_html, "<p>Hello <em>world</em></p>")
+        self.assertEqual(note.render_version, Note.RENDER_VERSION)
+        with mock.patch("blog.models.render_markdown") as render_markdown:
+            self.assertEqual(
+                Note.objects.get(pk=note.pk).body_rendered(),
+                "<p>Hello <em>world</em></p>",
+            )
+            quotation = Quotation.objects.get(pk=quotation.pk)
+            self.assertEqual(quotation.body(), "<p>A <strong>bold</strong> quote</p>")
+            self.assertEqual(str(quotation), "A bold quote")
+            self.assertEqual(
+                Blogmark.objects.get(pk=blogmark.pk).body(),
+                "<p>Some <em>markdown</em></p>",
+            )
+            self.assertEqual(
+                Beat.objects.get(pk=beat.pk).note_rendered(),
+                "<p>A <code>note</code></p>",
+            )
+        render_markdown.assert_not_called()
+
+    def test_entry_body_and_summary(self):
+        from blog.templatetags.entry_tags import XHTML_PIPELINES
+
+        body = '<p class="context">Context</p><p>It\'s first</p><p>Second</p>'
+        entry = EntryFactory(body=body)
+        self.assertEqual(entry.rendered_html, XHTML_PIPELINES["body"](body))
+        self.assertEqual(entry.summary_html(), "<p>It\u2019s first</p>")
+        response = self.client.get("/")
+        self.assertContains(response, "<p>It\u2019s first</p>")
+        self.assertNotContains(response, "<p>Second</p>")
+        response = self.client.get(entry.get_absolute_url())
+        self.assertContains(response, "<p>Second</p>")
+
+    def test_edit_rerenders(self):
+        note = NoteFactory(body="Before")
+        note.body = "After"
+        note.save(update_fields=["body"])
+        note.refresh_from_db()
+        self.assertEqual(note.rendered_html, "<p>After</p>")
+
+    def test_invalid_xhtml_is_not_stored(self):
+        from xml.etree import ElementTree
+
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        from blog.models import Entry
+
+        entry = EntryFactory(body="<p>Unclosed")
+        self.assertEqual(
+            (entry.rendered_html, entry.render_version), ("", -Entry.RENDER_VERSION)
+        )
+        with self.assertRaises(ElementTree.ParseError):
+            entry.body_html()
+        # Not picked up again until RENDER_VERSION changes
+        stdout = StringIO()
+        call_command("rerender_all", "blog.Entry", stdout=stdout)
+        self.assertIn("Re-rendered 0 rows", stdout.getvalue())
+
+    def test_rerender_all(self):
+        from io import StringIO
+        from unittest import mock
+
+        from django.core.management import CommandError, call_command
+
+        from blog.models import Note
+
+        old = NoteFactory(body="Old *note*")
+        current = NoteFactory(body="Current")
+        Note.objects.filter(pk=old.pk).update(rendered_html="", render_version=0)
+        old = Note.objects.get(pk=old.pk)
+        # Stale rows are rendered on access until re-rendered
+        self.assertEqual(old.body_rendered(), "<p>Old <em>note</em></p>")
+        with mock.patch.object(Note, "RENDER_VERSION", Note.RENDER_VERSION + 1):
+            stdout = StringIO()
+            call_command("rerender_all", "blog.Note", stdout=stdout)
+        self.assertIn("blog.Note: 2 rows re-rendered", stdout.getvalue())
+        stdout = StringIO()
+        call_command("rerender_all", stdout=stdout)
+        self.assertIn("blog.Note: 2 rows re-rendered", stdout.getvalue())
+        old.refresh_from_db()
+        self.assertEqual(
+            (old.rendered_html, old.render_version),
+            ("<p>Old <em>note</em></p>", Note.RENDER_VERSION),
+        )
+        stdout = StringIO()
+        call_command("rerender_all", "blog.Note", stdout=stdout)
+        self.assertIn("Re-rendered 0 rows", stdout.getvalue())
+        call_command("rerender_all", "blog.Note", force=True, stdout=stdout)
+        self.assertIn("blog.Note: 2 rows re-rendered", stdout.getvalue())
+        current.refresh_from_db()
+        self.assertEqual(current.rendered_html, "<p>Current</p>")
+        with self.assertRaises(CommandError):
+            call_command("rerender_all", "blog.Tag")
+
+
+class ComputedColumnsTests(TransactionTestCase):
+    """word_count, paragraph_count, image_count and domain are stored on save."""
+
+    def test_computed_on_save(self):
+        entry = EntryFactory(
+            body='<p>One two three</p><p><img src="/a.png" alt="x"/> four</p>'
+        )
+        blogmark = BlogmarkFactory(
+            link_url="https://www.Example.com/post",
+            commentary="Five words of commentary here",
+        )
+        quotation = QuotationFactory(
+            source_url="https://quotes.example.org/q", quotation="Hello *world*"
+        )
+        note = NoteFactory(body="Para one\n\nPara **two** words")
+        self.assertEqual(
+            (entry.word_count, entry.paragraph_count, entry.image_count),
+            (6, 2, 1),
+        )
+        self.assertTrue(entry.multi_paragraph())
+        self.assertEqual((blogmark.word_count, blogmark.domain), (5, "example.com"))
+        self.assertEqual(blogmark.word_count_text(), "5 words")
+        self.assertEqual(
+            (quotation.word_count, quotation.domain), (2, "quotes.example.org")
+        )
+        self.assertEqual((note.word_count, note.paragraph_count), (5, 2))
+        item = ContentItem.objects.get(content_type="blogmark", object_id=blogmark.pk)
+        self.assertEqual((item.word_count, item.domain), (5, "example.com"))
+
+    def test_pre_counts_as_paragraph(self):
+        entry = EntryFactory(body="<p>Intro</p><pre>code</pre>")
+        self.assertEqual(entry.paragraph_count, 2)
+        self.assertTrue(entry.multi_paragraph())
+        chapter = ChapterFactory(
+            body="Intro\n\n```\ncode\n```\n\nMore\n\n```\nmore code\n```"
+        )
+        self.assertEqual(chapter.paragraph_count, 4)
+        self.assertTrue(chapter.multi_paragraph())
+
+    def test_beat_photo_count(self):
+        beat = BeatFactory(
+            url="https://www.inaturalist.org/observations/1",
+            metadata={"observations": [{"photos": ["a", "b"]}, {"photos": ["c"]}]},
+        )
+        self.assertEqual((beat.image_count, beat.domain), (3, "inaturalist.org"))
+        self.assertEqual(beat.sighting_photo_count(), 3)
+
+    def test_rerender_all_backfills(self):
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        from blog.models import Blogmark
+
+        blogmark = BlogmarkFactory(
+            link_url="https://simonwillison.net/", commentary="Three words here"
+        )
+        Blogmark.objects.filter(pk=blogmark.pk).update(
+            word_count=0, domain="", render_version=0
+        )
+        ContentItem.objects.filter(object_id=blogmark.pk).update(
+            word_count=0, domain=""
+        )
+        blogmark = Blogmark.objects.get(pk=blogmark.pk)
+        # Stale rows compute their values on access until backfilled
+        self.assertEqual(blogmark.words(), 3)
+        call_command("rerender_all", "blog.Blogmark", stdout=StringIO())
+        blogmark.refresh_from_db()
+        self.assertEqual(
+            (blogmark.word_count, blogmark.domain), (3, "simonwillison.net")
+        )
+        item = ContentItem.objects.get(content_type="blogmark", object_id=blogmark.pk)
+        self.assertEqual((item.word_count, item.domain), (3, "simonwillison.net"))
+
+    def test_search_domain_min_words_and_sort(self):
+        short = BlogmarkFactory(
+            link_url="https://example.com/a", commentary="Short one", title="Short"
+        )
+        long = BlogmarkFactory(
+            link_url="https://www.example.com/b",
+            commentary=" ".join(["word"] * 50),
+            title="Long",
+        )
+        other = BlogmarkFactory(link_url="https://other.net/", commentary="Other")
+        entry = EntryFactory(body="<p>%s</p>" % " ".join(["word"] * 20))
+
+        def results(url):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            return [(r["type"], r["obj"].pk) for r in response.context["results"]]
+
+        self.assertEqual(
+            set(results("/search/?domain=https://www.example.com/")),
+            {("blogmark", short.pk), ("blogmark", long.pk)},
+        )
+        response = self.client.get("/search/?domain=example.com")
+        self.assertContains(response, "Posts from example.com")
+        self.assertContains(response, "Domain: example.com")
+        self.assertEqual(
+            set(results("/search/?min_words=10")),
+            {("blogmark", long.pk), ("entry", entry.pk)},
+        )
+        self.assertEqual(
+            results("/search/?sort=words"),
+            [
+                ("blogmark", long.pk),
+                ("entry", entry.pk),
+                ("blogmark", short.pk),
+                ("blogmark", other.pk),
+            ],
+        )
+        self.assertEqual(
+            results("/search/?sort=words&cursor=&domain=example.com"),
+            [("blogmark", long.pk), ("blogmark", short.pk)],
+        )
+
+    def test_listing_word_count(self):
+        EntryFactory(body="<p>%s</p>\n<p>More words</p>" % " ".join(["word"] * 1500))
+        response = self.client.get("/")
+        self.assertContains(response, "1,502 words")
+
+
+class ItemFragmentCacheTests(TransactionTestCase):
+    """blog_mixed_list caches each item's markup until the content changes."""
+
+    def setUp(self):
+        from django.core.cache import caches
+
+        caches["default"].clear()
+        caches["fragments"].clear()
+
+    def render(self, items, tag="blog_mixed_list_with_dates"):
+        from django.template import Context, Template
+
+        from blog.models import load_mixed_objects
+
+        objs = load_mixed_objects(items)
+        return Template("{% load blog_tags %}{% " + tag + " items %}").render(
+            Context(
+                {"items": [{"type": o.original_dict["type"], "obj": o} for o in objs]}
+            )
+        )
+
+    def test_cached_until_saved(self):
+        from blog.caching import fragment_cache_stats
+        from blog.models import Note
+
+        note = NoteFactory(body="First version")
+        items = [{"type": "note", "pk": note.pk}]
+        html = self.render(items)
+        self.assertIn("<p>First version</p>", html)
+        # Changes that bypass the signals are not seen
+        Note.objects.filter(pk=note.pk).update(rendered_html="<p>Sneaky</p>")
+        self.assertEqual(self.render(items), html)
+        self.assertEqual(
+            fragment_cache_stats(["mixed-item"])["mixed-item"],
+            {"hits": 1, "misses": 1, "hit_rate": 50},
+        )
+        note.body = "Second version"
+        note.save()
+        self.assertIn("<p>Second version</p>", self.render(items))
+
+    def test_tag_change_invalidates(self):
+        note = NoteFactory(body="Tagged later")
+        items = [{"type": "note", "pk": note.pk}]
+        self.assertNotIn("/tags/llms/", self.render(items))
+        note.tags.add(Tag.objects.create(tag="llms"))
+        self.assertIn("/tags/llms/", self.render(items))
+
+    def test_showdate_is_part_of_key(self):
+        entry = EntryFactory(
+            created=datetime.datetime(2025, 7, 1, tzinfo=datetime.timezone.utc)
+        )
+        items = [{"type": "entry", "pk": entry.pk}]
+        with_date = self.render(items)
+        without_date = self.render(items, "blog_mixed_list")
+        self.assertIn("1st July 2025", with_date)
+        self.assertNotIn("1st July 2025", without_date)
+        self.assertEqual(self.render(items), with_date)
+        self.assertEqual(self.render(items, "blog_mixed_list"), without_date)
+
+    def test_listing_from_cache(self):
+        from blog.caching import fragment_cache_stats
+
+        NoteFactory(body="On the notes page")
+        first = self.client.get("/notes/")
+        second = self.client.get("/notes/")
+        self.assertContains(second, "<p>On the notes page</p>")
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(
+            fragment_cache_stats(["mixed-item"])["mixed-item"]["hit_rate"], 50
+        )
+
+    def test_shared_between_processes(self):
+        from django.core.cache.backends.db import DatabaseCache
+
+        from blog.caching import ItemFragments
+        from blog.models import load_mixed_objects
+
+        note = NoteFactory(body="Rendered once")
+        self.render([{"type": "note", "pk": note.pk}])
+        obj = load_mixed_objects([{"type": "note", "pk": note.pk}])[0]
+        key = ItemFragments([{"type": "note", "obj": obj}], "date").keys[
+            "note", note.pk
+        ]
+        # Another process has its own cache instance on the same table
+        other = DatabaseCache("fragment_cache", {})
+        self.assertIn("<p>Rendered once</p>", other.get(key))
+
+
+class StreamingTests(TransactionTestCase):
+    """Long archive pages are streamed, with the same HTML as render()."""
+
+    def get(self, url, min_items):
+        from unittest import mock
+
+        with (
+            mock.patch("blog.streaming.STREAM_MIN_ITEMS", min_items),
+            mock.patch("blog.streaming.CHUNK_SIZE", 2),
+        ):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            if response.streaming:
+                return True, b"".join(response.streaming_content)
+            return False, response.content
+
+    def test_archive_tag(self):
+        tag = Tag.objects.create(tag="python")
+        for year in (2023, 2023, 2024, 2024, 2024):
+            NoteFactory(
+                created=datetime.datetime(year, 3, 1, tzinfo=datetime.timezone.utc)
+            ).tags.add(tag)
+        EntryFactory(
+            created=datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+        ).tags.add(tag)
+        streamed, html = self.get("/tags/python/?size=1000", 3)
+        self.assertTrue(streamed)
+        self.assertEqual(self.get("/tags/python/?size=1000", 100), (False, html))
+        # Year headers are not repeated at chunk boundaries
+        self.assertEqual(html.count(b'<h3 class="blog-mixed-list-year">'), 3)
+        self.assertEqual(html.count(b'<h3 class="blog-mixed-list-year">2024</h3>'), 1)
+
+    def test_archive_month(self):
+        for day in (1, 1, 1, 2, 3):
+            NoteFactory(
+                created=datetime.datetime(2025, 7, day, tzinfo=datetime.timezone.utc)
+            )
+        # The calendar needs at least one entry
+        EntryFactory(
+            created=datetime.datetime(2025, 7, 3, tzinfo=datetime.timezone.utc)
+        )
+        streamed, html = self.get("/2025/Jul/", 3)
+        self.assertTrue(streamed)
+        self.assertEqual(self.get("/2025/Jul/", 100), (False, html))
+        self.assertEqual(html.count(b'<a href="/2025/Jul/1/">'), 1)
+        self.assertNotIn(b"stream-", html)
+
+
+class HomepageSnapshotTests(TransactionTestCase):
+    """The homepage is served from a snapshot rebuilt when content changes."""
+
+    def setUp(self):
+        from django.core.cache import caches
+
+        caches["default"].clear()
+        caches["shared"].clear()
+
+    def test_served_from_snapshot(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        tag = Tag.objects.create(tag="datasette")
+        NoteFactory(body="First note").tags.add(tag)
+        self.assertContains(self.client.get("/"), "<p>First note</p>")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/")
+        # Only the shared cache, redirects middleware and sponsor message
+        self.assertEqual(
+            [
+                q["sql"]
+                for q in queries
+                if "blog_shared_cache" not in q["sql"]
+                and "redirects_redirect" not in q["sql"]
+                and "blog_sponsormessage" not in q["sql"]
+            ],
+            [],
+        )
+        self.assertContains(response, "<p>First note</p>")
+        self.assertContains(response, 'href="/tags/datasette/"')
+        self.assertContains(response, "datasette <span>1</span>")
+        self.assertEqual(response["Cache-Control"], "s-maxage=200")
+        # The timeline is only stored as HTML
+        self.assertNotIn("items", response.context)
+
+    def test_rebuilt_on_publish(self):
+        first = NoteFactory(
+            body="First note",
+            created=datetime.datetime(2025, 7, 1, tzinfo=datetime.timezone.utc),
+        )
+        self.client.get("/")
+        second = NoteFactory(
+            body="Second note",
+            created=datetime.datetime(2025, 7, 2, tzinfo=datetime.timezone.utc),
+        )
+        content = self.client.get("/").content.decode("utf-8")
+        self.assertLess(
+            content.index("<p>Second note</p>"), content.index("<p>First note</p>")
+        )
+        second.is_draft = True
+        second.save()
+        self.assertNotContains(self.client.get("/"), "<p>Second note</p>")
+        first.delete()
+        self.assertNotContains(self.client.get("/"), "<p>First note</p>")
+
+
+class MarkdownRendererTests(TransactionTestCase):
+    """blog.rendering reuses one Markdown instance per profile per thread."""
+
+    def test_matches_markdown(self):
+        from markdown import markdown
+
+        from blog.rendering import PROFILES, render_markdown
+
+        docs = [
+            "A [link][ref] and *emphasis*\n\n[ref]: https://example.com/",
+            # Must not see the reference defined by the previous document
+            "Another [link][ref]",
+            "## Intro\n\n```python\nprint('hi')\n```\n\n## Intro",
+            "```markdown-copy\n# Copy me\n```",
+            "",
+        ]
+        for profile in ("default", "chapter", "chapter_feed"):
+            for doc in docs:
+                with self.subTest(profile=profile, doc=doc):
+                    self.assertEqual(
+                        render_markdown(doc, profile),
+                        markdown(doc, **PROFILES[profile]),
+                    )
+
+    def test_one_instance_per_thread(self):
+        import threading
+
+        from blog.rendering import get_renderer
+
+        self.assertIs(get_renderer(), get_renderer())
+        self.assertIsNot(get_renderer(), get_renderer("chapter"))
+        other = []
+        thread = threading.Thread(target=lambda: other.append(get_renderer()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], get_renderer())
+
+    def test_chapter_headings_reset(self):
+        chapter = ChapterFactory(body="## Intro\n\nOne")
+        self.assertEqual(chapter.h2_headings(), [{"id": "intro", "title": "Intro"}])
+        self.assertEqual(chapter.h2_headings(), [{"id": "intro", "title": "Intro"}])
+
+    def test_benchmark_command(self):
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        NoteFactory(body="A *note*")
+        stdout = StringIO()
+        call_command("benchmark_markdown", limit=5, iterations=1, stdout=stdout)
+        output = stdout.getvalue()
+        self.assertIn("notes: 1 bodies, markdown()", output)
+        self.assertIn("chapters: nothing to render", output)
+
+
+class ChapterRenderTests(TransactionTestCase):
+    """Chapter HTML, feed HTML and headings are rendered once, on save."""
+
+    BODY = (
+        "## Setup\n\nOne\n\nTwo\n\n```python\nprint('hi')\n```\n\n"
+        "## Usage\n\nThree\n\nFour\n\n```markdown-copy\n# Copy\n```"
+    )
+
+    def test_rendered_on_save(self):
+        from blog.rendering import render_markdown
+
+        chapter = ChapterFactory(body=self.BODY)
+        self.assertEqual(chapter.rendered_html, render_markdown(self.BODY, "chapter"))
+        self.assertIn('<span class="nb">print</span>', chapter.rendered_html)
+        self.assertIn("<markdown-copy>", chapter.rendered_html)
+        self.assertIn("<pre># Copy</pre>", chapter.rendered_feed_html)
+        self.assertEqual(
+            chapter.rendered_headings,
+            [{"id": "setup", "title": "Setup"}, {"id": "usage", "title": "Usage"}],
+        )
+        self.assertEqual(chapter.rendered_excerpt.count("<p>"), 3)
+        self.assertIn("<h4>Setup</h4>", chapter.rendered_excerpt)
+
+    def test_views_do_no_markdown_work(self):
+        from unittest import mock
+
+        chapter = ChapterFactory(body=self.BODY, guide__slug="g")
+        with mock.patch("guides.models.render_markdown") as render_markdown:
+            response = self.client.get(chapter.get_absolute_url())
+            self.assertContains(response, '<h2 id="usage">Usage</h2>')
+            self.assertContains(self.client.get("/guides/g/"), "#usage")
+            self.assertContains(self.client.get("/"), "<h4>Setup</h4>")
+            self.assertContains(
+                self.client.get("/atom/everything/"), "&lt;pre&gt;# Copy&lt;/pre&gt;"
+            )
+        render_markdown.assert_not_called()
+
+    def test_stale_body_rendered_in_memory(self):
+        from guides.models import Chapter
+
+        chapter = ChapterFactory(body="## Old")
+        Chapter.objects.filter(pk=chapter.pk).update(body="## New")
+        chapter = Chapter.objects.get(pk=chapter.pk)
+        self.assertEqual(chapter.h2_headings(), [{"id": "new", "title": "New"}])
+        self.assertIn("New", chapter.body_rendered())
+
+    def test_rerender_all(self):
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        from guides.models import Chapter
+
+        chapter = ChapterFactory(body="## Heading")
+        Chapter.objects.filter(pk=chapter.pk).update(
+            render_version=0, rendered_headings=[]
+        )
+        stdout = StringIO()
+        call_command("rerender_all", "guides.Chapter", stdout=stdout)
+        self.assertIn("guides.Chapter: 1 rows re-rendered", stdout.getvalue())
+        chapter.refresh_from_db()
+        self.assertEqual(
+            chapter.rendered_headings, [{"id": "heading", "title": "Heading"}]
+        )
+
+
 class ImporterViewTests(TransactionTestCase):
     def setUp(self):
         self.admin = User.objects.create_superuser("admin", "a@b.com", "password")
@@ -4617,3 +6428,52 @@ class CloudflarePurgeTests(TransactionTestCase):
         response = self.client.get("/admin/")
         self.assertContains(response, "Purge Cloudflare cache")
         self.assertContains(response, "/admin/purge-cache/")
+
+
+class ContentItemTests(TransactionTestCase):
+    def _item(self, obj):
+        return ContentItem.objects.get(
+            content_type=ContentItem.content_type_for(obj), object_id=obj.pk
+        )
+
+    def test_saving_creates_content_item(self):
+        entry = EntryFactory(title="Indexed entry")
+        item = self._item(entry)
+        self.assertEqual(item.created, entry.created)
+        self.assertFalse(item.is_draft)
+        self.assertIsNotNone(item.search_document)
+
+    def test_tag_changes_update_tag_ids(self):
+        blogmark = BlogmarkFactory()
+        tag1 = Tag.objects.create(tag="ci-one")
+        tag2 = Tag.objects.create(tag="ci-two")
+        blogmark.tags.add(tag1, tag2)
+        self.assertEqual(self._item(blogmark).tag_ids, sorted([tag1.pk, tag2.pk]))
+        blogmark.tags.remove(tag1)
+        self.assertEqual(self._item(blogmark).tag_ids, [tag2.pk])
+        tag2.delete()
+        self.assertEqual(self._item(blogmark).tag_ids, [])
+
+    def test_deleting_removes_content_item(self):
+        note = NoteFactory()
+        self._item(note)
+        note_pk = note.pk
+        note.delete()
+        self.assertFalse(
+            ContentItem.objects.filter(content_type="note", object_id=note_pk).exists()
+        )
+
+    def test_beat_type_is_copied(self):
+        beat = BeatFactory(beat_type="museum")
+        self.assertEqual(self._item(beat).beat_type, "museum")
+
+    def test_chapter_inherits_guide_draft_status(self):
+        guide = GuideFactory(is_draft=False)
+        chapter = ChapterFactory(guide=guide, is_draft=False, is_unlisted=True)
+        item = self._item(chapter)
+        self.assertFalse(item.is_draft)
+        self.assertTrue(item.is_unlisted)
+        guide.is_draft = True
+        guide.save()
+        self.assertTrue(self._item(chapter).is_draft)
+        self.assertFalse(ContentItem.objects.listed().filter(pk=item.pk).exists())
@@ -0,0 +1,81 @@
+import time
+from contextlib import contextmanager
+
+from django.db import connection
+from django.shortcuts import render
+
+
+class PhaseTimer:
+    """
+    Records wall-clock time and database query count for the named phases
+    of a request, for reporting as a Server-Timing header.
+
+        timer = PhaseTimer()
+        with timer.count_queries():
+            ...
+            timer.lap("parse")  # Everything since the previous lap
+            with timer.phase("render"):
+                ...
+    """
+
+    def __init__(self):
+        self.phases = []
+        self.queries = 0
+        self.started = self._last = time.perf_counter()
+        self._last_queries = 0
+
+    def _count_query(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    @contextmanager
+    def count_queries(self):
+        with connection.execute_wrapper(self._count_query):
+            yield
+
+    def lap(self, name):
+        now = time.perf_counter()
+        self.phases.append(
+            {
+                "name": name,
+                "ms": (now - self._last) * 1000,
+                "queries": self.queries - self._last_queries,
+            }
+        )
+        self._last = now
+        self._last_queries = self.queries
+
+    @contextmanager
+    def phase(self, name):
+        self._last = time.perf_counter()
+        self._last_queries = self.queries
+        try:
+            yield
+        finally:
+            self.lap(name)
+
+    @property
+    def total_ms(self):
+        return (self._last - self.started) * 1000
+
+    def server_timing(self):
+        metrics = [
+            '{};dur={:.1f};desc="{} quer{}"'.format(
+                phase["name"],
+                phase["ms"],
+                phase["queries"],
+                "y" if phase["queries"] == 1 else "ies",
+            )
+            for phase in self.phases
+        ]
+        metrics.append("total;dur={:.1f}".format(self.total_ms))
+        return ", ".join(metrics)
+
+
+def render_timed(request, template_name, context):
+    "render() that times itself and adds context['timer'] as Server-Timing"
+    timer = context["timer"]
+    with timer.count_queries(), timer.phase("render"):
+        response = render(request, template_name, context)
+    response["Server-Timing"] = timer.server_timing()
+    return response
@@ -0,0 +1,87 @@
+"""
+Optional database-side maintenance of search_document.
+
+Migration 0052 installs, for each content table, a trigger that rebuilds
+search_document from the row and its tags, triggers on the tags through
+tables and on blog_tag renames that re-fire it, and one that copies the
+result to blog_contentitem. They are created disabled; post_migrate calls
+set_search_triggers() to match settings.SEARCH_DOCUMENT_TRIGGERS.
+
+Migration 0057 has the trigger blank search_document_hash whenever it
+changes search_document, so reindex_all rewrites the row from Python.
+"""
+
+from django.contrib.postgres.search import SearchVectorField
+from django.db import connection
+from django.db.models.expressions import RawSQL
+
+from blog.models import BaseModel
+from blog.reindex import content_models
+
+TAG_TRIGGER = ("blog_tag", "blog_tag_search_document")
+
+
+def search_triggers():
+    "(table, trigger) pairs for every trigger installed by migration 0052"
+    triggers = [TAG_TRIGGER]
+    for model in content_models():
+        table = model._meta.db_table
+        triggers += [
+            (table, table + "_search_document"),
+            (table, table + "_contentitem"),
+            (table + "_tags", table + "_tags_search_document"),
+        ]
+    return triggers
+
+
+def set_search_triggers(enabled):
+    with connection.cursor() as cursor:
+        for table, trigger in search_triggers():
+            cursor.execute(
+                "alter table {} {} trigger {}".format(
+                    connection.ops.quote_name(table),
+                    "enable" if enabled else "disable",
+                    connection.ops.quote_name(trigger),
+                )
+            )
+
+
+def search_triggers_enabled():
+    "{trigger name: enabled} as recorded in pg_trigger"
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "select tgname, tgenabled != 'D' from pg_trigger where tgname = any(%s)",
+            [[trigger for _, trigger in search_triggers()]],
+        )
+        return dict(cursor.fetchall())
+
+
+def trigger_mismatches(model, limit=None):
+    """
+    Yield (pk, python_document, trigger_document) for each row where the
+    trigger's {table}_search_document() function disagrees with the vector
+    built in Python from index_components()
+    """
+    from blog.signals import search_vector
+
+    assert issubclass(model, BaseModel)
+    function = model._meta.db_table + "_search_document"
+    qs = model.objects.order_by("-pk")
+    if limit:
+        qs = qs[:limit]
+    for obj in qs.iterator():
+        python_document, trigger_document = (
+            model.objects.filter(pk=obj.pk)
+            .annotate(
+                python_document=search_vector(obj.index_components()),
+                trigger_document=RawSQL(
+                    "{}({}.*)".format(function, model._meta.db_table),
+                    [],
+                    output_field=SearchVectorField(),
+                ),
+            )
+            .values_list("python_document", "trigger_document")
+            .get()
+        )
+        if python_document != trigger_document:
+            yield obj.pk, python_document, trigger_document
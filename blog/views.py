@@ -1,12 +1,13 @@
 # coding=utf8
 from django.shortcuts import render, get_object_or_404
+from django.template.loader import render_to_string
 from django.http import JsonResponse
 from django.contrib import messages
 from django.contrib.admin.views.decorators import staff_member_required
 from django.views.decorators.http import require_POST
 from django.views.decorators.cache import never_cache
-from django.db import models
-from django.db.models import CharField, Count, Max, Min, Value
+from django.db import connection, models, transaction
+from django.db.models import Count, Max, Min
 from django.conf import settings
 from django.core.paginator import (
     Paginator,
@@ -16,10 +17,24 @@ from django.core.paginator import (
 from django.http import Http404, HttpResponsePermanentRedirect as Redirect, HttpResponse
 from django.test import Client
 from django.utils import timezone
+from .caching import (
+    CachedCountPaginator,
+    ItemFragments,
+    cached_snapshot,
+    fragment_cache_stats,
+)
+from .concurrency import run_in_parallel
+from .pagination import CONTENT_ITEM_ORDERING, InvalidCursor, cursor_paginate
+from . import jobs
+from .reindex import refresh_content_items, reindex_queryset, sync_tag_ids
+from .streaming import render_streaming
+from .templatetags.entry_tags import TEMPLATE_XHTML_PIPELINES
 from .models import (
     Beat,
     Blogmark,
+    ContentItem,
     Entry,
+    Job,
     Quotation,
     Note,
     Photo,
@@ -160,54 +175,19 @@ def _beat_weight(beat):
     return 0.2
 
 
-def index(request):
+def homepage_items():
+    "The homepage timeline: the newest items that fit within HOMEPAGE_BUDGET"
     # Over-fetch candidates so lightweight beats don't starve heavier content.
     # 150 is generous: even if every candidate were a bare beat (0.2 each),
     # that's 150 * 0.2 = 30.0 — exactly the budget.
     candidates = list(
-        Entry.objects.filter(is_draft=False)
-        .annotate(content_type=Value("entry", output_field=CharField()))
-        .values("content_type", "id", "created")
-        .order_by()
-        .union(
-            Blogmark.objects.filter(is_draft=False)
-            .annotate(content_type=Value("blogmark", output_field=CharField()))
-            .values("content_type", "id", "created")
-            .order_by()
-        )
-        .union(
-            Quotation.objects.filter(is_draft=False)
-            .annotate(content_type=Value("quotation", output_field=CharField()))
-            .values("content_type", "id", "created")
-            .order_by()
-        )
-        .union(
-            Note.objects.filter(is_draft=False)
-            .annotate(content_type=Value("note", output_field=CharField()))
-            .values("content_type", "id", "created")
-            .order_by()
-        )
-        .union(
-            Beat.objects.filter(is_draft=False)
-            .annotate(content_type=Value("beat", output_field=CharField()))
-            .values("content_type", "id", "created")
-            .order_by()
-        )
-        .union(
-            Chapter.objects.filter(
-                is_draft=False, guide__is_draft=False, is_unlisted=False
-            )
-            .annotate(content_type=Value("chapter", output_field=CharField()))
-            .values("content_type", "id", "created")
-            .order_by()
-        )
-        .order_by("-created")[:150]
+        ContentItem.objects.listed().as_mixed_dicts().order_by("-created")[:150]
     )
 
     # Bulk-load all candidate objects
     to_load = {}
     for item in candidates:
-        to_load.setdefault(item["content_type"], []).append(item["id"])
+        to_load.setdefault(item["type"], []).append(item["pk"])
     loaded = {}
     for content_type, model in (
         ("entry", Entry),
@@ -233,8 +213,8 @@ def index(request):
     # Reassemble in chronological order with full objects
     all_items = []
     for item in candidates:
-        ct = item["content_type"]
-        obj = loaded.get(ct, {}).get(item["id"])
+        ct = item["type"]
+        obj = loaded.get(ct, {}).get(item["pk"])
         if obj:
             all_items.append({"type": ct, "obj": obj})
     all_items.sort(key=lambda x: x["obj"].created, reverse=True)
@@ -248,18 +228,43 @@ def index(request):
             break
         items.append(item)
         spent += cost
+    return items
+
 
+def homepage_snapshot():
+    """
+    Everything the homepage needs, as a picklable dict: the timeline's
+    rendered HTML, the Highlights entries and the candidates for the
+    current tags
+    """
+    tag_candidates = current_tag_candidates()
+    for tag in tag_candidates:
+        tag.total_count()
+    return {
+        "items_html": render_to_string(
+            "includes/homepage_items.html", {"items": homepage_items()}
+        ),
+        "entries": list(
+            Entry.objects.filter(is_draft=False)
+            .only("id", "slug", "created", "title", "extra_head_html")
+            .prefetch_related("tags")[0:40]
+        ),
+        "tag_candidates": tag_candidates,
+        "has_guides": Guide.objects.filter(is_draft=False).exists(),
+    }
+
+
+def index(request):
+    # Rebuilt after anything is published, edited or deleted
+    snapshot = cached_snapshot("homepage", homepage_snapshot)
+    tag_candidates = snapshot["tag_candidates"]
     response = render(
         request,
         "homepage.html",
-        {
-            "items": items,
-            "entries": Entry.objects.filter(is_draft=False)
-            .only("id", "slug", "created", "title", "extra_head_html")
-            .prefetch_related("tags")[0:40],
-            "current_tags": find_current_tags(5),
-            "has_guides": Guide.objects.filter(is_draft=False).exists(),
-        },
+        dict(
+            snapshot,
+            current_tags=random.sample(tag_candidates, min(5, len(tag_candidates))),
+        ),
     )
     response["Cache-Control"] = "s-maxage=200"
     return response
@@ -310,8 +315,8 @@ def entry_updates_json(request, entry_id):
     return response
 
 
-def find_current_tags(num=5):
-    """Returns num random tags from top 30 in recent 400 taggings"""
+def current_tag_candidates():
+    """Returns the top 30 tags in recent 400 taggings, in random order"""
     last_400_tags = list(
         Tag.quotation_set.through.objects.annotate(
             created=models.F("quotation__created")
@@ -338,8 +343,8 @@ def find_current_tags(num=5):
     )
     candidates = [p[0] for p in counter.most_common(30)]
     random.shuffle(candidates)
-    tags = Tag.objects.in_bulk(candidates[:num], field_name="tag")
-    return [tags[tag] for tag in candidates[:num]]
+    tags = Tag.objects.in_bulk(candidates, field_name="tag")
+    return [tags[tag] for tag in candidates]
 
 
 def archive_year(request, year):
@@ -474,7 +479,7 @@ def archive_month(request, year, month):
     except EmptyPage:
         raise Http404
 
-    return render(
+    return render_streaming(
         request,
         "archive_month.html",
         {
@@ -487,50 +492,16 @@ def archive_month(request, year, month):
     )
 
 
-def _get_adjacent_content_days(current_date):
+def _adjacent_content_day_queries(current_date):
     """
-    Find the nearest previous and next days that have published content.
-    Returns (previous_date, next_date) where each is a datetime.date or None.
+    Querysets for the created timestamp of the nearest published item
+    before and after the given datetime.date, each a list of 0 or 1.
     """
-    previous_date = None
-    next_date = None
-
-    for model in (Blogmark, Entry, Quotation, Note, Beat, Chapter):
-        extra_filter = {}
-        if model == Chapter:
-            extra_filter["guide__is_draft"] = False
-            extra_filter["is_unlisted"] = False
-        prev_created = (
-            model.objects.filter(
-                created__date__lt=current_date,
-                is_draft=False,
-                **extra_filter,
-            )
-            .order_by("-created")
-            .values_list("created", flat=True)
-            .first()
-        )
-        if prev_created:
-            prev_day = prev_created.date()
-            if previous_date is None or prev_day > previous_date:
-                previous_date = prev_day
-
-        next_created = (
-            model.objects.filter(
-                created__date__gt=current_date,
-                is_draft=False,
-                **extra_filter,
-            )
-            .order_by("created")
-            .values_list("created", flat=True)
-            .first()
-        )
-        if next_created:
-            next_day = next_created.date()
-            if next_date is None or next_day < next_date:
-                next_date = next_day
-
-    return previous_date, next_date
+    listed = ContentItem.objects.listed().values_list("created", flat=True)
+    return (
+        listed.filter(created__date__lt=current_date).order_by("-created")[:1],
+        listed.filter(created__date__gt=current_date).order_by("created")[:1],
+    )
 
 
 def _day_archive_url(date):
@@ -548,40 +519,51 @@ def archive_day(request, year, month, day):
         return Redirect("/%s/%s/%s/" % (year, month, day))
     context = {}
     context["date"] = datetime.date(int(year), MONTHS_3_REV[month.lower()], int(day))
-    items = []  # Array of {'type': , 'obj': }
-    count = 0
-    for name, model in (
-        ("blogmark", Blogmark),
-        ("entry", Entry),
-        ("quotation", Quotation),
-        ("note", Note),
-        ("beat", Beat),
-        ("chapter", Chapter),
-    ):
+    date = context["date"]
+    types = ("blogmark", "entry", "quotation", "note", "beat", "chapter")
+    querysets = []
+    for model in (Blogmark, Entry, Quotation, Note, Beat, Chapter):
         extra_filter = {}
         if model == Chapter:
             extra_filter["guide__is_draft"] = False
             extra_filter["is_unlisted"] = False
         filt = model.objects.filter(
-            created__year=int(year),
-            created__month=MONTHS_3_REV[month.lower()],
-            created__day=int(day),
+            created__year=date.year,
+            created__month=date.month,
+            created__day=date.day,
             is_draft=False,
             **extra_filter,
         ).order_by("created")
         if model == Chapter:
             filt = filt.select_related("guide")
-        context[name] = list(filt)
-        count += len(context[name])
-        items.extend([{"type": name, "obj": obj} for obj in context[name]])
-    # Now do photosets separately because they have no created field
-    context["photoset"] = list(
+        querysets.append(filt)
+    # Photosets are separate because they have no created field
+    querysets.append(
         Photoset.objects.filter(
-            primary__created__year=int(year),
-            primary__created__month=MONTHS_3_REV[month.lower()],
-            primary__created__day=int(day),
-        )
+            primary__created__year=date.year,
+            primary__created__month=date.month,
+            primary__created__day=date.day,
+        ).select_related("primary")
+    )
+    photos = Photo.objects.filter(
+        created__year=date.year,
+        created__month=date.month,
+        created__day=date.day,
+    )
+    # These are all independent, so run them concurrently
+    results = run_in_parallel(
+        *querysets,
+        photos[:25],
+        photos.count,
+        *_adjacent_content_day_queries(date),
     )
+    items = []  # Array of {'type': , 'obj': }
+    count = 0
+    for name, objects in zip(types, results):
+        context[name] = objects
+        count += len(objects)
+        items.extend([{"type": name, "obj": obj} for obj in objects])
+    context["photoset"] = results[len(types)]
     for photoset in context["photoset"]:
         photoset.created = photoset.primary.created
     count += len(context["photoset"])
@@ -590,23 +572,19 @@ def archive_day(request, year, month, day):
         raise Http404("No photosets/photos/entries/quotes/links for that day")
     items.sort(key=lambda x: x["obj"].created)
     context["items"] = items
-    photos = Photo.objects.filter(
-        created__year=context["date"].year,
-        created__month=context["date"].month,
-        created__day=context["date"].day,
-    )
-    context["photos"] = photos[:25]
+    context["photos"], photo_count, previous_created, next_created = results[
+        len(types) + 1 :
+    ]
     # Should we show more_photos ?
-    if photos.count() > 25:
-        context["more_photos"] = photos.count()
+    if photo_count > 25:
+        context["more_photos"] = photo_count
     # Find adjacent days with content for navigation
-    previous_day, next_day = _get_adjacent_content_days(context["date"])
-    if previous_day:
-        context["previous_day"] = previous_day
-        context["previous_day_url"] = _day_archive_url(previous_day)
-    if next_day:
-        context["next_day"] = next_day
-        context["next_day_url"] = _day_archive_url(next_day)
+    if previous_created:
+        context["previous_day"] = previous_created[0].date()
+        context["previous_day_url"] = _day_archive_url(context["previous_day"])
+    if next_created:
+        context["next_day"] = next_created[0].date()
+        context["next_day_url"] = _day_archive_url(context["next_day"])
     return render(request, "archive_day.html", context)
 
 
@@ -616,72 +594,31 @@ def tag_index(request):
 
 def top_tags(request):
     """Display recent headlines for the 10 most popular tags."""
-    tags = (
-        Tag.objects.annotate(
-            entry_count=models.Count(
-                "entry", filter=models.Q(entry__is_draft=False), distinct=True
-            ),
-            blogmark_count=models.Count(
-                "blogmark", filter=models.Q(blogmark__is_draft=False), distinct=True
-            ),
-            quotation_count=models.Count(
-                "quotation", filter=models.Q(quotation__is_draft=False), distinct=True
-            ),
-            note_count=models.Count(
-                "note", filter=models.Q(note__is_draft=False), distinct=True
-            ),
-            beat_count=models.Count(
-                "beat", filter=models.Q(beat__is_draft=False), distinct=True
-            ),
-            chapter_count=models.Count(
-                "guides_chapter_set",
-                filter=models.Q(
-                    guides_chapter_set__is_draft=False,
-                    guides_chapter_set__guide__is_draft=False,
-                    guides_chapter_set__is_unlisted=False,
-                ),
-                distinct=True,
-            ),
-        )
-        .annotate(
-            total=models.F("entry_count")
-            + models.F("blogmark_count")
-            + models.F("quotation_count")
-            + models.F("note_count")
-            + models.F("beat_count")
-            + models.F("chapter_count")
-        )
-        .order_by("-total")[:10]
-    )
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            select tag_id, count(*) from blog_contentitem, unnest(tag_ids) as tag_id
+            where not is_draft and not is_unlisted
+            group by tag_id order by count(*) desc, tag_id limit 10
+            """)
+        totals = cursor.fetchall()
+    tags_by_id = Tag.objects.in_bulk([tag_id for tag_id, _ in totals])
     tags_info = [
         {
-            "tag": tag,
-            "total": tag.total,
-            "recent_entries": tag.entry_set.filter(is_draft=False).order_by("-created")[
-                :5
-            ],
+            "tag": tags_by_id[tag_id],
+            "total": total,
+            "recent_entries": Entry.objects.filter(
+                is_draft=False, tag_ids__contains=[tag_id]
+            ).order_by("-created")[:5],
         }
-        for tag in tags
+        for tag_id, total in totals
     ]
     return render(request, "top_tags.html", {"tags_info": tags_info})
 
 
-def _tagged_items_metadata(model, content_type, tags, **extra_filters):
-    return (
-        model.objects.filter(is_draft=False, tags__tag__in=tags, **extra_filters)
-        .values("id", "created")
-        .annotate(tag_match_count=Count("tags", distinct=True))
-        .filter(tag_match_count=len(tags))
-        .annotate(content_type=Value(content_type, output_field=CharField()))
-        .values("content_type", "id", "created")
-        .order_by()
-    )
-
-
 def _load_tagged_items(rows):
     to_load = {}
     for row in rows:
-        to_load.setdefault(row["content_type"], []).append(row["id"])
+        to_load.setdefault(row["type"], []).append(row["pk"])
 
     loaded = {}
     for content_type, model in (
@@ -705,9 +642,9 @@ def _load_tagged_items(rows):
             loaded[content_type] = model.objects.prefetch_related("tags").in_bulk(ids)
 
     return [
-        {"type": row["content_type"], "obj": loaded[row["content_type"]][row["id"]]}
+        {"type": row["type"], "obj": loaded[row["type"]][row["pk"]]}
         for row in rows
-        if row["id"] in loaded.get(row["content_type"], {})
+        if row["pk"] in loaded.get(row["type"], {})
     ]
 
 
@@ -715,7 +652,7 @@ def archive_tag(request, tags, atom=False):
     from .feeds import EverythingTagged
 
     tags_ = list(
-        Tag.objects.filter(tag__in=tags.split("+")).values_list("tag", flat=True)[:3]
+        Tag.objects.filter(tag__in=tags.split("+")).values_list("pk", "tag")[:3]
     )
     if not tags_:
         # Try for a previous tag name
@@ -727,39 +664,44 @@ def archive_tag(request, tags, atom=False):
             return Redirect("/tag/%s/" % previous.tag.tag)
 
         raise Http404
-    tags = tags_
+    tags = [tag for _, tag in tags_]
     tagged_items = (
-        _tagged_items_metadata(Entry, "entry", tags)
-        .union(
-            _tagged_items_metadata(Quotation, "quotation", tags),
-            _tagged_items_metadata(Blogmark, "blogmark", tags),
-            _tagged_items_metadata(Note, "note", tags),
-            _tagged_items_metadata(Beat, "beat", tags),
-            _tagged_items_metadata(
-                Chapter,
-                "chapter",
-                tags,
-                guide__is_draft=False,
-                is_unlisted=False,
-            ),
-            all=True,
-        )
-        .order_by("-created")
+        ContentItem.objects.listed()
+        .tagged(pk for pk, _ in tags_)
+        .as_mixed_dicts()
+        .order_by(*["-" + field for field, _ in CONTENT_ITEM_ORDERING])
     )
 
     # Paginate it
-    paginator = Paginator(tagged_items, min(1000, int(request.GET.get("size") or "30")))
+    paginator = CachedCountPaginator(
+        tagged_items,
+        min(1000, int(request.GET.get("size") or "30")),
+        cache_key={"archive_tag": sorted(tags)},
+    )
     if not paginator.count:
         raise Http404
-    page_number = request.GET.get("page") or "1"
-    if page_number == "last":
-        page_number = paginator.num_pages
-    try:
-        page = paginator.page(page_number)
-    except PageNotAnInteger:
-        raise Http404
-    except EmptyPage:
-        raise Http404
+    cursor = request.GET.get("cursor")
+    if cursor is not None:
+        try:
+            page = cursor_paginate(
+                tagged_items, CONTENT_ITEM_ORDERING, paginator.per_page, cursor
+            )
+        except InvalidCursor:
+            raise Http404
+    else:
+        page_number = request.GET.get("page") or "1"
+        if page_number == "last":
+            if paginator.count_is_estimate:
+                # An estimate could be far off either way, so count exactly
+                # for the one request that needs it
+                paginator.counted = (tagged_items.count(), False)
+            page_number = paginator.num_pages
+        try:
+            page = paginator.page(page_number)
+        except PageNotAnInteger:
+            raise Http404
+        except EmptyPage:
+            raise Http404
     page.object_list = _load_tagged_items(list(page.object_list))
 
     if atom:
@@ -769,18 +711,22 @@ def archive_tag(request, tags, atom=False):
         # Pagination in link: header
         if page.has_next():
             query_dict = request.GET.copy()
-            query_dict["page"] = str(page.next_page_number())
+            if cursor is not None:
+                query_dict["cursor"] = page.next_cursor
+            else:
+                query_dict["page"] = str(page.next_page_number())
             next_url = request.path + "?" + query_dict.urlencode()
             response["link"] = '<{}>; rel="next"'.format(next_url)
         return response
 
-    return render(
+    return render_streaming(
         request,
         "archive_tag.html",
         {
             "tags": tags,
             "items": page.object_list,
             "total": paginator.count,
+            "total_is_estimate": paginator.count_is_estimate,
             "page": page,
             "only_one_tag": len(tags) == 1,
             "tag": Tag.objects.get(tag=tags[0]),
@@ -849,8 +795,13 @@ def _purge_cloudflare_cache():
 def tools(request):
     if request.POST.get("purge_all"):
         try:
-            _purge_cloudflare_cache()
-            msg = "Cache purged"
+            job = jobs.enqueue("purge_cloudflare_cache", key="purge")
+            if job is jobs.ALREADY_QUEUED:
+                msg = "Cache purge already queued"
+            elif job:
+                msg = "Cache purge queued"
+            else:
+                msg = "Cache purged"
         except CloudflareError as e:
             msg = "Cache purge failed: %s" % e
         return Redirect(request.path + "?" + urlencode({"msg": msg}))
@@ -860,6 +811,42 @@ def tools(request):
         {
             "msg": request.GET.get("msg"),
             "deployed_hash": os.environ.get("HEROKU_SLUG_COMMIT"),
+            "fragment_stats": fragment_cache_stats(
+                ["xhtml-" + name for name in TEMPLATE_XHTML_PIPELINES]
+                + [ItemFragments.name]
+            ),
+        },
+    )
+
+
+@never_cache
+@staff_member_required
+def tools_jobs(request):
+    now = timezone.now()
+    queued = Job.objects.filter(status=Job.Status.QUEUED)
+    oldest = queued.aggregate(oldest=Min("created"))["oldest"]
+    recent = Job.objects.filter(started__gte=now - datetime.timedelta(hours=1))
+    return render(
+        request,
+        "tools_jobs.html",
+        {
+            "background_jobs": settings.BACKGROUND_JOBS,
+            "counts": dict(
+                Job.objects.values_list("status").annotate(n=Count("id")).order_by()
+            ),
+            "runnable": queued.filter(run_after__lte=now).count(),
+            "oldest_queued_age": now - oldest if oldest else None,
+            "average_wait": recent.aggregate(
+                wait=models.Avg(models.F("started") - models.F("run_after"))
+            )["wait"],
+            "average_duration": recent.filter(finished__isnull=False).aggregate(
+                duration=models.Avg(models.F("finished") - models.F("started"))
+            )["duration"],
+            "by_name": Job.objects.filter(status=Job.Status.QUEUED)
+            .values("name")
+            .annotate(n=Count("id"))
+            .order_by("-n"),
+            "failures": Job.objects.exclude(last_error="").order_by("-started")[:20],
         },
     )
 
@@ -869,8 +856,13 @@ def tools(request):
 @staff_member_required
 def admin_purge_cache(request):
     try:
-        _purge_cloudflare_cache()
-        messages.success(request, "Cloudflare cache purged")
+        job = jobs.enqueue("purge_cloudflare_cache", key="purge")
+        if job is jobs.ALREADY_QUEUED:
+            messages.info(request, "Cloudflare cache purge already queued")
+        elif job:
+            messages.success(request, "Cloudflare cache purge queued")
+        else:
+            messages.success(request, "Cloudflare cache purged")
     except CloudflareError as e:
         messages.error(request, "Cloudflare cache purge failed: %s" % e)
     return Redirect("/admin/")
@@ -948,47 +940,17 @@ def random_tag_redirect(request, tag):
     Redirect to a random item (entry, blogmark, quotation, or note) with the given tag.
     Uses no-cache headers so Cloudflare doesn't cache the redirect.
     """
-    from django.db import connection
-
     tag_obj = get_object_or_404(Tag, tag=tag)
 
-    # Use a CTE to efficiently select one random item from all content types
-    # This avoids loading all items into memory for tags with thousands of items
-    sql = """
-    WITH all_items AS (
-        SELECT id AS pk, 'entry' AS type FROM blog_entry
-        WHERE is_draft = false AND id IN (
-            SELECT entry_id FROM blog_entry_tags WHERE tag_id = %s
-        )
-        UNION ALL
-        SELECT id AS pk, 'blogmark' AS type FROM blog_blogmark
-        WHERE is_draft = false AND id IN (
-            SELECT blogmark_id FROM blog_blogmark_tags WHERE tag_id = %s
-        )
-        UNION ALL
-        SELECT id AS pk, 'quotation' AS type FROM blog_quotation
-        WHERE is_draft = false AND id IN (
-            SELECT quotation_id FROM blog_quotation_tags WHERE tag_id = %s
-        )
-        UNION ALL
-        SELECT id AS pk, 'note' AS type FROM blog_note
-        WHERE is_draft = false AND id IN (
-            SELECT note_id FROM blog_note_tags WHERE tag_id = %s
-        )
-        UNION ALL
-        SELECT id AS pk, 'beat' AS type FROM blog_beat
-        WHERE is_draft = false AND id IN (
-            SELECT beat_id FROM blog_beat_tags WHERE tag_id = %s
-        )
+    # ORDER BY RANDOM() LIMIT 1 against the GIN-indexed tag_ids column
+    row = (
+        ContentItem.objects.published()
+        .tagged([tag_obj.pk])
+        .exclude(content_type="chapter")
+        .values_list("object_id", "content_type")
+        .order_by("?")
+        .first()
     )
-    SELECT pk, type FROM all_items ORDER BY RANDOM() LIMIT 1
-    """
-
-    with connection.cursor() as cursor:
-        cursor.execute(
-            sql, [tag_obj.pk, tag_obj.pk, tag_obj.pk, tag_obj.pk, tag_obj.pk]
-        )
-        row = cursor.fetchone()
 
     if not row:
         raise Http404("No items found with this tag")
@@ -1081,6 +1043,49 @@ def api_add_tag(request):
     return JsonResponse({"success": True, "tag": tag_name})
 
 
+MERGE_TAG_MODELS = (
+    ("entries", Entry),
+    ("blogmarks", Blogmark),
+    ("quotations", Quotation),
+    ("notes", Note),
+    ("beats", Beat),
+    ("chapters", Chapter),
+)
+
+
+@transaction.atomic
+def _merge_tag(source_tag, destination_tag):
+    """
+    Re-tag everything tagged source_tag with destination_tag using a few
+    statements per content type, returning the details for TagMerge
+    """
+    details = {}
+    for key, model in MERGE_TAG_MODELS:
+        # The through table, not the denormalized tag_ids, is the source of truth
+        through = model.tags.through
+        fk = model.tags.field.m2m_field_name()
+        tagged = set(through.objects.filter(tag=source_tag).values_list(fk, flat=True))
+        already_tagged = set(
+            through.objects.filter(
+                tag=destination_tag, **{fk + "__in": tagged}
+            ).values_list(fk, flat=True)
+        )
+        added = tagged - already_tagged
+        through.objects.filter(tag=source_tag, **{fk + "__in": already_tagged}).delete()
+        through.objects.filter(tag=source_tag).update(tag=destination_tag)
+        affected = already_tagged | added
+        sync_tag_ids(model, affected)
+        if settings.SEARCH_DOCUMENT_TRIGGERS:
+            refresh_content_items(model, affected)
+        else:
+            reindex_queryset(model.objects.filter(pk__in=affected))
+        details[key] = {
+            "added": sorted(added),
+            "already_tagged": sorted(already_tagged),
+        }
+    return details
+
+
 @staff_member_required
 @never_cache
 def merge_tags(request):
@@ -1120,50 +1125,7 @@ def merge_tags(request):
     # Handle POST request (perform the merge)
     if request.method == "POST" and source_tag and destination_tag and not error:
         if request.POST.get("confirm") == "yes":
-            # Track items where tag was added vs just removed
-            details = {
-                "entries": {"added": [], "already_tagged": []},
-                "blogmarks": {"added": [], "already_tagged": []},
-                "quotations": {"added": [], "already_tagged": []},
-                "notes": {"added": [], "already_tagged": []},
-            }
-
-            # Re-tag all content from source to destination
-            for entry in Entry.objects.filter(tags=source_tag):
-                already_has_dest = destination_tag in entry.tags.all()
-                entry.tags.remove(source_tag)
-                if already_has_dest:
-                    details["entries"]["already_tagged"].append(entry.pk)
-                else:
-                    entry.tags.add(destination_tag)
-                    details["entries"]["added"].append(entry.pk)
-
-            for blogmark in Blogmark.objects.filter(tags=source_tag):
-                already_has_dest = destination_tag in blogmark.tags.all()
-                blogmark.tags.remove(source_tag)
-                if already_has_dest:
-                    details["blogmarks"]["already_tagged"].append(blogmark.pk)
-                else:
-                    blogmark.tags.add(destination_tag)
-                    details["blogmarks"]["added"].append(blogmark.pk)
-
-            for quotation in Quotation.objects.filter(tags=source_tag):
-                already_has_dest = destination_tag in quotation.tags.all()
-                quotation.tags.remove(source_tag)
-                if already_has_dest:
-                    details["quotations"]["already_tagged"].append(quotation.pk)
-                else:
-                    quotation.tags.add(destination_tag)
-                    details["quotations"]["added"].append(quotation.pk)
-
-            for note in Note.objects.filter(tags=source_tag):
-                already_has_dest = destination_tag in note.tags.all()
-                note.tags.remove(source_tag)
-                if already_has_dest:
-                    details["notes"]["already_tagged"].append(note.pk)
-                else:
-                    note.tags.add(destination_tag)
-                    details["notes"]["added"].append(note.pk)
+            details = _merge_tag(source_tag, destination_tag)
 
             # Create PreviousTagName for redirect
             PreviousTagName.objects.create(
@@ -1215,28 +1177,15 @@ def merge_tags(request):
     if source_tag and destination_tag:
         # Count items with source tag that DON'T have destination tag (will be added)
         # Count items with source tag that DO have destination tag (already tagged)
-        counts = {
-            "entries": {
-                "total": source_tag.entry_set.count(),
-                "will_add": source_tag.entry_set.exclude(tags=destination_tag).count(),
-            },
-            "blogmarks": {
-                "total": source_tag.blogmark_set.count(),
-                "will_add": source_tag.blogmark_set.exclude(
-                    tags=destination_tag
-                ).count(),
-            },
-            "quotations": {
-                "total": source_tag.quotation_set.count(),
-                "will_add": source_tag.quotation_set.exclude(
-                    tags=destination_tag
+        counts = {}
+        for key, model in MERGE_TAG_MODELS:
+            tagged = model.objects.filter(tag_ids__contains=[source_tag.pk])
+            counts[key] = {
+                "total": tagged.count(),
+                "will_add": tagged.exclude(
+                    tag_ids__contains=[destination_tag.pk]
                 ).count(),
-            },
-            "notes": {
-                "total": source_tag.note_set.count(),
-                "will_add": source_tag.note_set.exclude(tags=destination_tag).count(),
-            },
-        }
+            }
         for k in counts:
             counts[k]["already_tagged"] = counts[k]["total"] - counts[k]["will_add"]
         counts["total"] = sum(
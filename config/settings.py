@@ -169,6 +169,21 @@ if "DATABASE_URL" in os.environ:
 if "DISABLE_AUTOCOMMIT" in os.environ:
     DATABASES["default"]["AUTOCOMMIT"] = False
 
+# Thread pool size for blog.concurrency.run_in_parallel(), 0 runs queries
+# serially. Only worth enabling alongside CONN_MAX_AGE, otherwise each pool
+# thread opens a fresh database connection per query.
+PARALLEL_QUERY_THREADS = int(os.environ.get("PARALLEL_QUERY_THREADS") or 0)
+if "CONN_MAX_AGE" in os.environ:
+    DATABASES["default"]["CONN_MAX_AGE"] = int(os.environ["CONN_MAX_AGE"])
+
+# Let Postgres triggers (blog/triggers.py) maintain search_document instead
+# of blog/signals.py - applied to the database by the next migrate
+SEARCH_DOCUMENT_TRIGGERS = bool(os.environ.get("SEARCH_DOCUMENT_TRIGGERS"))
+
+# Hand slow post-save work to "manage.py run_jobs" (blog/jobs.py) rather
+# than running it in the web process once the transaction commits
+BACKGROUND_JOBS = bool(os.environ.get("BACKGROUND_JOBS"))
+
 # Honor the 'X-Forwarded-Proto' header for request.is_secure()
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
@@ -210,9 +225,32 @@ SILENCED_SYSTEM_CHECKS = ("urls.W002",)
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-    }
+    },
+    # Seen by every web worker, job worker and management command, in a
+    # table that "manage.py migrate" creates (see blog.signals.on_migrate).
+    # Holds the content version that the other caches are keyed on.
+    "shared": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "blog_shared_cache",
+    },
+    # Rendered blog_mixed_list items - see blog.caching.ItemFragments. One
+    # copy of each item for every worker, created alongside "shared"
+    "fragments": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "fragment_cache",
+        "OPTIONS": {"MAX_ENTRIES": 50000},
+    },
 }
 
+# Result counts above this are planner estimates, shown as "about N results"
+EXACT_COUNT_LIMIT = 10000
+
+# Written by "manage.py fetch_spelling_index" as a web dyno starts, from the copy
+# build_spelling_index stores on release. Memory-mapped by each worker
+SPELLING_INDEX_PATH = os.environ.get("SPELLING_INDEX_PATH") or os.path.join(
+    BASE_DIR, "spelling-index.bin"
+)
+
 S3_WEB_MANAGER_PERMISSION = (
     lambda request: request.user.is_authenticated and request.user.is_superuser
 )
@@ -196,6 +196,7 @@ urlpatterns = [
     re_path(r"^sitemap\.xml$", feeds.sitemap),
     path("tools/", blog_views.tools),
     path("tools/extract-title/", blog_views.tools_extract_title),
+    path("tools/jobs/", blog_views.tools_jobs),
     path(
         "tools/s3/",
         include(
@@ -0,0 +1,42 @@
+# Generated by Django 6.1 on 2026-10-17 02:12
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+BACKFILL_SQL = """
+update guides_chapter set tag_ids = t.tag_ids
+from (
+    select chapter_id, array_agg(tag_id order by tag_id) as tag_ids
+    from guides_chapter_tags group by chapter_id
+) t
+where t.chapter_id = guides_chapter.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0051_tag_ids"),
+        ("guides", "0003_chapter_is_unlisted"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chapter",
+            name="tag_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.IntegerField(),
+                blank=True,
+                default=list,
+                editable=False,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="chapter",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["tag_ids"], name="guides_chap_tag_ids_a6fd8f_gin"
+            ),
+        ),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
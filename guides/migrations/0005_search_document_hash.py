@@ -0,0 +1,20 @@
+# Generated by Django 6.1 on 2026-10-17 02:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("guides", "0004_chapter_tag_ids"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chapter",
+            name="search_document_hash",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=32
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.1 on 2026-10-17 03:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("guides", "0005_search_document_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chapter",
+            name="render_version",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="chapter",
+            name="rendered_excerpt",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="chapter",
+            name="rendered_html",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+    ]
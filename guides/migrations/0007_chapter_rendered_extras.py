@@ -0,0 +1,30 @@
+# Generated by Django 6.1 on 2026-10-17 03:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("guides", "0006_chapter_rendered_html"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chapter",
+            name="rendered_body_hash",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=32
+            ),
+        ),
+        migrations.AddField(
+            model_name="chapter",
+            name="rendered_feed_html",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="chapter",
+            name="rendered_headings",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+    ]
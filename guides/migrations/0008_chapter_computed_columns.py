@@ -0,0 +1,35 @@
+# Generated by Django 6.1 on 2026-10-17 04:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("guides", "0007_chapter_rendered_extras"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chapter",
+            name="domain",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=255
+            ),
+        ),
+        migrations.AddField(
+            model_name="chapter",
+            name="image_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="chapter",
+            name="paragraph_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="chapter",
+            name="word_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+    ]
@@ -1,12 +1,14 @@
+import hashlib
 import re
 from html import escape
+from xml.etree import ElementTree
 
 from django.db import models
 from django.utils import timezone
 from django.utils.safestring import mark_safe
-from markdown import markdown
 
 from blog.models import BaseModel, Tag, Series
+from blog.rendering import register_profile, render_markdown
 
 
 def _markdown_copy_formatter(source, language, css_class, options, md, **kwargs):
@@ -34,6 +36,26 @@ _CUSTOM_FENCES_FEED = [
 ]
 
 
+def _chapter_profile(custom_fences):
+    return {
+        "extensions": ["pymdownx.superfences", "pymdownx.highlight", "toc"],
+        "extension_configs": {
+            "pymdownx.superfences": {
+                "custom_fences": custom_fences,
+            },
+            "pymdownx.highlight": {
+                "guess_lang": False,
+                "css_class": "codehilite",
+                "use_pygments": True,
+            },
+        },
+    }
+
+
+register_profile("chapter", **_chapter_profile(_CUSTOM_FENCES))
+register_profile("chapter_feed", **_chapter_profile(_CUSTOM_FENCES_FEED))
+
+
 class Guide(models.Model):
     created = models.DateTimeField(default=timezone.now)
     updated = models.DateTimeField(auto_now=True)
@@ -91,8 +113,22 @@ class Chapter(BaseModel):
     body = models.TextField()
     order = models.IntegerField(default=0)
     is_unlisted = models.BooleanField(default=False)
+    # Stored on save alongside rendered_html (the "chapter" profile) and
+    # rendered_excerpt (its first three paragraphs)
+    rendered_feed_html = models.TextField(blank=True, default="", editable=False)
+    rendered_headings = models.JSONField(default=list, blank=True, editable=False)
+    # md5 of the body the rendered_* fields were built from
+    rendered_body_hash = models.CharField(
+        max_length=32, blank=True, default="", editable=False
+    )
     is_chapter = True
 
+    RENDERED_FIELDS = BaseModel.RENDERED_FIELDS + (
+        "rendered_feed_html",
+        "rendered_headings",
+        "rendered_body_hash",
+    )
+
     def save(self, **kwargs):
         is_new = self.pk is None
         if not is_new:
@@ -117,39 +153,60 @@ class Chapter(BaseModel):
                 is_draft=self.is_draft,
             )
 
-    def _render_body(self, custom_fences):
-        return mark_safe(
-            markdown(
-                self.body,
-                extensions=["pymdownx.superfences", "pymdownx.highlight", "toc"],
-                extension_configs={
-                    "pymdownx.superfences": {
-                        "custom_fences": custom_fences,
-                    },
-                    "pymdownx.highlight": {
-                        "guess_lang": False,
-                        "css_class": "codehilite",
-                        "use_pygments": True,
-                    },
-                },
-            )
-        )
+    def render(self):
+        from blog.templatetags.entry_tags import first_three_paragraphs, xhtml2html
+
+        html = render_markdown(self.body, "chapter")
+        try:
+            excerpt = str(xhtml2html(first_three_paragraphs(html)))
+        except ElementTree.ParseError:
+            excerpt = None
+        return html, excerpt
+
+    def update_rendered(self):
+        super().update_rendered()
+        self.rendered_feed_html = render_markdown(self.body, "chapter_feed")
+        self.rendered_headings = [
+            {"id": m.group(1), "title": re.sub(r"<[^>]+>", "", m.group(2))}
+            for m in re.finditer(r'<h2\s+id="([^"]+)">(.*?)</h2>', self.rendered_html)
+        ]
+        self.rendered_body_hash = self.body_hash()
+
+    def body_hash(self):
+        return hashlib.md5(self.body.encode("utf-8")).hexdigest()
+
+    def _rendered(self):
+        """
+        self, first re-rendering in memory if the stored fields were built
+        from a different body or an older RENDER_VERSION
+        """
+        if (
+            self.render_version != self.RENDER_VERSION
+            or self.rendered_body_hash != self.body_hash()
+        ):
+            self.update_rendered()
+        return self
 
     def body_rendered(self):
-        return self._render_body(_CUSTOM_FENCES)
+        return mark_safe(self._rendered().rendered_html)
 
     def body_rendered_for_feed(self):
-        return self._render_body(_CUSTOM_FENCES_FEED)
+        return mark_safe(self._rendered().rendered_feed_html)
+
+    def excerpt_rendered(self):
+        "The first three paragraphs (and headings between them) of body_rendered()"
+        rendered = self._rendered()
+        return mark_safe(rendered.rendered_excerpt or rendered.rendered_html)
 
     def h2_headings(self):
-        html = str(self.body_rendered())
-        return [
-            {"id": m.group(1), "title": re.sub(r"<[^>]+>", "", m.group(2))}
-            for m in re.finditer(r'<h2\s+id="([^"]+)">(.*?)</h2>', html)
-        ]
+        return self._rendered().rendered_headings
+
+    def computed_values(self):
+        # As counted by the |wordcount filter, as chapter_excerpt always has
+        return dict(super().computed_values(), word_count=len(self.body.split()))
 
     def multi_paragraph(self):
-        return str(self.body_rendered()).count("<p") > 3
+        return self._rendered().paragraph_count > 3
 
     def get_absolute_url(self):
         return "/guides/{}/{}/".format(self.guide.slug, self.slug)
@@ -161,7 +218,15 @@ class Chapter(BaseModel):
         return {
             "A": self.title,
             "C": self.body,
-            "B": " ".join(self.tags.values_list("tag", flat=True)),
+            "B": self.tag_names(),
+        }
+
+    @classmethod
+    def index_expressions(cls):
+        return {
+            "A": models.F("title"),
+            "C": models.F("body"),
+            "B": cls.tag_names_expression(),
         }
 
     def __str__(self):
@@ -1,6 +1,7 @@
 from django.db import models
 from django.utils.safestring import mark_safe
-from markdown import markdown
+
+from blog.rendering import render_markdown
 
 
 class Newsletter(models.Model):
@@ -17,4 +18,4 @@ class Newsletter(models.Model):
 
     @property
     def body_html(self):
-        return mark_safe(markdown(self.body))
+        return mark_safe(render_markdown(self.body))
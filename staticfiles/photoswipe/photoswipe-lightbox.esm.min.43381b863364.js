@@ -0,0 +1,5 @@
+/*!
+  * PhotoSwipe Lightbox 5.1.7 - https://photoswipe.com
+  * (c) 2021 Dmitry Semenov
+  */
+function t(t,i,s){const h=document.createElement(i||"div");return t&&(h.className=t),s&&s.appendChild(h),h}function i(t,i,s){t.style.width="number"==typeof i?i+"px":i,t.style.height="number"==typeof s?s+"px":s}const s="idle",h="loading",e="loaded",n="error";function r(t,i,s=document){let h=[];if(t instanceof Element)h=[t];else if(t instanceof NodeList||Array.isArray(t))h=Array.from(t);else{const e="string"==typeof t?t:i;e&&(h=Array.from(s.querySelectorAll(e)))}return h}class o{constructor(t,i){this.type=t,i&&Object.assign(this,i)}preventDefault(){this.defaultPrevented=!0}}class a{constructor(t,i){this.options=i.options,this.instance=i,this.data=t,this.width=Number(this.data.w)||Number(this.data.width)||0,this.height=Number(this.data.h)||Number(this.data.height)||0,this.isAttached=!1,this.state=s}setSlide(t){this.slide=t,this.pswp=t.pswp}load(){this.element||(this.element=t("pswp__content"),this.element.style.position="absolute",this.element.style.left=0,this.element.style.top=0,this.element.innerHTML=this.data.html||"")}isZoomable(){return!1}usePlaceholder(){return!1}activate(){}deactivate(){}setDisplayedSize(t,s){this.element&&i(this.element,t,s)}onLoaded(){this.state=e,this.slide&&this.pswp.dispatch("loadComplete",{slide:this.slide})}keepPlaceholder(){return this.state===h}onError(){this.state=n,this.slide&&(this.pswp.dispatch("loadComplete",{slide:this.slide,isError:!0}),this.pswp.dispatch("loadError",{slide:this.slide}))}getErrorElement(){return!1}remove(){this.isAttached=!1,this.element&&this.element.parentNode&&this.element.remove()}appendTo(t){this.isAttached=!0,this.element&&!this.element.parentNode&&t.appendChild(this.element)}destroy(){}}class l extends a{load(){if(this.element)return;const i=this.data.src;i&&(this.element=t("pswp__img","img"),this.data.srcset&&(this.element.srcset=this.data.srcset),this.element.src=i,this.element.alt=this.data.alt||"",this.state=h,this.element.complete?this.onLoaded():(this.element.onload=()=>{this.onLoaded()},this.element.onerror=()=>{this.onError()}))}setDisplayedSize(t,s){const h=this.element;h&&(i(h,t,"auto"),h.srcset&&(!h.dataset.largestUsedSize||t>h.dataset.largestUsedSize)&&(h.sizes=t+"px",h.dataset.largestUsedSize=t),this.slide&&this.pswp.dispatch("imageSizeChange",{slide:this.slide,width:t,height:s}))}isZoomable(){return this.state!==n}usePlaceholder(){return!0}lazyLoad(){this.load()}destroy(){this.element&&(this.element.onload=null,this.element.onerror=null,this.element=null)}appendTo(t){this.isAttached=!0,this.slide&&!this.slide.isActive&&"decode"in this.element?(this.isDecoding=!0,requestAnimationFrame((()=>{this.element&&this.element.decode().then((()=>{this.isDecoding=!1,requestAnimationFrame((()=>{this.appendImageTo(t)}))})).catch((()=>{}))}))):this.appendImageTo(t)}activate(){this.slide&&this.slide.container&&this.isDecoding&&this.appendImageTo(this.slide.container)}getErrorElement(){const i=t("pswp__error-msg-container");i.innerHTML=this.options.errorMsg;const s=i.querySelector("a");return s&&(s.href=this.data.src),i}appendImageTo(t){this.element&&!this.element.parentNode&&this.isAttached&&t.appendChild(this.element)}}function u(t,i,s){let h;if(i.paddingFn)h=i.paddingFn(s)[t];else if(i.padding)h=i.padding[t];else{const s="padding"+t[0].toUpperCase()+t.slice(1);i[s]&&(h=i[s])}return h||0}class c{constructor(t,i,s,h){this.pswp=h,this.options=t,this.itemData=i,this.index=s}update(t,i,s){this.elementSize={x:t,y:i},this.panAreaSize=s;const h=this.panAreaSize.x/this.elementSize.x,e=this.panAreaSize.y/this.elementSize.y;this.fit=Math.min(1,h<e?h:e),this.fill=Math.min(1,h>e?h:e),this.vFill=Math.min(1,e),this.initial=this.t(),this.secondary=this.i(),this.max=Math.max(this.initial,this.secondary,this.o()),this.min=Math.min(this.fit,this.initial,this.secondary),this.pswp&&this.pswp.dispatch("zoomLevelsUpdate",{zoomLevels:this,slideData:this.itemData})}l(t){const i=this.options[t+"ZoomLevel"];if(i)return"function"==typeof i?i(this):"fill"===i?this.fill:"fit"===i?this.fit:Number(i)}i(){let t=this.l("secondary");return t||(t=Math.min(1,3*this.fit),t*this.elementSize.x>4e3&&(t=4e3/this.elementSize.x),t)}t(){return this.l("initial")||this.fit}o(){const t=this.l("max");return t||Math.max(1,4*this.fit)}}function d(t,i,s){const h=i.createContentFromData(t);if(!h||!h.lazyLoad)return;h.key=function(t,i){return t&&t.src?t.src+"_"+i:i}(t,s);const{options:e}=i,n=i.viewportSize||function(t,i){if(t.getViewportSizeFn){const s=t.getViewportSizeFn(t,i);if(s)return s}return{x:document.documentElement.clientWidth,y:window.innerHeight}}(e),r=function(t,i){return{x:i.x-u("left",t,i)-u("right",t,i),y:i.y-u("top",t,i)-u("bottom",t,i)}}(e,n),o=new c(e,t,-1);return o.update(h.width,h.height,r),h.lazyLoad(),h.setDisplayedSize(Math.ceil(h.width*o.initial),Math.ceil(h.height*o.initial)),h}class m extends class extends class{constructor(){this.u={},this.m={}}addFilter(t,i,s=100){this.m[t]||(this.m[t]=[]),this.m[t].push({fn:i,priority:s}),this.m[t].sort(((t,i)=>t.priority-i.priority)),this.pswp&&this.pswp.addFilter(t,i,s)}removeFilter(t,i){this.m[t]&&(this.m[t]=this.m[t].filter((t=>t.fn!==i))),this.pswp&&this.pswp.removeFilter(t,i)}applyFilters(t,...i){return this.m[t]&&this.m[t].forEach((t=>{i[0]=t.fn.apply(this,i)})),i[0]}on(t,i){this.u[t]||(this.u[t]=[]),this.u[t].push(i),this.pswp&&this.pswp.on(t,i)}off(t,i){this.u[t]&&(this.u[t]=this.u[t].filter((t=>i!==t))),this.pswp&&this.pswp.off(t,i)}dispatch(t,i){if(this.pswp)return this.pswp.dispatch(t,i);const s=new o(t,i);return this.u?(this.u[t]&&this.u[t].forEach((t=>{t.call(this,s)})),s):s}}{constructor(){super(),this.contentTypes={image:l,html:a}}getNumItems(){let t;const{dataSource:i}=this.options;i?i.length?t=i.length:i.gallery&&(i.items||(i.items=this.p(i.gallery)),i.items&&(t=i.items.length)):t=0;const s=this.dispatch("numItems",{dataSource:i,numItems:t});return this.applyFilters("numItems",s.numItems,i)}addContentType(t,i){this.contentTypes[t]=i}getContentClass(t){return t.type?this.contentTypes[t.type]:t.src?this.contentTypes.image:t.html?this.contentTypes.html:void 0}createContentFromData(t){return new(this.getContentClass(t))(t,this)}getItemData(t){const{dataSource:i}=this.options;let s;Array.isArray(i)?s=i[t]:i&&i.gallery&&(i.items||(i.items=this.p(i.gallery)),s=i.items[t]);let h=s;h instanceof Element&&(h=this.g(h));const e=this.dispatch("itemData",{itemData:h||{},index:t});return this.applyFilters("itemData",e.itemData,t)}p(t){return this.options.children||this.options.childSelector?r(this.options.children,this.options.childSelector,t)||[]:[t]}g(t){const i={element:t},s="A"===t.tagName?t:t.querySelector("a");if(s){i.src=s.dataset.pswpSrc||s.href,i.srcset=s.dataset.pswpSrcset,i.w=parseInt(s.dataset.pswpWidth,10),i.h=parseInt(s.dataset.pswpHeight,10),s.dataset.pswpType&&(i.type=s.dataset.pswpType);const h=t.querySelector("img");h&&(i.msrc=h.currentSrc||h.src,i.alt=h.getAttribute("alt")),(s.dataset.pswpCropped||s.dataset.cropped)&&(i.thumbCropped=!0)}return this.applyFilters("domItemData",i,t,s),i}}{constructor(t){super(),this.options=t||{},this._=0}init(){this.onThumbnailsClick=this.onThumbnailsClick.bind(this),r(this.options.gallery,this.options.gallerySelector).forEach((t=>{t.addEventListener("click",this.onThumbnailsClick,!1)}))}onThumbnailsClick(t){if(function(t){if(2===t.which||t.ctrlKey||t.metaKey||t.altKey||t.shiftKey)return!0}(t)||window.pswp||!1===window.navigator.onLine)return;let i={x:t.clientX,y:t.clientY};i.x||i.y||(i=null);const s=this.getClickedIndex(t),h={gallery:t.currentTarget};s>=0&&(t.preventDefault(),this.loadAndOpen(s,h,i))}getClickedIndex(t){if(this.options.getClickedIndexFn)return this.options.getClickedIndexFn.call(this,t);const i=t.target,s=r(this.options.children,this.options.childSelector,t.currentTarget).findIndex((t=>t===i||t.contains(i)));return-1!==s?s:this.options.children||this.options.childSelector?-1:0}loadAndOpen(t,i,s){return!window.pswp&&(this.options.index=t,this.options.initialPointerPos=s,this.shouldOpen=!0,this.preload(t,i),!0)}preload(t,i){const{options:s}=this;i&&(s.dataSource=i);const h=[(e=s.pswpModule,"string"==typeof e?import(e):e)];var e;"function"==typeof s.openPromise&&h.push(s.openPromise()),!1!==s.preloadFirstSlide&&t>=0&&(this.v=function(t,i){const s=i.getItemData(t);if(!i.dispatch("lazyLoadSlide",{index:t,itemData:s}).defaultPrevented)return d(s,i,t)}(t,this));const n=++this._;Promise.all(h).then((t=>{if(this.shouldOpen){const i=t[0];this.D(i,n)}}))}D(t,i){if(i!==this._&&this.shouldOpen)return;if(this.shouldOpen=!1,window.pswp)return;const s="object"==typeof t?new t.default(null,this.options):new t(null,this.options);this.pswp=s,window.pswp=s,Object.keys(this.u).forEach((t=>{this.u[t].forEach((i=>{s.on(t,i)}))})),Object.keys(this.m).forEach((t=>{this.m[t].forEach((i=>{s.addFilter(t,i.fn,i.priority)}))})),s.contentTypes={...this.contentTypes},this.v&&(s.contentLoader.addToCache(this.v),this.v=null),s.on("destroy",(()=>{this.pswp=null,window.pswp=null})),s.init()}destroy(){this.pswp&&this.pswp.close(),this.shouldOpen=!1,this.u=null,r(this.options.gallery,this.options.gallerySelector).forEach((t=>{t.removeEventListener("click",this.onThumbnailsClick,!1)}))}}export{a as Content,l as ImageContent,m as default};